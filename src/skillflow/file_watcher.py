@@ -6,12 +6,97 @@ automatic cache invalidation and reload.
 
 import asyncio
 import logging
+import os
+import re
 from pathlib import Path
 from typing import Callable, Optional
 import time
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Skill version files are named v0001.json, v0002.json, ...
+_VERSION_FILE_RE = re.compile(r"^v\d")
+
+
+def _is_skill_file(name: str) -> bool:
+    """Check whether a file name is a skill meta or version file."""
+    return name == "meta.json" or _VERSION_FILE_RE.match(name) is not None
+
+
+class _CoalescingCallback:
+    """Runs a per-skill callback with at most one invocation in flight.
+
+    A change reported while the callback for the same skill is still running
+    is not run concurrently; instead one more pass is queued to run after the
+    current one. Intermediate changes can be skipped because the callback
+    re-reads the skill from disk.
+    """
+
+    def __init__(self, callback: Callable[[str], None], name: str):
+        """Initialize coalescing callback.
+
+        Args:
+            callback: Synchronous callback taking a skill ID
+            name: Callback name for log messages
+        """
+        self.callback = callback
+        self.name = name
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._coalesce: set[str] = set()
+
+    def dispatch(self, skill_id: str):
+        """Schedule the callback for a skill, or coalesce into the running one.
+
+        Returns immediately; the callback runs in a background task so a
+        burst of changes doesn't wait on each reload in turn.
+
+        Args:
+            skill_id: Skill that changed
+        """
+        task = self._inflight.get(skill_id)
+        if task is not None and not task.done():
+            self._coalesce.add(skill_id)
+            return
+
+        self._inflight[skill_id] = asyncio.create_task(self._run(skill_id))
+
+    async def _run(self, skill_id: str):
+        """Invoke the callback until no further change was coalesced."""
+        try:
+            while True:
+                self._coalesce.discard(skill_id)
+                try:
+                    await asyncio.to_thread(self.callback, skill_id)
+                except Exception as e:
+                    logger.error(f"Error in {self.name} callback for {skill_id}: {e}")
+
+                if skill_id not in self._coalesce:
+                    break
+        finally:
+            self._inflight.pop(skill_id, None)
+
+    async def drain(self):
+        """Wait for all in-flight callback runs to finish."""
+        while self._inflight:
+            await asyncio.gather(*self._inflight.values(), return_exceptions=True)
+
+    async def cancel(self):
+        """Cancel all in-flight callback runs."""
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._inflight.clear()
+        self._coalesce.clear()
+
 
 class FileWatcher:
     """Watches skill directory for changes and triggers callbacks.
@@ -43,8 +128,16 @@ class FileWatcher:
         self.on_skill_deleted = on_skill_deleted
         self.poll_interval = poll_interval
 
+        # Coalesce overlapping reloads of the same skill
+        self._changed_dispatcher = (
+            _CoalescingCallback(on_skill_changed, "on_skill_changed")
+            if on_skill_changed else None
+        )
+
         # Track file states
-        self._file_mtimes: dict[Path, float] = {}
+        # Keyed by path string with integer st_mtime_ns values: cheaper to
+        # store and hash than Path keys, and immune to float rounding
+        self._file_mtimes: dict[str, int] = {}
         self._skill_dirs: set[str] = set()
 
         # Control
@@ -53,34 +146,39 @@ class FileWatcher:
 
         logger.info(f"Initialized file watcher for {watch_dir} (poll interval: {poll_interval}s)")
 
-    def _scan_directory(self) -> dict[str, dict[str, float]]:
+    def _scan_directory(self) -> dict[str, dict[str, int]]:
         """Scan skills directory and return skill states.
 
         Returns:
-            Dict mapping skill_id to dict of {filename: mtime}
+            Dict mapping skill_id to dict of {file path: mtime_ns}
         """
         skills = {}
 
-        if not self.watch_dir.exists():
+        try:
+            skill_entries = list(os.scandir(self.watch_dir))
+        except OSError:
             return skills
 
-        for skill_dir in self.watch_dir.iterdir():
-            if not skill_dir.is_dir():
+        for skill_entry in skill_entries:
+            if not skill_entry.is_dir():
                 continue
 
-            skill_id = skill_dir.name
             files = {}
 
             # Track meta.json and all version files
-            for file_path in skill_dir.iterdir():
-                if file_path.is_file() and (file_path.name == "meta.json" or file_path.name.startswith("v")):
-                    try:
-                        files[file_path.name] = file_path.stat().st_mtime
-                    except OSError:
-                        pass
+            try:
+                with os.scandir(skill_entry.path) as entries:
+                    for entry in entries:
+                        if entry.is_file() and _is_skill_file(entry.name):
+                            try:
+                                files[entry.path] = entry.stat().st_mtime_ns
+                            except OSError:
+                                pass
+            except OSError:
+                continue
 
             if files:  # Only include if has files
-                skills[skill_id] = files
+                skills[skill_entry.name] = files
 
         return skills
 
@@ -114,11 +212,9 @@ class FileWatcher:
             current_files = current_state[skill_id]
 
             # Get previous state from _file_mtimes
-            skill_dir = self.watch_dir / skill_id
             changed = False
 
-            for filename, mtime in current_files.items():
-                file_path = skill_dir / filename
+            for file_path, mtime in current_files.items():
                 prev_mtime = self._file_mtimes.get(file_path)
 
                 if prev_mtime is None or mtime != prev_mtime:
@@ -127,20 +223,14 @@ class FileWatcher:
 
             if changed:
                 logger.info(f"Detected modified skill: {skill_id}")
-                if self.on_skill_changed:
-                    try:
-                        await asyncio.to_thread(self.on_skill_changed, skill_id)
-                    except Exception as e:
-                        logger.error(f"Error in on_skill_changed callback for {skill_id}: {e}")
+                if self._changed_dispatcher:
+                    self._changed_dispatcher.dispatch(skill_id)
 
         # Update state
         self._skill_dirs = current_skill_ids
         self._file_mtimes.clear()
-        for skill_id, files in current_state.items():
-            skill_dir = self.watch_dir / skill_id
-            for filename, mtime in files.items():
-                file_path = skill_dir / filename
-                self._file_mtimes[file_path] = mtime
+        for files in current_state.values():
+            self._file_mtimes.update(files)
 
     async def _watch_loop(self):
         """Main watching loop."""
@@ -150,11 +240,8 @@ class FileWatcher:
         self._scan_directory()
         current_state = self._scan_directory()
         self._skill_dirs = set(current_state.keys())
-        for skill_id, files in current_state.items():
-            skill_dir = self.watch_dir / skill_id
-            for filename, mtime in files.items():
-                file_path = skill_dir / filename
-                self._file_mtimes[file_path] = mtime
+        for files in current_state.values():
+            self._file_mtimes.update(files)
 
         while self._running:
             try:
@@ -191,6 +278,9 @@ class FileWatcher:
                 pass
             self._task = None
 
+        if self._changed_dispatcher:
+            await self._changed_dispatcher.cancel()
+
         logger.info("File watcher stopped")
 
     async def trigger_manual_scan(self):
@@ -203,6 +293,71 @@ class FileWatcher:
             logger.info("Manual scan triggered")
 
 
+class _SkillEventHandler(FileSystemEventHandler):
+    """Handle file system events for skills."""
+
+    def __init__(self, watcher: "WatchdogFileWatcher"):
+        """Initialize event handler.
+
+        Args:
+            watcher: Watcher that owns the debounce state and callbacks
+        """
+        super().__init__()
+        self._watcher = watcher
+
+    def _extract_skill_id(self, path: str) -> Optional[str]:
+        """Extract skill ID from file path."""
+        # Check if path is inside skills directory
+        prefix = self._watcher._watch_prefix
+        if not path.startswith(prefix):
+            return None
+
+        # First component should be skill_id
+        tail = path[len(prefix):]
+        sep = tail.find(os.sep)
+        return (tail[:sep] if sep > 0 else tail) or None
+
+    def _schedule_callback(self, skill_id: str, event_type: str):
+        """Schedule callback with debouncing."""
+        watcher = self._watcher
+        if not skill_id or watcher._loop is None:
+            return
+
+        # Watchdog delivers events on its observer thread, so hop onto
+        # the event loop before touching the timer or pending events
+        watcher._loop.call_soon_threadsafe(
+            watcher._enqueue_event, f"{skill_id}:{event_type}", time.time()
+        )
+
+    def on_created(self, event):
+        """Handle file/directory creation."""
+        if event.is_directory:
+            # New skill directory
+            skill_id = Path(event.src_path).name
+            if skill_id:
+                self._schedule_callback(skill_id, "created")
+        else:
+            # File created (might be new version or meta.json)
+            skill_id = self._extract_skill_id(event.src_path)
+            if skill_id and _is_skill_file(os.path.basename(event.src_path)):
+                self._schedule_callback(skill_id, "changed")
+
+    def on_modified(self, event):
+        """Handle file modification."""
+        if not event.is_directory:
+            skill_id = self._extract_skill_id(event.src_path)
+            if skill_id and _is_skill_file(os.path.basename(event.src_path)):
+                self._schedule_callback(skill_id, "changed")
+
+    def on_deleted(self, event):
+        """Handle file/directory deletion."""
+        if event.is_directory:
+            # Skill directory deleted
+            skill_id = Path(event.src_path).name
+            if skill_id:
+                self._schedule_callback(skill_id, "deleted")
+
+
 class WatchdogFileWatcher:
     """Alternative implementation using watchdog library for better performance.
 
@@ -225,10 +380,7 @@ class WatchdogFileWatcher:
             on_skill_created: Callback when skill is created
             on_skill_deleted: Callback when skill is deleted
         """
-        try:
-            from watchdog.observers import Observer
-            from watchdog.events import FileSystemEventHandler, FileSystemEvent
-        except ImportError:
+        if not WATCHDOG_AVAILABLE:
             raise ImportError(
                 "watchdog library not installed. "
                 "Install it with: pip install watchdog"
@@ -239,10 +391,22 @@ class WatchdogFileWatcher:
         self.on_skill_created = on_skill_created
         self.on_skill_deleted = on_skill_deleted
 
+        # Coalesce overlapping reloads of the same skill
+        self._changed_dispatcher = (
+            _CoalescingCallback(on_skill_changed, "on_skill_changed")
+            if on_skill_changed else None
+        )
+
+        # Event paths are reported under the scheduled directory string, so
+        # skill IDs can be sliced out without building Path objects
+        self._watch_prefix = os.path.join(str(self.watch_dir), "")
+
         # Debounce rapid events (e.g., editor save might trigger multiple events)
         self._debounce_delay = 0.5  # 500ms
         self._pending_events: dict[str, float] = {}
         self._event_task: Optional[asyncio.Task] = None
+        self._debounce_handle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Watchdog components
         self._observer = Observer()
@@ -252,81 +416,40 @@ class WatchdogFileWatcher:
 
     def _create_handler(self):
         """Create watchdog event handler."""
-        from watchdog.events import FileSystemEventHandler
+        return _SkillEventHandler(self)
 
-        watcher = self
+    def _enqueue_event(self, event_key: str, event_time: float):
+        """Record an event and restart the debounce timer.
 
-        class SkillEventHandler(FileSystemEventHandler):
-            """Handle file system events for skills."""
+        Every new event pushes processing back by a full debounce delay, so a
+        burst of events is handled in exactly one pass once it settles.
+        """
+        self._pending_events[event_key] = event_time
+
+        if self._debounce_handle:
+            self._debounce_handle.cancel()
+        self._debounce_handle = self._loop.call_later(
+            self._debounce_delay, self._start_processing
+        )
+
+    def _start_processing(self):
+        """Run pending events once the debounce timer fires."""
+        if self._event_task and not self._event_task.done():
+            # The previous pass is still running; check again after another
+            # delay rather than processing the same skills concurrently
+            self._debounce_handle = self._loop.call_later(
+                self._debounce_delay, self._start_processing
+            )
+            return
 
-            def _extract_skill_id(self, path: str) -> Optional[str]:
-                """Extract skill ID from file path."""
-                path_obj = Path(path)
-                try:
-                    # Check if path is inside skills directory
-                    rel_path = path_obj.relative_to(watcher.watch_dir)
-                    # First component should be skill_id
-                    parts = rel_path.parts
-                    if len(parts) >= 1:
-                        return parts[0]
-                except ValueError:
-                    return None
-                return None
-
-            def _schedule_callback(self, skill_id: str, event_type: str):
-                """Schedule callback with debouncing."""
-                if not skill_id:
-                    return
-
-                current_time = time.time()
-                watcher._pending_events[f"{skill_id}:{event_type}"] = current_time
-
-                # Start processing task if not running
-                if watcher._event_task is None or watcher._event_task.done():
-                    watcher._event_task = asyncio.create_task(watcher._process_pending_events())
-
-            def on_created(self, event):
-                """Handle file/directory creation."""
-                if event.is_directory:
-                    # New skill directory
-                    skill_id = Path(event.src_path).name
-                    if skill_id:
-                        self._schedule_callback(skill_id, "created")
-                else:
-                    # File created (might be new version or meta.json)
-                    skill_id = self._extract_skill_id(event.src_path)
-                    if skill_id and (event.src_path.endswith("meta.json") or "/v" in event.src_path):
-                        self._schedule_callback(skill_id, "changed")
-
-            def on_modified(self, event):
-                """Handle file modification."""
-                if not event.is_directory:
-                    skill_id = self._extract_skill_id(event.src_path)
-                    if skill_id and (event.src_path.endswith("meta.json") or "/v" in event.src_path):
-                        self._schedule_callback(skill_id, "changed")
-
-            def on_deleted(self, event):
-                """Handle file/directory deletion."""
-                if event.is_directory:
-                    # Skill directory deleted
-                    skill_id = Path(event.src_path).name
-                    if skill_id:
-                        self._schedule_callback(skill_id, "deleted")
-
-        return SkillEventHandler()
+        self._debounce_handle = None
+        self._event_task = asyncio.create_task(self._process_pending_events())
 
     async def _process_pending_events(self):
         """Process pending events after debounce delay."""
-        await asyncio.sleep(self._debounce_delay)
-
-        current_time = time.time()
-        events_to_process = []
-
-        # Find events that have aged beyond debounce delay
-        for event_key, event_time in list(self._pending_events.items()):
-            if current_time - event_time >= self._debounce_delay:
-                events_to_process.append(event_key)
-                del self._pending_events[event_key]
+        # The timer only fires once the burst has been quiet for a full
+        # debounce delay, so every pending event is due: drain them in one swap
+        events_to_process, self._pending_events = list(self._pending_events), {}
 
         # Process events
         for event_key in events_to_process:
@@ -336,9 +459,9 @@ class WatchdogFileWatcher:
                 if event_type == "created" and self.on_skill_created:
                     await asyncio.to_thread(self.on_skill_created, skill_id)
                     logger.info(f"Processed skill created event: {skill_id}")
-                elif event_type == "changed" and self.on_skill_changed:
-                    await asyncio.to_thread(self.on_skill_changed, skill_id)
-                    logger.info(f"Processed skill changed event: {skill_id}")
+                elif event_type == "changed" and self._changed_dispatcher:
+                    self._changed_dispatcher.dispatch(skill_id)
+                    logger.info(f"Scheduled reload for changed skill: {skill_id}")
                 elif event_type == "deleted" and self.on_skill_deleted:
                     await asyncio.to_thread(self.on_skill_deleted, skill_id)
                     logger.info(f"Processed skill deleted event: {skill_id}")
@@ -347,6 +470,7 @@ class WatchdogFileWatcher:
 
     async def start(self):
         """Start watching for file changes."""
+        self._loop = asyncio.get_running_loop()
         self._observer.schedule(self._handler, str(self.watch_dir), recursive=True)
         self._observer.start()
         logger.info("Watchdog file watcher started")
@@ -356,6 +480,10 @@ class WatchdogFileWatcher:
         self._observer.stop()
         self._observer.join()
 
+        if self._debounce_handle:
+            self._debounce_handle.cancel()
+            self._debounce_handle = None
+
         if self._event_task:
             self._event_task.cancel()
             try:
@@ -363,4 +491,7 @@ class WatchdogFileWatcher:
             except asyncio.CancelledError:
                 pass
 
+        if self._changed_dispatcher:
+            await self._changed_dispatcher.cancel()
+
         logger.info("Watchdog file watcher stopped")
@@ -3,6 +3,8 @@
 import asyncio
 import json
 import logging
+import random
+import socket
 from typing import Any, Optional
 
 try:
@@ -13,6 +15,32 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# MCP control messages are small, so send them immediately rather than
+# letting Nagle's algorithm hold them back, and keep idle connections
+# (e.g. the long-lived SSE stream) alive through NATs and proxies
+_SOCKET_OPTIONS: list[tuple[int, int, int]] = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, "TCP_KEEPIDLE"):  # Not available on all platforms
+    _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+
+
+def _socket_factory(addr_info: tuple) -> socket.socket:
+    """Create a TCP socket with the transport's socket options applied.
+
+    Args:
+        addr_info: Address info tuple (family, type, proto, canonname, sockaddr)
+
+    Returns:
+        Configured, unconnected socket
+    """
+    family, type_, proto, _, _ = addr_info
+    sock = socket.socket(family=family, type=type_, proto=proto)
+    for level, option, value in _SOCKET_OPTIONS:
+        sock.setsockopt(level, option, value)
+    return sock
+
 
 class HTTPSSEClientError(Exception):
     """Error in HTTP+SSE client operations."""
@@ -49,6 +77,11 @@ class HTTPSSEClient:
         self.event_handlers: dict[str, Any] = {}
         self._message_id_counter = 0
         self._pending_requests: dict[int, asyncio.Future] = {}
+        self._closed = False
+
+        # SSE reconnection backoff (seconds)
+        self._reconnect_initial = 1.0
+        self._reconnect_max = 30.0
 
     async def connect(self) -> dict[str, Any]:
         """Connect to the MCP server and initialize.
@@ -62,6 +95,8 @@ class HTTPSSEClient:
         if self.session is not None:
             raise HTTPSSEClientError("Client already connected")
 
+        self._closed = False
+
         # Create aiohttp session
         headers = {}
         if self.api_key:
@@ -70,6 +105,7 @@ class HTTPSSEClient:
         self.session = aiohttp.ClientSession(
             headers=headers,
             timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(socket_factory=_socket_factory),
         )
 
         try:
@@ -126,32 +162,65 @@ class HTTPSSEClient:
             raise HTTPSSEClientError(f"Invalid JSON response: {str(e)}") from e
 
     async def _sse_connection(self):
-        """Maintain SSE connection for server-initiated messages."""
-        if self.session is None:
-            return
+        """Maintain SSE connection for server-initiated messages.
 
+        Reconnects with jittered exponential backoff until the client is
+        closed, so transient network failures don't silently drop server push.
+        """
         url = f"{self.base_url}/mcp/v1/sse"
+        # The stream is long-lived: only bound the connect phase, not the
+        # total request time configured on the session
+        stream_timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.timeout)
+        backoff = self._reconnect_initial
 
-        try:
-            async with self.session.get(url) as response:
-                response.raise_for_status()
+        while not self._closed and self.session is not None:
+            try:
+                async with self.session.get(url, timeout=stream_timeout) as response:
+                    response.raise_for_status()
+                    backoff = self._reconnect_initial
 
-                async for line in response.content:
-                    line = line.decode("utf-8").strip()
+                    async for line in response.content:
+                        line = line.decode("utf-8").strip()
 
-                    # Parse SSE events
-                    if line.startswith("data: "):
-                        data_str = line[6:]  # Remove "data: " prefix
-                        try:
-                            data = json.loads(data_str)
-                            await self._handle_sse_event(data)
-                        except json.JSONDecodeError:
-                            logger.warning(f"Invalid SSE data: {data_str}")
+                        # Parse SSE events
+                        if line.startswith("data: "):
+                            data_str = line[6:]  # Remove "data: " prefix
+                            try:
+                                data = json.loads(data_str)
+                                await self._handle_sse_event(data)
+                            except json.JSONDecodeError:
+                                logger.warning(f"Invalid SSE data: {data_str}")
 
-        except asyncio.CancelledError:
-            logger.debug("SSE connection cancelled")
-        except Exception as e:
-            logger.error(f"SSE connection error: {str(e)}")
+                logger.warning("SSE stream closed by server")
+
+            except asyncio.CancelledError:
+                logger.debug("SSE connection cancelled")
+                return
+            except Exception as e:
+                logger.error(f"SSE connection error: {str(e)}")
+
+            # Responses for in-flight requests arrive over this stream, so
+            # fail them now rather than letting them hang until timeout
+            self._fail_pending_requests(HTTPSSEClientError("SSE connection lost"))
+
+            if self._closed:
+                return
+
+            delay = backoff + random.uniform(0, backoff * 0.2)
+            logger.info(f"Reconnecting SSE stream in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            backoff = min(backoff * 2, self._reconnect_max)
+
+    def _fail_pending_requests(self, error: Exception):
+        """Reject all requests still waiting for a response.
+
+        Args:
+            error: Exception to set on each pending future
+        """
+        pending, self._pending_requests = self._pending_requests, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
 
     async def _handle_sse_event(self, event: dict[str, Any]):
         """Handle incoming SSE event.
@@ -294,6 +363,8 @@ class HTTPSSEClient:
 
     async def close(self):
         """Close the client connection."""
+        self._closed = True
+
         if self.sse_task:
             self.sse_task.cancel()
             try:
@@ -302,6 +373,8 @@ class HTTPSSEClient:
                 pass
             self.sse_task = None
 
+        self._fail_pending_requests(HTTPSSEClientError("Client closed"))
+
         if self.session:
             await self.session.close()
             self.session = None
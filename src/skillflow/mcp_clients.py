@@ -3,16 +3,144 @@
 Now using native MCP client implementation for better control and reliability.
 """
 
+import array
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Any, Optional
-
-from .native_mcp_client import NativeMCPClient, MCPClientError
+import os
+import time
+from contextlib import AsyncExitStack, contextmanager
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Optional
+
+from .native_mcp_client import (
+    NativeMCPClient,
+    MCPBackpressureError,
+    MCPClientError,
+    MCPProtocolError,
+    MCPTimeoutError,
+    Status,
+)
 from .schemas import ServerConfig, ServerRegistry, TransportType
 from .storage import StorageLayer
 
 logger = logging.getLogger(__name__)
 
 
+def _max_concurrent_spawns() -> int:
+    """Read the stdio spawn limit from SKILLFLOW_MAX_CONCURRENT_SPAWNS.
+
+    Returns:
+        Maximum number of stdio servers started at once
+    """
+    default = min(8, os.cpu_count() or 8)
+    value = os.environ.get("SKILLFLOW_MAX_CONCURRENT_SPAWNS")
+    if not value:
+        return default
+
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        logger.warning(f"Invalid SKILLFLOW_MAX_CONCURRENT_SPAWNS={value!r}, using {default}")
+        return default
+    return limit
+
+
+class ConnectionPool:
+    """Upstream clients stored as parallel per-slot arrays.
+
+    Each server gets a slot index; the client and its pool status live at
+    that index in separate arrays, so the hot-path readiness check is a
+    dict lookup plus an int read. Freed slots are reused.
+    """
+
+    DOWN = 0
+    CONNECTED = 1
+
+    def __init__(self):
+        """Initialize an empty pool."""
+        self._slot: dict[str, int] = {}
+        self._ids: list[Optional[str]] = []
+        self._clients: list[Optional[NativeMCPClient]] = []
+        self._status = array.array("b")
+        self._free: list[int] = []
+
+    def add(self, server_id: str, client: NativeMCPClient) -> None:
+        """Store a connected client, replacing any existing one.
+
+        Args:
+            server_id: ID of the server
+            client: Connected client
+        """
+        slot = self._slot.get(server_id)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = len(self._clients)
+                self._ids.append(None)
+                self._clients.append(None)
+                self._status.append(self.DOWN)
+            self._slot[server_id] = slot
+
+        self._ids[slot] = server_id
+        self._clients[slot] = client
+        self._status[slot] = self.CONNECTED
+
+    def get(self, server_id: str) -> Optional[NativeMCPClient]:
+        """Return the client for a server, whatever its status."""
+        slot = self._slot.get(server_id)
+        return None if slot is None else self._clients[slot]
+
+    def ready(self, server_id: str) -> Optional[NativeMCPClient]:
+        """Return the client for a server unless it has been marked down."""
+        slot = self._slot.get(server_id)
+        if slot is not None and self._status[slot] == self.CONNECTED:
+            return self._clients[slot]
+        return None
+
+    def mark_down(self, server_id: str) -> None:
+        """Stop handing out a server's client until it is replaced."""
+        slot = self._slot.get(server_id)
+        if slot is not None:
+            self._status[slot] = self.DOWN
+
+    def remove(self, server_id: str) -> Optional[NativeMCPClient]:
+        """Remove a server's client and free its slot.
+
+        Returns:
+            The removed client, or None if the server had none
+        """
+        slot = self._slot.pop(server_id, None)
+        if slot is None:
+            return None
+
+        client = self._clients[slot]
+        self._ids[slot] = None
+        self._clients[slot] = None
+        self._status[slot] = self.DOWN
+        self._free.append(slot)
+        return client
+
+    def connected_count(self) -> int:
+        """Number of clients currently marked connected."""
+        return sum(self._status)
+
+    def __contains__(self, server_id: object) -> bool:
+        return server_id in self._slot
+
+    def __getitem__(self, server_id: str) -> NativeMCPClient:
+        return self._clients[self._slot[server_id]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._slot))
+
+    def __len__(self) -> int:
+        return len(self._slot)
+
+
 class MCPClientManager:
     """Manages connections to upstream MCP servers using native implementation."""
 
@@ -23,22 +151,152 @@ class MCPClientManager:
             storage: Storage layer for server registry
         """
         self.storage = storage
-        self._clients: dict[str, NativeMCPClient] = {}
+        self._clients = ConnectionPool()
+
+        # Bounds how many stdio subprocesses spawn and handshake at once, so
+        # warming up many servers doesn't exhaust processes and FDs
+        self._spawn_sem = asyncio.Semaphore(_max_concurrent_spawns())
+        # Teardown for each connection, unwound on disconnect
+        self._exit_stacks: dict[str, AsyncExitStack] = {}
         self._registry: Optional[ServerRegistry] = None
+        # Shared load for callers that arrive before initialize(), so the
+        # registry is read from storage at most once
+        self._registry_future: Optional[asyncio.Future] = None
+
+        # Serializes connection setup per server so concurrent callers don't
+        # each spawn (and leak) their own subprocess for the same server
+        self._connect_locks: dict[str, asyncio.Lock] = {}
+
+        # Background connection tasks started by warmup()
+        self._warmup_tasks: dict[str, asyncio.Task] = {}
+
+        # Cached tool/prompt/resource lists keyed by (server_id, kind)
+        self._list_cache: dict[tuple[str, str], tuple[float, list[dict]]] = {}
+        self._list_ttl = 60.0
+
+        # Tool lists persisted via storage, so a cold start can answer
+        # list_tools before the upstream handshake completes
+        self._tool_digests: dict[str, str] = {}
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+
+        # Consecutive failed connection attempts per server, used to back
+        # off before respawning a server that keeps dying
+        self._reconnect_attempts: dict[str, int] = {}
+        self._health_window = 5.0
+        self._ping_timeout = 0.5
+
+        # Debounced registry writer: mutations within the window share one save
+        self._save_pending: Optional[asyncio.Task] = None
+        self._save_lock = asyncio.Lock()
+        self._save_delay = 0.05
+
+        # Requests in flight per server; disconnect waits for the server to
+        # go idle so it doesn't kill the subprocess mid-call
+        self._inflight: dict[str, int] = {}
+        self._idle: dict[str, asyncio.Event] = {}
+        self._drain_timeout = 10.0
 
     async def initialize(self):
         """Initialize client manager and load registry."""
+        await self.flush_registry()
         self._registry = await self.storage.load_registry()
+        self._registry_future = None
         logger.info(f"Loaded registry with {len(self._registry.servers)} servers")
 
-        # Note: We don't auto-connect to servers during initialization to avoid
-        # timeout issues. Servers will be connected lazily when first used.
+        # Connect in the background so the first tool call usually finds a
+        # ready client, without blocking startup on slow handshakes
+        self.warmup()
+
+    def warmup(self) -> None:
+        """Start background connections to all enabled servers.
+
+        Does not wait for the handshakes. Servers that are not connected yet
+        are still connected lazily by the first call that needs them.
+        """
+        for server_id, config in self._registry.servers.items():
+            if not config.enabled:
+                continue
 
-    async def connect_server(self, server_id: str) -> NativeMCPClient:
+            task = self._warmup_tasks.get(server_id)
+            if task is None or task.done():
+                self._warmup_tasks[server_id] = asyncio.create_task(
+                    self._safe_connect(server_id)
+                )
+
+    async def connect_all(self) -> dict[str, bool]:
+        """Connect to all enabled servers concurrently.
+
+        Handshakes are independent, so they run in parallel and the total
+        time is roughly that of the slowest server rather than the sum.
+
+        Returns:
+            Mapping of server_id to whether the connection succeeded
+        """
+        server_ids = [
+            config.server_id for config in await self.iter_servers(enabled_only=True)
+        ]
+        results = await asyncio.gather(
+            *(self._safe_connect(server_id) for server_id in server_ids)
+        )
+        return dict(zip(server_ids, results))
+
+    async def _get_registry(self) -> ServerRegistry:
+        """Return the server registry, loading it on first use.
+
+        Returns:
+            Server registry
+        """
+        if self._registry is not None:
+            return self._registry
+
+        future = self._registry_future
+        if future is None:
+            future = self._registry_future = asyncio.ensure_future(
+                self.storage.load_registry()
+            )
+
+        try:
+            registry = await asyncio.shield(future)
+        except Exception:
+            # Let the next caller retry a failed load
+            if self._registry_future is future:
+                self._registry_future = None
+            raise
+
+        if self._registry is None:
+            self._registry = registry
+        return self._registry
+
+    async def _safe_connect(self, server_id: str) -> bool:
+        """Connect to a server, logging instead of raising on failure.
+
+        Args:
+            server_id: ID of the server to connect
+
+        Returns:
+            True if the server is connected
+        """
+        try:
+            await self.connect_server(server_id)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to connect to {server_id}: {e}")
+            return False
+
+    async def connect_server(
+        self,
+        server_id: str,
+        on_event: Optional[Callable[[dict], Awaitable[None]]] = None,
+    ) -> NativeMCPClient:
         """Connect to an upstream MCP server.
 
         Args:
             server_id: ID of the server to connect
+            on_event: Optional callback receiving status events while a new
+                connection is set up, so callers can show progress during
+                the handshake. Events look like ``{"type": "status",
+                "server": ..., "stage": "connecting"|"connected"|"failed",
+                "done": bool}``.
 
         Returns:
             Native MCP client
@@ -47,33 +305,143 @@ class MCPClientManager:
             ValueError: If server not found in registry
             MCPClientError: If connection fails
         """
-        if not self._registry:
-            self._registry = await self.storage.load_registry()
+        registry = await self._get_registry()
 
-        config = self._registry.servers.get(server_id)
+        config = registry.servers.get(server_id)
         if not config:
             raise ValueError(f"Server {server_id} not found in registry")
 
-        # Check if already connected
-        if server_id in self._clients:
-            client = self._clients[server_id]
-            if client.status == "connected":
+        # setdefault is atomic on the event loop, so every caller for this
+        # server ends up waiting on the same lock
+        lock = self._connect_locks.setdefault(server_id, asyncio.Lock())
+
+        async with lock:
+            # Check if already connected (possibly by a caller we waited on)
+            if server_id in self._clients:
+                client = self._clients[server_id]
+                # A client marked down failed its health check; replace it
+                # even if its process is still running
+                if (
+                    client.status is Status.CONNECTED
+                    and client.is_alive
+                    and self._clients.ready(server_id) is client
+                ):
+                    return client
+                else:
+                    # Client exists but is unusable, clean up and reconnect
+                    logger.warning(f"Client {server_id} exists but is not usable (status: {client.status_name}), reconnecting...")
+                    await self.disconnect_server(server_id)
+
+            attempt = self._reconnect_attempts.get(server_id, 0)
+            if attempt:
+                delay = min(2 ** attempt, 8)
+                logger.info(f"Reconnecting to {server_id} in {delay}s (attempt {attempt + 1})")
+                await asyncio.sleep(delay)
+
+            await self._emit(on_event, server_id, "connecting")
+
+            # Create client based on transport type
+            try:
+                if config.transport == TransportType.STDIO:
+                    client = await self._connect_stdio(config)
+                elif config.transport == TransportType.HTTP_SSE:
+                    client = await self._connect_http_sse(config)
+                else:
+                    raise ValueError(f"Unsupported transport: {config.transport}")
+            except Exception as e:
+                self._reconnect_attempts[server_id] = attempt + 1
+                await self._emit(on_event, server_id, "failed", error=str(e))
+                raise
+
+            self._reconnect_attempts.pop(server_id, None)
+            self._clients.add(server_id, client)
+            await self._emit(on_event, server_id, "connected")
+            return client
+
+    async def _emit(
+        self,
+        on_event: Optional[Callable[[dict], Awaitable[None]]],
+        server_id: str,
+        stage: str,
+        **extra: Any,
+    ) -> None:
+        """Send a connection status event, ignoring callback errors.
+
+        Args:
+            on_event: Callback from connect_server, or None
+            server_id: ID of the server being connected
+            stage: "connecting", "connected" or "failed"
+            **extra: Additional event fields
+        """
+        if on_event is None:
+            return
+
+        event = {
+            "type": "status",
+            "server": server_id,
+            "stage": stage,
+            "done": stage != "connecting",
+            **extra,
+        }
+        try:
+            await on_event(event)
+        except Exception as e:
+            logger.warning(f"Connection event callback failed for {server_id}: {e}")
+
+    async def _is_healthy(self, client: NativeMCPClient) -> bool:
+        """Check whether a connected client can still serve requests.
+
+        A client that answered recently is trusted without a round trip;
+        an idle one is pinged. A slow ping, one refused because the client
+        is saturated, or an error reply (e.g. a server that doesn't
+        implement ping) counts as healthy: any reply proves the server is
+        alive, and a busy server is no reason to respawn it.
+
+        Args:
+            client: Client to check
+
+        Returns:
+            True if the client should be reused
+        """
+        if client.status is not Status.CONNECTED or not client.is_alive:
+            return False
+
+        if time.monotonic() - client.last_response_at < self._health_window:
+            return True
+
+        try:
+            await client.ping(timeout=self._ping_timeout)
+        except (MCPTimeoutError, MCPBackpressureError, MCPProtocolError):
+            return True
+        except MCPClientError as e:
+            logger.warning(f"Health check failed for {client.server_id}: {e}")
+            return False
+        return True
+
+    async def _ready_client(self, server_id: str) -> NativeMCPClient:
+        """Return a connected client for a server, connecting if needed.
+
+        Args:
+            server_id: ID of the server
+
+        Returns:
+            Connected native MCP client
+        """
+        client = self._clients.ready(server_id)
+        if client is not None:
+            if await self._is_healthy(client):
+                return client
+            self._clients.mark_down(server_id)
+
+        # Join an in-progress warmup rather than queueing behind its lock
+        task = self._warmup_tasks.get(server_id)
+        if task is not None and not task.done():
+            await asyncio.shield(task)
+            client = self._clients.ready(server_id)
+            if client is not None:
                 return client
-            else:
-                # Client exists but not connected, clean up and reconnect
-                logger.warning(f"Client {server_id} exists but not connected (status: {client.status}), reconnecting...")
-                await self.disconnect_server(server_id)
-
-        # Create client based on transport type
-        if config.transport == TransportType.STDIO:
-            client = await self._connect_stdio(config)
-        elif config.transport == TransportType.HTTP_SSE:
-            client = await self._connect_http_sse(config)
-        else:
-            raise ValueError(f"Unsupported transport: {config.transport}")
-
-        self._clients[server_id] = client
-        return client
+
+        return await self.connect_server(server_id)
 
     async def _connect_stdio(self, config: ServerConfig) -> NativeMCPClient:
         """Connect to a stdio-based MCP server.
@@ -102,8 +470,12 @@ class MCPClientManager:
             client_version="0.1.0",
         )
 
-        # Start and initialize
-        await client.start()
+        # Register the teardown before starting, so a handshake that fails
+        # or is cancelled (e.g. by close_all) still stops the subprocess
+        async with self._spawn_sem, AsyncExitStack() as stack:
+            stack.push_async_callback(client.stop)
+            await client.start()
+            self._exit_stacks[config.server_id] = stack.pop_all()
 
         return client
 
@@ -116,21 +488,55 @@ class MCPClientManager:
         Returns:
             Native MCP client
         """
-        # This would use httpx-based client
+        # This would wrap HTTPSSEClient; its session must keep the
+        # TCP_NODELAY/SO_KEEPALIVE socket options from http_sse_client
         # For now, raise not implemented
         raise NotImplementedError("HTTP+SSE transport not yet implemented")
 
+    @contextmanager
+    def _track_call(self, server_id: str) -> Iterator[None]:
+        """Count a request as in flight for the duration of the block.
+
+        Args:
+            server_id: ID of the server handling the request
+        """
+        count = self._inflight.get(server_id, 0)
+        if count == 0:
+            self._idle.setdefault(server_id, asyncio.Event()).clear()
+        self._inflight[server_id] = count + 1
+        try:
+            yield
+        finally:
+            remaining = self._inflight[server_id] - 1
+            if remaining:
+                self._inflight[server_id] = remaining
+            else:
+                del self._inflight[server_id]
+                self._idle[server_id].set()
+
     async def disconnect_server(self, server_id: str):
         """Disconnect from an upstream server.
 
         Args:
             server_id: ID of the server to disconnect
         """
-        client = self._clients.pop(server_id, None)
+        client = self._clients.remove(server_id)
+        self._invalidate_list_cache(server_id)
 
         if client:
+            idle = self._idle.get(server_id)
+            if idle is not None and not idle.is_set():
+                try:
+                    await asyncio.wait_for(idle.wait(), timeout=self._drain_timeout)
+                except asyncio.TimeoutError:
+                    logger.warning(f"Disconnecting {server_id} with requests still in flight")
+
+            stack = self._exit_stacks.pop(server_id, None)
             try:
-                await client.stop()
+                if stack is not None:
+                    await stack.aclose()
+                else:
+                    await client.stop()
                 logger.info(f"Disconnected from {server_id}")
             except Exception as e:
                 logger.error(f"Error disconnecting from {server_id}: {e}")
@@ -158,13 +564,11 @@ class MCPClientManager:
             # Local tool execution would be handled separately
             raise ValueError("Local tool execution not implemented")
 
-        client = self._clients.get(server_id)
-        if not client or client.status != "connected":
-            # Try to connect
-            client = await self.connect_server(server_id)
+        client = await self._ready_client(server_id)
 
         # Call tool
-        result = await client.call_tool(tool_name, arguments)
+        with self._track_call(server_id):
+            result = await client.call_tool(tool_name, arguments)
 
         # Native client returns dict directly from MCP protocol
         # Format: {'content': [...], 'isError': bool}
@@ -179,12 +583,7 @@ class MCPClientManager:
         Returns:
             List of tool descriptors
         """
-        client = self._clients.get(server_id)
-        if not client or client.status != "connected":
-            client = await self.connect_server(server_id)
-
-        # Native client stores tools after initialization
-        return client.tools
+        return await self._cached_list(server_id, "tools")
 
     async def list_prompts(self, server_id: str) -> list[dict]:
         """List available prompts from a server.
@@ -195,11 +594,119 @@ class MCPClientManager:
         Returns:
             List of prompt descriptors
         """
-        client = self._clients.get(server_id)
-        if not client or client.status != "connected":
+        return await self._cached_list(server_id, "prompts")
+
+    async def _cached_list(self, server_id: str, kind: str) -> list[dict]:
+        """Return a tool/prompt/resource list, refreshing it after the TTL.
+
+        Args:
+            server_id: ID of the server
+            kind: "tools", "prompts" or "resources"
+
+        Returns:
+            List of descriptors
+        """
+        key = (server_id, kind)
+        cached = self._list_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._list_ttl:
+            return cached[1]
+
+        if cached is None and kind == "tools" and server_id not in self._clients:
+            # Cold start: answer from the persisted list and connect in the
+            # background to pick up any changes
+            persisted = await self.storage.load_tool_cache(server_id)
+            if persisted is not None:
+                tools, digest = persisted
+                self._tool_digests[server_id] = digest
+                self._list_cache[key] = (time.monotonic(), tools)
+                self._start_tool_refresh(server_id)
+                return tools
+
+        client = await self._ready_client(server_id)
+
+        items = getattr(client, kind)
+        # On first use the lists fetched during the handshake are current;
+        # once the TTL expires, ask the server again
+        if cached is not None and kind in (client.capabilities or {}):
+            try:
+                items = await getattr(client, f"list_{kind}")()
+            except MCPClientError as e:
+                logger.warning(f"Failed to refresh {kind} for {server_id}: {e}")
+
+        self._list_cache[key] = (time.monotonic(), items)
+        if kind == "tools":
+            await self._persist_tools(server_id, items)
+        return items
+
+    def _start_tool_refresh(self, server_id: str) -> None:
+        """Refresh a server's persisted tool list in the background.
+
+        Args:
+            server_id: ID of the server
+        """
+        task = self._refresh_tasks.get(server_id)
+        if task is None or task.done():
+            self._refresh_tasks[server_id] = asyncio.create_task(
+                self._refresh_tools(server_id)
+            )
+
+    async def _refresh_tools(self, server_id: str) -> None:
+        """Connect to a server and update its cached tool list.
+
+        Args:
+            server_id: ID of the server
+        """
+        try:
             client = await self.connect_server(server_id)
+        except Exception as e:
+            logger.warning(f"Background tool refresh for {server_id} failed: {e}")
+            return
+
+        self._list_cache[(server_id, "tools")] = (time.monotonic(), client.tools)
+        await self._persist_tools(server_id, client.tools)
+
+    async def _persist_tools(self, server_id: str, tools: list[dict]) -> None:
+        """Save a tool list to storage if it differs from the stored one.
+
+        Args:
+            server_id: ID of the server
+            tools: Tool descriptors
+        """
+        digest = hashlib.blake2b(
+            json.dumps(tools, sort_keys=True).encode("utf-8"), digest_size=16
+        ).hexdigest()
+        if self._tool_digests.get(server_id) == digest:
+            return
+
+        try:
+            await self.storage.save_tool_cache(server_id, tools, digest)
+            self._tool_digests[server_id] = digest
+        except Exception as e:
+            logger.warning(f"Failed to persist tools for {server_id}: {e}")
+
+    def expire_lists(self, server_id: Optional[str] = None) -> None:
+        """Mark cached lists stale so the next read asks the server again.
+
+        Unlike dropping the entries, this also bypasses the handshake lists
+        of a connected client and the persisted cold-start tool list.
 
-        return client.prompts
+        Args:
+            server_id: Server whose lists to expire (None for all servers)
+        """
+        for key, (_, items) in self._list_cache.items():
+            if server_id is None or key[0] == server_id:
+                self._list_cache[key] = (float("-inf"), items)
+
+    def _invalidate_list_cache(self, server_id: str) -> None:
+        """Drop cached lists for a server.
+
+        Args:
+            server_id: ID of the server
+        """
+        self._list_cache = {
+            key: value for key, value in self._list_cache.items()
+            if key[0] != server_id
+        }
 
     async def get_prompt(
         self,
@@ -217,11 +724,10 @@ class MCPClientManager:
         Returns:
             Prompt result
         """
-        client = self._clients.get(server_id)
-        if not client or client.status != "connected":
-            client = await self.connect_server(server_id)
+        client = await self._ready_client(server_id)
 
-        return await client.get_prompt(prompt_name, arguments)
+        with self._track_call(server_id):
+            return await client.get_prompt(prompt_name, arguments)
 
     async def list_resources(self, server_id: str) -> list[dict]:
         """List available resources from a server.
@@ -232,11 +738,7 @@ class MCPClientManager:
         Returns:
             List of resource descriptors
         """
-        client = self._clients.get(server_id)
-        if not client or client.status != "connected":
-            client = await self.connect_server(server_id)
-
-        return client.resources
+        return await self._cached_list(server_id, "resources")
 
     async def read_resource(self, server_id: str, uri: str) -> dict:
         """Read a resource from a server.
@@ -248,11 +750,10 @@ class MCPClientManager:
         Returns:
             Resource content
         """
-        client = self._clients.get(server_id)
-        if not client or client.status != "connected":
-            client = await self.connect_server(server_id)
+        client = await self._ready_client(server_id)
 
-        return await client.read_resource(uri)
+        with self._track_call(server_id):
+            return await client.read_resource(uri)
 
     async def register_server(
         self,
@@ -269,8 +770,7 @@ class MCPClientManager:
             transport: Transport type
             config: Transport-specific configuration
         """
-        if not self._registry:
-            self._registry = await self.storage.load_registry()
+        registry = await self._get_registry()
 
         server_config = ServerConfig(
             server_id=server_id,
@@ -280,8 +780,8 @@ class MCPClientManager:
             enabled=True,
         )
 
-        self._registry.servers[server_id] = server_config
-        await self.storage.save_registry(self._registry)
+        registry.servers[server_id] = server_config
+        await self._schedule_save()
         logger.info(f"Registered server: {server_id}")
 
     async def unregister_server(self, server_id: str) -> None:
@@ -290,38 +790,149 @@ class MCPClientManager:
         Args:
             server_id: Server to unregister
         """
-        if not self._registry:
-            self._registry = await self.storage.load_registry()
+        registry = await self._get_registry()
 
         # Disconnect if connected
         await self.disconnect_server(server_id)
 
         # Remove from registry
-        self._registry.servers.pop(server_id, None)
-        await self.storage.save_registry(self._registry)
+        registry.servers.pop(server_id, None)
+        self._connect_locks.pop(server_id, None)
+        self._tool_digests.pop(server_id, None)
+        if server_id not in self._inflight:
+            self._idle.pop(server_id, None)
+        await self.storage.delete_tool_cache(server_id)
+        await self._schedule_save()
         logger.info(f"Unregistered server: {server_id}")
 
+    async def _schedule_save(self) -> None:
+        """Schedule a registry save, coalescing with one already pending."""
+        if self._save_pending is None:
+            self._save_pending = asyncio.create_task(
+                self._do_save_after(self._save_delay)
+            )
+
+    async def _do_save_after(self, delay: float) -> None:
+        """Save the registry after a short delay.
+
+        Args:
+            delay: Seconds to wait for further mutations before saving
+        """
+        await asyncio.sleep(delay)
+        # Clear before saving so mutations made during the write schedule
+        # a fresh save instead of being lost
+        self._save_pending = None
+        try:
+            await self._save_registry_now()
+        except Exception as e:
+            logger.error(f"Failed to save registry: {e}")
+
+    async def _save_registry_now(self) -> None:
+        """Write the in-memory registry to storage."""
+        async with self._save_lock:
+            await self.storage.save_registry(self._registry)
+
+    async def flush_registry(self) -> None:
+        """Write any pending registry changes to storage immediately.
+
+        Call this before reading the registry file directly.
+        """
+        task, self._save_pending = self._save_pending, None
+        if task is None:
+            # Wait for a save that is already writing, if any
+            async with self._save_lock:
+                return
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await self._save_registry_now()
+
     async def list_servers(self) -> list[ServerConfig]:
         """List all registered servers.
 
         Returns:
             List of server configurations
         """
-        if not self._registry:
-            self._registry = await self.storage.load_registry()
+        return list(await self.iter_servers())
+
+    async def iter_servers(self, *, enabled_only: bool = False) -> Iterable[ServerConfig]:
+        """Iterate over registered servers without copying the registry.
+
+        The result is a one-shot generator over the live registry, so
+        consume it before registering or unregistering servers.
+
+        Args:
+            enabled_only: Skip disabled servers
+
+        Returns:
+            Iterable of server configurations
+        """
+        registry = await self._get_registry()
 
-        return list(self._registry.servers.values())
+        return (
+            config
+            for config in registry.servers.values()
+            if not enabled_only or config.enabled
+        )
 
     async def reload_registry(self):
         """Reload server registry from storage.
 
         Call this after adding/removing/updating servers to pick up changes.
+        Storage is treated as authoritative, so an unsaved in-memory change
+        is dropped; call flush_registry() before editing the file to keep it.
         """
-        self._registry = await self.storage.load_registry()
+        task, self._save_pending = self._save_pending, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        async with self._save_lock:
+            self._registry = await self.storage.load_registry()
+            self._registry_future = None
         logger.info(f"Reloaded registry with {len(self._registry.servers)} servers")
 
-    async def close_all(self):
-        """Close all client connections."""
+    async def close_all(self, timeout: float = 5.0):
+        """Close all client connections.
+
+        Servers are stopped in parallel; any still stopping after the
+        timeout have their process killed.
+
+        Args:
+            timeout: Seconds to wait for all servers to stop
+        """
+        await self.flush_registry()
+
+        # Stop any handshakes still in progress before tearing down clients
+        pending = [
+            task
+            for task in (*self._warmup_tasks.values(), *self._refresh_tasks.values())
+            if not task.done()
+        ]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._warmup_tasks.clear()
+        self._refresh_tasks.clear()
+
         logger.info(f"Closing {len(self._clients)} client connections")
-        for server_id in list(self._clients.keys()):
-            await self.disconnect_server(server_id)
+        clients = {server_id: self._clients.get(server_id) for server_id in self._clients}
+        tasks = {
+            asyncio.create_task(self.disconnect_server(server_id)): server_id
+            for server_id in clients
+        }
+        if not tasks:
+            return
+
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        for task in pending:
+            server_id = tasks[task]
+            logger.warning(f"Server {server_id} did not stop within {timeout}s, killing it")
+            client = clients[server_id]
+            process = getattr(client, "process", None)
+            if process is not None and process.returncode is None:
+                process.kill()
@@ -7,15 +7,31 @@ and resource usage for monitoring and optimization.
 
 import asyncio
 import time
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import defaultdict, deque
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 from .storage import StorageLayer
 
+# Milliseconds per second
+_MS = 1000.0
+
+# Sample kinds, indexing MetricsCollector's apply dispatch table
+_COUNTER, _GAUGE, _TIMING = 0, 1, 2
+
+# Optional NumPy for vectorized statistics
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 class MetricType(str):
     """Types of metrics."""
@@ -47,12 +63,103 @@ class MetricType(str):
     P99_EXECUTION_TIME = "p99_execution_time_ms"
 
 
+class _P2Quantile:
+    """
+    Streaming quantile estimate using the P-square algorithm.
+
+    Tracks one quantile with five markers in O(1) time and memory per
+    observation (Jain & Chlamtac, 1985). Exact for the first five samples.
+    """
+
+    __slots__ = ("p", "count", "_heights", "_pos", "_desired", "_step")
+
+    def __init__(self, p: float):
+        """
+        Initialize the estimator.
+
+        Args:
+            p: Quantile to track, between 0 and 1
+        """
+        self.p = p
+        self.count = 0
+        self._heights: list[float] = []
+        self._pos = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self._step = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def add(self, x: float) -> None:
+        """
+        Add an observation.
+
+        Args:
+            x: Observed value
+        """
+        self.count += 1
+        q = self._heights
+        if self.count <= 5:
+            q.append(x)
+            if self.count == 5:
+                q.sort()
+            return
+
+        # Find the cell containing x, extending the extremes if needed
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        n = self._pos
+        for i in range(k + 1, 5):
+            n[i] += 1
+        desired = self._desired
+        step = self._step
+        for i in range(5):
+            desired[i] += step[i]
+
+        # Move the middle markers towards their desired positions
+        for i in (1, 2, 3):
+            d = desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                height = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not q[i - 1] < height < q[i + 1]:
+                    # Parabolic step overshot; fall back to linear
+                    height = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = height
+                n[i] += d
+
+    @property
+    def value(self) -> Optional[float]:
+        """Current estimate, or None before any observation."""
+        if self.count == 0:
+            return None
+        if self.count < 5:
+            ordered = sorted(self._heights)
+            return ordered[min(int(self.count * self.p), self.count - 1)]
+        return self._heights[2]
+
+
+@lru_cache(maxsize=4096)
+def _iso(ts: float) -> str:
+    """Format an epoch timestamp as an ISO 8601 UTC string."""
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
 class MetricPoint(BaseModel):
     """A single metric data point."""
 
-    timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        description="Metric timestamp (UTC)"
+    timestamp: float = Field(
+        default_factory=time.time,
+        description="Metric timestamp (seconds since the epoch, UTC)"
     )
     metric_name: str = Field(description="Metric name")
     value: float = Field(description="Metric value")
@@ -61,16 +168,196 @@ class MetricPoint(BaseModel):
         description="Metric tags for filtering"
     )
 
-    class Config:
-        """Pydantic model configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    @property
+    def as_datetime(self) -> datetime:
+        """Timestamp as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.timestamp, timezone.utc)
+
+    @field_serializer("timestamp")
+    def _serialize_timestamp(self, timestamp: float) -> str:
+        """Export the timestamp as an ISO 8601 string."""
+        return _iso(timestamp)
+
+
+def _float_buffer(size: int) -> Any:
+    """Allocate a zeroed float64 buffer (NumPy array if available)."""
+    if NUMPY_AVAILABLE:
+        return np.zeros(size, dtype=np.float64)
+    return array("d", bytes(8 * size))
+
+
+def _grow_buffer(buf: Any, extra: int) -> Any:
+    """Return buf extended by extra zeroed slots."""
+    if isinstance(buf, array):
+        buf.frombytes(bytes(8 * extra))
+        return buf
+    return np.concatenate((buf, np.zeros(extra, dtype=np.float64)))
+
+
+def _concat(first: Any, second: Any) -> Any:
+    """Concatenate two float64 buffers of the same kind."""
+    if isinstance(first, array):
+        return first + second
+    return np.concatenate((first, second))
+
+
+def _summarize(values: Any) -> tuple[float, float, float]:
+    """
+    Compute min, max and mean of a non-empty float64 buffer.
+
+    Args:
+        values: NumPy array or array('d')
+
+    Returns:
+        Tuple of (min, max, avg)
+    """
+    if isinstance(values, array):
+        return min(values), max(values), sum(values) / len(values)
+    return float(values.min()), float(values.max()), float(values.mean())
+
+
+class _Series:
+    """
+    Ring buffer of metric samples stored as parallel arrays.
+
+    Timestamps and values live in separate float64 buffers, 16 bytes per
+    sample instead of one Python object each, with tags in a parallel
+    list. Buffers start small and double until they reach the capacity,
+    after which the oldest samples are overwritten.
+    """
+
+    __slots__ = ("capacity", "ts", "val", "tags", "head", "count")
+
+    def __init__(self, capacity: int = 10000):
+        """
+        Initialize an empty series.
+
+        Args:
+            capacity: Maximum number of samples kept
+        """
+        self.capacity = capacity
+        size = min(16, capacity)
+        self.ts = _float_buffer(size)
+        self.val = _float_buffer(size)
+        self.tags: list[tuple[tuple[str, str], ...]] = [()] * size
+        self.head = 0  # Next slot to write
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, ts: float, value: float, tags: tuple[tuple[str, str], ...]) -> None:
+        """
+        Add a sample, overwriting the oldest one when full.
+
+        Args:
+            ts: Wall-clock timestamp in seconds since the epoch
+            value: Sample value
+            tags: Tags as a tuple of (key, value) pairs
+        """
+        i = self.head
+        if i == len(self.tags):
+            # Only reachable before the first wrap-around
+            extra = min(self.capacity, 2 * i) - i
+            self.ts = _grow_buffer(self.ts, extra)
+            self.val = _grow_buffer(self.val, extra)
+            self.tags.extend([()] * extra)
+
+        self.ts[i] = ts
+        self.val[i] = value
+        self.tags[i] = tags
+
+        i += 1
+        self.head = 0 if i == self.capacity else i
+        if self.count < self.capacity:
+            self.count += 1
+
+    def window(
+        self,
+        start_ts: Optional[float] = None,
+        end_ts: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> tuple[Any, Any, list[tuple[tuple[str, str], ...]]]:
+        """
+        Get the samples in a time range, oldest first.
+
+        Samples are appended in time order, so each contiguous part of the
+        ring is sorted and the range is found by binary search; only the
+        selected samples are copied.
+
+        Args:
+            start_ts: Earliest timestamp to include
+            end_ts: Latest timestamp to include
+            limit: Keep only the newest this many samples of the range
+
+        Returns:
+            Tuple of (timestamps, values, tags)
+        """
+        if self.count < self.capacity or self.head == 0:
+            segments = [(0, self.count)]
+        else:
+            segments = [(self.head, self.capacity), (0, self.head)]
+
+        # Resolve open bounds once so the search is one comparison per probe
+        lo_ts = float("-inf") if start_ts is None else start_ts
+        hi_ts = float("inf") if end_ts is None else end_ts
+
+        ranges = []
+        for first, last in segments:
+            lo = bisect_left(self.ts, lo_ts, first, last)
+            hi = bisect_right(self.ts, hi_ts, lo, last)
+            if lo < hi:
+                ranges.append((lo, hi))
+
+        if limit is not None:
+            excess = sum(hi - lo for lo, hi in ranges) - max(0, limit)
+            while excess > 0:
+                lo, hi = ranges[0]
+                if hi - lo <= excess:
+                    ranges.pop(0)
+                    excess -= hi - lo
+                else:
+                    ranges[0] = (lo + excess, hi)
+                    excess = 0
+
+        if not ranges:
+            return self.ts[:0], self.val[:0], []
+
+        (lo, hi), *rest = ranges
+        ts, val, tags = self.ts[lo:hi], self.val[lo:hi], self.tags[lo:hi]
+        for lo, hi in rest:
+            ts = _concat(ts, self.ts[lo:hi])
+            val = _concat(val, self.val[lo:hi])
+            tags = tags + self.tags[lo:hi]
+        return ts, val, tags
 
 
 class MetricsCollector:
     """Collects and manages metrics for the SkillFlow server."""
 
+    __slots__ = (
+        "storage",
+        "metrics_dir",
+        "_metrics",
+        "_history_disabled",
+        "_counters",
+        "_gauges",
+        "_pending",
+        "_tag_intern",
+        "_dirty_counters",
+        "_dirty_gauges",
+        "_prom_counters",
+        "_prom_gauges",
+        "_prom_text",
+        "_p50",
+        "_p95",
+        "_p99",
+        "_active_executions",
+        "_max_concurrent",
+        "_exec_timestamps",
+        "_background_task",
+    )
+
     def __init__(self, storage: StorageLayer):
         """
         Initialize metrics collector.
@@ -83,19 +370,47 @@ class MetricsCollector:
         self.metrics_dir.mkdir(parents=True, exist_ok=True)
 
         # In-memory metric storage (time-series data)
-        # Key: metric_name, Value: deque of MetricPoint
-        self._metrics: dict[str, deque[MetricPoint]] = defaultdict(
-            lambda: deque(maxlen=10000)  # Keep last 10k points per metric
-        )
+        # Key: metric_name, Value: ring of the last 10k samples
+        self._metrics: dict[str, _Series] = {}
+        # Untagged counters only ever read as running totals; their
+        # increments are not kept as history
+        self._history_disabled: set[str] = {
+            MetricType.SKILL_EXECUTIONS,
+            MetricType.SKILL_SUCCESSES,
+            MetricType.SKILL_FAILURES,
+        }
 
         # Aggregated metrics for fast queries
         self._counters: dict[str, float] = defaultdict(float)
         self._gauges: dict[str, float] = {}
 
-        # Execution tracking
-        self._execution_times: deque[float] = deque(maxlen=1000)
+        # Recorded samples waiting to be applied, as (kind, name, value,
+        # tags); drained once per event loop iteration and before every
+        # read, with one timestamp for the whole batch
+        self._pending: deque[tuple] = deque()
+
+        # Canonical sorted tag tuples, shared by every sample with the
+        # same tags
+        self._tag_intern: dict[tuple, tuple] = {}
+
+        # Preformatted Prometheus lines, refreshed only for metrics that
+        # changed since the last export
+        self._dirty_counters: set[str] = set()
+        self._dirty_gauges: set[str] = set()
+        self._prom_counters: dict[str, str] = {}
+        self._prom_gauges: dict[str, str] = {}
+        self._prom_text: Optional[str] = None
+
+        # Execution tracking: streaming estimates feeding the percentile
+        # gauges, so the collector doesn't keep or rescan samples
+        self._p50 = _P2Quantile(0.50)
+        self._p95 = _P2Quantile(0.95)
+        self._p99 = _P2Quantile(0.99)
         self._active_executions = 0
         self._max_concurrent = 0
+        # Monotonic start times of recent executions, oldest first, for
+        # throughput; entries older than the window are dropped each tick
+        self._exec_timestamps: deque[float] = deque(maxlen=10000)
 
         # Start background tasks
         self._background_task: Optional[asyncio.Task] = None
@@ -117,55 +432,130 @@ class MetricsCollector:
         """Background task to collect system-level metrics."""
         while True:
             try:
-                # Collect memory usage
-                try:
-                    import psutil
-                    process = psutil.Process()
-                    memory_mb = process.memory_info().rss / 1024 / 1024
-                    self.record_gauge(MetricType.MEMORY_USAGE_MB, memory_mb)
-                except ImportError:
-                    # psutil not available, skip memory metrics
-                    pass
-
-                # Record concurrent executions
-                self.record_gauge(
-                    MetricType.CONCURRENT_EXECUTIONS,
-                    self._active_executions
-                )
-                self.record_gauge(
-                    MetricType.MAX_CONCURRENT_EXECUTIONS,
-                    self._max_concurrent
-                )
+                self._collect_once()
+            except Exception:
+                # Don't let metrics collection crash the server
+                pass
+            await asyncio.sleep(10)  # Collect every 10 seconds
 
-                # Calculate throughput (executions per minute)
-                recent_executions = sum(
-                    1 for point in self._metrics.get(MetricType.SKILL_EXECUTIONS, [])
-                    if point.timestamp > datetime.now(timezone.utc) - timedelta(minutes=1)
-                )
-                self.record_gauge(MetricType.THROUGHPUT_PER_MINUTE, recent_executions)
+    def _intern_tags(self, tags: Optional[dict[str, str]]) -> tuple:
+        """
+        Freeze tags into a shared, sorted tuple of items.
+
+        Args:
+            tags: Tags given to a record call
+
+        Returns:
+            The interned tuple (empty when there are no tags)
+        """
+        if not tags:
+            return ()
+        key = tuple(sorted(tags.items()))
+        return self._tag_intern.setdefault(key, key)
+
+    def _record(
+        self,
+        kind: int,
+        metric_name: str,
+        value: float,
+        tags: Optional[dict[str, str]],
+    ) -> None:
+        """
+        Queue a sample, scheduling a drain if it starts a new batch.
 
-                # Calculate error rate
-                total = self._counters.get(MetricType.SKILL_EXECUTIONS, 0)
-                failures = self._counters.get(MetricType.SKILL_FAILURES, 0)
-                error_rate = (failures / total * 100) if total > 0 else 0.0
-                self.record_gauge(MetricType.ERROR_RATE_PERCENT, error_rate)
+        Args:
+            kind: _COUNTER, _GAUGE or _TIMING
+            metric_name: Name of the metric
+            value: Sample value
+            tags: Optional tags for the metric
+        """
+        pending = self._pending
+        if not pending:
+            try:
+                asyncio.get_running_loop().call_soon(self._drain)
+            except RuntimeError:
+                # No running loop; the next read drains the batch
+                pass
+        pending.append((kind, metric_name, value, self._intern_tags(tags) if tags else ()))
+
+    def _apply_counter(self, name: str, value: float) -> None:
+        """Add a drained sample to its counter."""
+        self._counters[name] += value
+        self._dirty_counters.add(name)
+
+    def _apply_gauge(self, name: str, value: float) -> None:
+        """Set a gauge from a drained sample."""
+        self._gauges[name] = value
+        self._dirty_gauges.add(name)
+
+    def _apply_timing(self, name: str, value: float) -> None:
+        """Feed a drained timing to the percentile trackers."""
+        self._p50.add(value)
+        self._p95.add(value)
+        self._p99.add(value)
+
+    def _drain(self) -> None:
+        """Apply all pending samples to the series and aggregates."""
+        pending = self._pending
+        if not pending:
+            return
+        ts = time.time()
+        metrics = self._metrics
+        history_disabled = self._history_disabled
+        apply = (self._apply_counter, self._apply_gauge, self._apply_timing)
+        while pending:
+            kind, name, value, tags = pending.popleft()
+            if tags or name not in history_disabled:
+                series = metrics.get(name)
+                if series is None:
+                    series = metrics[name] = _Series()
+                series.append(ts, value, tags)
+            apply[kind](name, value)
+
+    def _collect_once(self) -> None:
+        """Record one round of system-level and derived metrics."""
+        self._drain()
+
+        # Collect memory usage
+        try:
+            import psutil
+            process = psutil.Process()
+            memory_mb = process.memory_info().rss / 1024 / 1024
+            self.record_gauge(MetricType.MEMORY_USAGE_MB, memory_mb)
+        except ImportError:
+            # psutil not available, skip memory metrics
+            pass
+
+        # Record concurrent executions
+        self.record_gauge(
+            MetricType.CONCURRENT_EXECUTIONS,
+            self._active_executions
+        )
+        self.record_gauge(
+            MetricType.MAX_CONCURRENT_EXECUTIONS,
+            self._max_concurrent
+        )
 
-                # Calculate percentiles
-                if self._execution_times:
-                    sorted_times = sorted(self._execution_times)
-                    p50 = sorted_times[len(sorted_times) // 2]
-                    p95 = sorted_times[int(len(sorted_times) * 0.95)]
-                    p99 = sorted_times[int(len(sorted_times) * 0.99)]
+        # Calculate throughput (executions per minute)
+        cutoff = time.monotonic() - 60.0
+        timestamps = self._exec_timestamps
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
+        self.record_gauge(MetricType.THROUGHPUT_PER_MINUTE, len(timestamps))
 
-                    self.record_gauge(MetricType.P50_EXECUTION_TIME, p50)
-                    self.record_gauge(MetricType.P95_EXECUTION_TIME, p95)
-                    self.record_gauge(MetricType.P99_EXECUTION_TIME, p99)
+        # Calculate error rate
+        total = self._counters.get(MetricType.SKILL_EXECUTIONS, 0)
+        failures = self._counters.get(MetricType.SKILL_FAILURES, 0)
+        error_rate = (failures / total * 100) if total > 0 else 0.0
+        self.record_gauge(MetricType.ERROR_RATE_PERCENT, error_rate)
 
-                await asyncio.sleep(10)  # Collect every 10 seconds
+        # Calculate percentiles
+        if self._p50.count:
+            self.record_gauge(MetricType.P50_EXECUTION_TIME, self._p50.value)
+            self.record_gauge(MetricType.P95_EXECUTION_TIME, self._p95.value)
+            self.record_gauge(MetricType.P99_EXECUTION_TIME, self._p99.value)
 
-            except Exception:
-                # Don't let metrics collection crash the server
-                await asyncio.sleep(10)
+        self._drain()
 
     def record_counter(
         self,
@@ -181,14 +571,7 @@ class MetricsCollector:
             value: Value to add (default: 1)
             tags: Optional tags for the metric
         """
-        point = MetricPoint(
-            metric_name=metric_name,
-            value=value,
-            tags=tags or {}
-        )
-
-        self._metrics[metric_name].append(point)
-        self._counters[metric_name] += value
+        self._record(_COUNTER, metric_name, value, tags)
 
     def record_gauge(
         self,
@@ -204,14 +587,7 @@ class MetricsCollector:
             value: Current value
             tags: Optional tags for the metric
         """
-        point = MetricPoint(
-            metric_name=metric_name,
-            value=value,
-            tags=tags or {}
-        )
-
-        self._metrics[metric_name].append(point)
-        self._gauges[metric_name] = value
+        self._record(_GAUGE, metric_name, value, tags)
 
     def record_timing(
         self,
@@ -227,19 +603,14 @@ class MetricsCollector:
             duration_ms: Duration in milliseconds
             tags: Optional tags for the metric
         """
-        point = MetricPoint(
-            metric_name=metric_name,
-            value=duration_ms,
-            tags=tags or {}
-        )
-
-        self._metrics[metric_name].append(point)
-        self._execution_times.append(duration_ms)
+        self._record(_TIMING, metric_name, duration_ms, tags)
 
     def execution_started(self) -> None:
         """Track that a skill execution has started."""
-        self._active_executions += 1
-        self._max_concurrent = max(self._max_concurrent, self._active_executions)
+        active = self._active_executions = self._active_executions + 1
+        if active > self._max_concurrent:
+            self._max_concurrent = active
+        self._exec_timestamps.append(time.monotonic())
         self.record_counter(MetricType.SKILL_EXECUTIONS)
 
     def execution_completed(self, duration_ms: float, success: bool = True) -> None:
@@ -250,7 +621,8 @@ class MetricsCollector:
             duration_ms: Execution duration in milliseconds
             success: Whether execution succeeded
         """
-        self._active_executions = max(0, self._active_executions - 1)
+        if self._active_executions:
+            self._active_executions -= 1
 
         self.record_timing(MetricType.SKILL_EXECUTION_TIME, duration_ms)
 
@@ -293,20 +665,27 @@ class MetricsCollector:
         Returns:
             List of metric points (newest first)
         """
-        if metric_name not in self._metrics:
+        self._drain()
+        series = self._metrics.get(metric_name)
+        if series is None:
             return []
 
-        points = list(self._metrics[metric_name])
-
-        # Apply time filters
-        if start_time:
-            points = [p for p in points if p.timestamp >= start_time]
-        if end_time:
-            points = [p for p in points if p.timestamp <= end_time]
+        ts, values, tags = series.window(
+            start_time.timestamp() if start_time else None,
+            end_time.timestamp() if end_time else None,
+            limit,
+        )
 
         # Return newest first
-        points.reverse()
-        return points[:limit]
+        return [
+            MetricPoint(
+                timestamp=float(ts[i]),
+                metric_name=metric_name,
+                value=float(values[i]),
+                tags=dict(tags[i]),
+            )
+            for i in range(len(ts) - 1, -1, -1)
+        ]
 
     def get_current_metrics(self) -> dict[str, Any]:
         """
@@ -315,6 +694,7 @@ class MetricsCollector:
         Returns:
             Dictionary of current metric values
         """
+        self._drain()
         return {
             "counters": dict(self._counters),
             "gauges": dict(self._gauges),
@@ -337,10 +717,15 @@ class MetricsCollector:
         Returns:
             Summary statistics (min, max, avg, count)
         """
-        start_time = datetime.now(timezone.utc) - timedelta(minutes=window_minutes)
-        points = self.get_metric_history(metric_name, start_time=start_time)
+        self._drain()
+        series = self._metrics.get(metric_name)
+        if series is not None:
+            start_ts = time.time() - window_minutes * 60
+            _, values, _ = series.window(start_ts)
+        else:
+            values = ()
 
-        if not points:
+        if not len(values):
             return {
                 "metric": metric_name,
                 "window_minutes": window_minutes,
@@ -351,16 +736,16 @@ class MetricsCollector:
                 "latest": None,
             }
 
-        values = [p.value for p in points]
+        minimum, maximum, avg = _summarize(values)
 
         return {
             "metric": metric_name,
             "window_minutes": window_minutes,
             "count": len(values),
-            "min": min(values),
-            "max": max(values),
-            "avg": sum(values) / len(values),
-            "latest": values[0] if values else None,
+            "min": minimum,
+            "max": maximum,
+            "avg": avg,
+            "latest": float(values[-1]),
         }
 
     def get_dashboard_metrics(self) -> dict[str, Any]:
@@ -392,24 +777,40 @@ class MetricsCollector:
         Returns:
             Prometheus-formatted metrics string
         """
-        lines = []
-
-        # Export counters
-        for name, value in self._counters.items():
-            lines.append(f"# TYPE {name} counter")
-            lines.append(f"{name} {value}")
-
-        # Export gauges
-        for name, value in self._gauges.items():
-            lines.append(f"# TYPE {name} gauge")
-            lines.append(f"{name} {value}")
-
-        return "\n".join(lines) + "\n"
+        self._drain()
+
+        # Reformat counters
+        if self._dirty_counters:
+            for name in self._dirty_counters:
+                self._prom_counters[name] = f"# TYPE {name} counter\n{name} {self._counters[name]}"
+            self._dirty_counters.clear()
+            self._prom_text = None
+
+        # Reformat gauges
+        if self._dirty_gauges:
+            for name in self._dirty_gauges:
+                self._prom_gauges[name] = f"# TYPE {name} gauge\n{name} {self._gauges[name]}"
+            self._dirty_gauges.clear()
+            self._prom_text = None
+
+        if self._prom_text is None:
+            # Dirty sets fill the caches in hash order; sort by metric name so
+            # scrapes are stable and diffable
+            counters = self._prom_counters
+            gauges = self._prom_gauges
+            lines = [
+                *(counters[name] for name in sorted(counters)),
+                *(gauges[name] for name in sorted(gauges)),
+            ]
+            self._prom_text = "\n".join(lines) + "\n"
+        return self._prom_text
 
 
 class MetricsTimer:
     """Context manager for timing operations."""
 
+    __slots__ = ("collector", "metric_name", "tags", "start_time")
+
     def __init__(self, collector: MetricsCollector, metric_name: str,
                  tags: Optional[dict[str, str]] = None):
         """
@@ -422,15 +823,15 @@ class MetricsTimer:
         """
         self.collector = collector
         self.metric_name = metric_name
-        self.tags = tags or {}
+        self.tags = tags
         self.start_time = 0.0
 
     def __enter__(self) -> "MetricsTimer":
         """Start timing."""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Stop timing and record metric."""
-        duration_ms = (time.time() - self.start_time) * 1000
+        duration_ms = (time.perf_counter() - self.start_time) * _MS
         self.collector.record_timing(self.metric_name, duration_ms, self.tags)
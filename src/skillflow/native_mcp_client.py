@@ -7,14 +7,71 @@ Inspired by the Node.js MCP client implementation.
 """
 
 import asyncio
+import itertools
 import json
 import logging
-import subprocess
+import os
 import sys
+import time
+from collections import deque
+from enum import IntEnum
 from typing import Any, Callable, Optional
 
 logger = logging.getLogger(__name__)
 
+# Optional orjson for faster message (de)serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+    _encode = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _encode(value: Any) -> bytes:
+        """Serialize a value to UTF-8 JSON."""
+        return json.dumps(value).encode('utf-8')
+
+    _loads = json.loads
+
+# Interned method names: inbound methods are interned once on arrival, so
+# comparisons against these resolve on identity
+_M_ROOTS_LIST = sys.intern('roots/list')
+_M_SAMPLING = sys.intern('sampling/createMessage')
+_M_NOTIF_MSG = sys.intern('notifications/message')
+
+# Back-pressure limits: senders wait once this many frames are queued for
+# the writer, and new requests fail once this many await a response
+_MAX_QUEUED_FRAMES = 256
+_MAX_IN_FLIGHT = 512
+
+# Shared default for messages without params; handlers must not mutate it
+_EMPTY: dict = {}
+
+# JSON-RPC envelopes with the constant fields pre-encoded; only the
+# variable parts are serialized per message
+_REQUEST_FRAME = b'{"jsonrpc":"2.0","id":%d,"method":%s,"params":%s}\n'
+_NOTIFICATION_FRAME = b'{"jsonrpc":"2.0","method":%s,"params":%s}\n'
+_RESULT_FRAME = b'{"jsonrpc":"2.0","id":%s,"result":%s}\n'
+_ERROR_FRAME = b'{"jsonrpc":"2.0","id":%s,"error":%s}\n'
+
+# StreamReader buffer limit for the server pipes (also the longest stderr
+# line); stdout reads take up to this much of whatever is buffered at once
+_PIPE_LIMIT = 1 << 20
+
+
+class Status(IntEnum):
+    """Connection state of a native MCP client."""
+
+    DISCONNECTED = 0
+    CONNECTED = 1
+    FAILED = 2
+    INIT = 3
+    STOPPED = 4
+
 
 class MCPClientError(Exception):
     """Base exception for MCP client errors."""
@@ -36,6 +93,11 @@ class MCPProtocolError(MCPClientError):
     pass
 
 
+class MCPBackpressureError(MCPClientError):
+    """Too many requests already in flight; the connection itself is fine."""
+    pass
+
+
 class NativeMCPClient:
     """Native MCP client with direct stdio control.
 
@@ -48,6 +110,37 @@ class NativeMCPClient:
     - Detailed logging and error handling
     """
 
+    __slots__ = (
+        'server_id',
+        'command',
+        'args',
+        'env',
+        'timeout',
+        'client_name',
+        'client_version',
+        '_loop',
+        'process',
+        '_next_id',
+        '_pending_requests',
+        '_deadlines',
+        '_timeout_handle',
+        '_read_task',
+        '_stderr_task',
+        '_out_queue',
+        '_writer_task',
+        'last_response_at',
+        'status',
+        'capabilities',
+        'server_info',
+        'tools',
+        'prompts',
+        'resources',
+        'resource_templates',
+        '_roots',
+        '_roots_json',
+        '_sampling_handler',
+    )
+
     def __init__(
         self,
         server_id: str,
@@ -78,14 +171,25 @@ class NativeMCPClient:
         self.client_version = client_version
 
         # Process and communication
-        self.process: Optional[subprocess.Popen] = None
-        self._message_id = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._next_id = itertools.count().__next__
         self._pending_requests: dict[int, asyncio.Future] = {}
+        # (deadline, id, method) of sent requests in send order, expired by
+        # one timer set for the earliest deadline
+        self._deadlines: deque[tuple[float, int, str]] = deque()
+        self._timeout_handle: Optional[asyncio.TimerHandle] = None
         self._read_task: Optional[asyncio.Task] = None
         self._stderr_task: Optional[asyncio.Task] = None
+        # Serialized outbound messages, written by a single writer task
+        self._out_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=_MAX_QUEUED_FRAMES)
+        self._writer_task: Optional[asyncio.Task] = None
+
+        # Monotonic time of the last message received from the server
+        self.last_response_at = 0.0
 
         # MCP state
-        self.status = "init"
+        self.status = Status.INIT
         self.capabilities: Optional[dict] = None
         self.server_info: Optional[dict] = None
         self.tools: list[dict] = []
@@ -95,6 +199,8 @@ class NativeMCPClient:
 
         # Server request handlers
         self._roots: list[str] = []
+        # Encoded roots/list result, rebuilt only when the roots change
+        self._roots_json: bytes = _encode({'roots': []})
         self._sampling_handler: Optional[Callable] = None
 
     async def start(self) -> None:
@@ -106,37 +212,39 @@ class NativeMCPClient:
         logger.info(f"[{self.server_id}] Starting subprocess: {self.command} {' '.join(self.args)}")
 
         try:
-            # Build environment
-            full_env = dict(os.environ) if hasattr(os, 'environ') else {}
-            if self.env:
-                full_env.update(self.env)
+            # Build environment; without overrides the child inherits ours
+            full_env = {**os.environ, **self.env} if self.env else None
 
             # Start subprocess
-            start_time = asyncio.get_event_loop().time()
-            self.process = subprocess.Popen(
-                [self.command] + self.args,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+            loop = self._loop = asyncio.get_running_loop()
+            start_time = loop.time()
+            self.process = await asyncio.create_subprocess_exec(
+                self.command,
+                *self.args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 env=full_env,
-                bufsize=0,  # Unbuffered
+                limit=_PIPE_LIMIT,
             )
-            elapsed = asyncio.get_event_loop().time() - start_time
+            elapsed = loop.time() - start_time
             logger.info(f"[{self.server_id}] Subprocess started in {elapsed:.2f}s (PID: {self.process.pid})")
 
             # Start reading stdout and stderr
-            self._read_task = asyncio.create_task(self._read_loop())
-            self._stderr_task = asyncio.create_task(self._stderr_loop())
+            self._read_task = loop.create_task(self._read_loop())
+            self._stderr_task = loop.create_task(self._stderr_loop())
+            self._writer_task = loop.create_task(self._writer_loop())
 
             # Initialize MCP connection
             await self._initialize()
 
-            self.status = "connected"
+            self.status = Status.CONNECTED
             logger.info(f"[{self.server_id}] Connected and initialized")
 
         except Exception as e:
             logger.error(f"[{self.server_id}] Failed to start: {e}")
             await self.stop()
+            self.status = Status.FAILED
             raise MCPConnectionError(f"Failed to start {self.server_id}: {e}") from e
 
     async def _read_loop(self) -> None:
@@ -144,43 +252,55 @@ class NativeMCPClient:
         if not self.process or not self.process.stdout:
             return
 
-        buffer = ""
+        stdout = self.process.stdout
+        buffer = bytearray()
         try:
             while True:
-                # Read data (blocking in executor to not block event loop)
-                chunk = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    self.process.stdout.read,
-                    4096,
-                )
-
+                chunk = await stdout.read(_PIPE_LIMIT)
                 if not chunk:
                     logger.warning(f"[{self.server_id}] stdout closed")
                     break
 
-                # Decode and buffer
-                buffer += chunk.decode('utf-8', errors='replace')
-
-                # Parse complete lines
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-                    line = line.strip()
-
-                    if not line:
-                        continue
-
-                    try:
-                        message = json.loads(line)
-                        await self._handle_message(message)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"[{self.server_id}] Failed to parse JSON: {line[:100]}... Error: {e}")
-                    except Exception as e:
-                        logger.error(f"[{self.server_id}] Error handling message: {e}", exc_info=True)
+                # Only the new bytes can hold a newline not seen yet
+                scan_from = len(buffer)
+                buffer += chunk
+                nl = buffer.find(b'\n', scan_from)
+                if nl < 0:
+                    continue
+
+                # JSON-RPC messages are newline-delimited: one line per message
+                pos = 0
+                while nl >= 0:
+                    line = buffer[pos:nl].strip()
+                    pos = nl + 1
+                    if line:
+                        await self._dispatch_line(line)
+                    nl = buffer.find(b'\n', pos)
+                del buffer[:pos]
 
         except Exception as e:
             logger.error(f"[{self.server_id}] Read loop error: {e}", exc_info=True)
         finally:
             logger.info(f"[{self.server_id}] Read loop ended")
+            # The server can no longer answer: fail in-flight requests now
+            # instead of letting them run into the request timeout
+            if self.status is Status.CONNECTED:
+                self.status = Status.DISCONNECTED
+            self._reject_pending(MCPConnectionError(f"Connection to {self.server_id} lost"))
+
+    async def _dispatch_line(self, line: bytes) -> None:
+        """Parse one JSON-RPC line and handle the message.
+
+        Args:
+            line: Raw message bytes without the trailing newline
+        """
+        try:
+            message = _loads(line)
+            await self._handle_message(message)
+        except json.JSONDecodeError as e:
+            logger.error("[%s] Failed to parse JSON: %r... Error: %s", self.server_id, bytes(line[:100]), e)
+        except Exception as e:
+            logger.error("[%s] Error handling message: %s", self.server_id, e, exc_info=True)
 
     async def _stderr_loop(self) -> None:
         """Read and log stderr output."""
@@ -188,19 +308,14 @@ class NativeMCPClient:
             return
 
         try:
-            while True:
-                chunk = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    self.process.stderr.read,
-                    4096,
-                )
-
-                if not chunk:
-                    break
-
-                text = chunk.decode('utf-8', errors='replace').strip()
+            async for raw in self.process.stderr:
+                # Keep draining the pipe, but skip decoding lines nobody
+                # will see
+                if not logger.isEnabledFor(logging.WARNING):
+                    continue
+                text = raw.decode('utf-8', errors='replace').rstrip()
                 if text:
-                    logger.warning(f"[{self.server_id}] stderr: {text}")
+                    logger.warning("[%s] stderr: %s", self.server_id, text)
 
         except Exception as e:
             logger.error(f"[{self.server_id}] stderr loop error: {e}")
@@ -213,9 +328,19 @@ class NativeMCPClient:
         Args:
             message: JSON-RPC message
         """
+        self.last_response_at = time.monotonic()
+
+        has_id = 'id' in message
+        method = message.get('method')
+        if method is not None:
+            method = sys.intern(method)
+
         # Response to our request
-        if 'id' in message and message['id'] in self._pending_requests:
-            future = self._pending_requests.pop(message['id'])
+        if method is None and has_id:
+            future = self._pending_requests.pop(message['id'], None)
+            if future is None or future.done():
+                # Late reply to a request that already timed out or was cancelled
+                return
 
             if 'error' in message:
                 error = message['error']
@@ -227,14 +352,14 @@ class NativeMCPClient:
             return
 
         # Request from server
-        if 'method' in message and 'id' in message:
+        if method is not None and has_id:
             request_id = message['id']
 
             # Validate request ID - must not be None/null
             # According to JSONRPC 2.0, id can be string/number/null, but MCP requires valid id
             if request_id is None:
                 logger.error(
-                    f"[{self.server_id}] Received request with id=null for method '{message['method']}'. "
+                    f"[{self.server_id}] Received request with id=null for method '{method}'. "
                     f"This is invalid for MCP protocol. Ignoring request."
                 )
                 # Send error response with a generated ID to inform the server
@@ -246,21 +371,30 @@ class NativeMCPClient:
                 return
 
             await self._handle_server_request(
-                message['method'],
-                message.get('params', {}),
+                method,
+                message.get('params', _EMPTY),
                 request_id,
             )
             return
 
         # Notification from server
-        if 'method' in message and 'id' not in message:
+        if method is not None:
             await self._handle_notification(
-                message['method'],
-                message.get('params', {}),
+                method,
+                message.get('params', _EMPTY),
             )
             return
 
-        logger.warning(f"[{self.server_id}] Unknown message type: {message}")
+        logger.warning("[%s] Unknown message type: %s", self.server_id, message)
+
+    # Method -> handler method name; roots/list is answered on a fast path
+    # in _handle_server_request before the table is consulted
+    _REQUEST_HANDLERS = {
+        _M_SAMPLING: '_handle_sampling',
+    }
+    _NOTIFICATION_HANDLERS = {
+        _M_NOTIF_MSG: '_handle_log_message',
+    }
 
     async def _handle_notification(self, method: str, params: dict) -> None:
         """Handle notification from server.
@@ -269,14 +403,26 @@ class NativeMCPClient:
             method: Notification method
             params: Notification parameters
         """
-        if method == 'notifications/message':
+        handler_name = self._NOTIFICATION_HANDLERS.get(method)
+        if handler_name is None:
+            # Formatted lazily, so filtered levels cost nothing even for
+            # large params
+            logger.debug("[%s] Notification: %s %s", self.server_id, method, params)
+            return
+        await getattr(self, handler_name)(params)
+
+    async def _handle_log_message(self, params: dict) -> None:
+        """Log a notifications/message from the server.
+
+        Args:
+            params: Notification parameters (level, logger, data)
+        """
+        if logger.isEnabledFor(logging.INFO):
             level = params.get('level', 'info')
             data = params.get('data', '')
             logger_name = params.get('logger', '')
             prefix = f"[{logger_name}] " if logger_name else ""
-            logger.info(f"[{self.server_id}] {level.upper()} {prefix}{data}")
-        else:
-            logger.debug(f"[{self.server_id}] Notification: {method} {params}")
+            logger.info("[%s] %s %s%s", self.server_id, level.upper(), prefix, data)
 
     async def _handle_server_request(self, method: str, params: dict, request_id: int) -> None:
         """Handle request from server.
@@ -286,46 +432,55 @@ class NativeMCPClient:
             params: Request parameters
             request_id: Request ID
         """
-        try:
-            result = None
-
-            if method == 'roots/list':
-                # Return client roots
-                result = {
-                    'roots': [
-                        {
-                            'uri': root if root.startswith('file://') else f"file://{root}",
-                            'name': root.split('/')[-1] or root,
-                        }
-                        for root in self._roots
-                    ]
-                }
-
-            elif method == 'sampling/createMessage':
-                # Handle sampling request
-                if not self._sampling_handler:
-                    raise MCPProtocolError("Sampling not supported - no handler configured")
-
-                sampling_result = await self._sampling_handler(params)
-
-                result = {
-                    'role': 'assistant',
-                    'content': {
-                        'type': 'text',
-                        'text': sampling_result,
-                    }
-                }
+        if method == _M_ROOTS_LIST:
+            # Fast path: the reply is precomputed and can't fail, so queue
+            # it without the generic handler machinery
+            frame = _RESULT_FRAME % (_encode(request_id), self._roots_json)
+            try:
+                self._out_queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                await self._out_queue.put(frame)
+            return
 
-            else:
+        try:
+            handler_name = self._REQUEST_HANDLERS.get(method)
+            if handler_name is None:
                 raise MCPProtocolError(f"Unknown server request method: {method}")
 
+            result = await getattr(self, handler_name)(params)
+
             # Send success response
             await self._send_response(request_id, result)
 
         except Exception as e:
-            logger.error(f"[{self.server_id}] Error handling server request {method}: {e}")
+            logger.error("[%s] Error handling server request %s: %s", self.server_id, method, e)
             await self._send_error_response(request_id, -32603, str(e))
 
+    async def _handle_sampling(self, params: dict) -> dict:
+        """Handle a sampling/createMessage request.
+
+        Args:
+            params: Sampling request parameters
+
+        Returns:
+            Assistant message result
+
+        Raises:
+            MCPProtocolError: If no sampling handler is configured
+        """
+        if not self._sampling_handler:
+            raise MCPProtocolError("Sampling not supported - no handler configured")
+
+        sampling_result = await self._sampling_handler(params)
+
+        return {
+            'role': 'assistant',
+            'content': {
+                'type': 'text',
+                'text': sampling_result,
+            }
+        }
+
     async def _send_request(self, method: str, params: Optional[dict] = None) -> Any:
         """Send request to server and wait for response.
 
@@ -339,47 +494,63 @@ class NativeMCPClient:
         Raises:
             MCPTimeoutError: If request times out
             MCPProtocolError: If server returns error
+            MCPConnectionError: If the process is not running
+            MCPBackpressureError: If too many requests are already in flight
         """
         if not self.process or not self.process.stdin:
             raise MCPConnectionError(f"Process not started for {self.server_id}")
+        if len(self._pending_requests) >= _MAX_IN_FLIGHT:
+            raise MCPBackpressureError(f"Too many in-flight requests for {self.server_id}")
 
-        msg_id = self._message_id
-        self._message_id += 1
+        msg_id = self._next_id()
 
-        request = {
-            'jsonrpc': '2.0',
-            'id': msg_id,
-            'method': method,
-            'params': params or {},
-        }
+        frame = _REQUEST_FRAME % (msg_id, _encode(method), _encode(params or {}))
 
         # Create future for response
-        future: asyncio.Future = asyncio.Future()
+        future: asyncio.Future = self._loop.create_future()
         self._pending_requests[msg_id] = future
 
         # Send request
-        request_text = json.dumps(request) + '\n'
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.process.stdin.write,
-                request_text.encode('utf-8'),
-            )
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.process.stdin.flush,
-            )
+            await self._write(frame)
         except Exception as e:
             self._pending_requests.pop(msg_id, None)
             raise MCPConnectionError(f"Failed to send request: {e}") from e
 
-        # Wait for response with timeout
+        # Wait for response; the shared timer fails the future on expiry
+        deadline = self._loop.time() + self.timeout
+        self._deadlines.append((deadline, msg_id, method))
+        handle = self._timeout_handle
+        if handle is None or deadline < handle.when():
+            if handle is not None:
+                handle.cancel()
+            self._timeout_handle = self._loop.call_at(deadline, self._expire_requests)
         try:
-            result = await asyncio.wait_for(future, timeout=self.timeout)
-            return result
-        except asyncio.TimeoutError:
+            return await future
+        finally:
+            # Also covers cancellation by an outer timeout
             self._pending_requests.pop(msg_id, None)
-            raise MCPTimeoutError(f"Request timeout: {method}") from None
+
+    def _expire_requests(self) -> None:
+        """Fail overdue requests and re-arm the timer for the next deadline.
+
+        Deadlines are in send order, so they are sorted unless the timeout
+        was lowered while older requests were in flight; such newer requests
+        then expire once the older ones have settled.
+        """
+        self._timeout_handle = None
+        now = self._loop.time()
+        deadlines = self._deadlines
+        pending = self._pending_requests
+        while deadlines:
+            deadline, msg_id, method = deadlines[0]
+            future = pending.get(msg_id)
+            if future is not None and deadline > now:
+                self._timeout_handle = self._loop.call_at(deadline, self._expire_requests)
+                return
+            deadlines.popleft()
+            if future is not None and not future.done():
+                future.set_exception(MCPTimeoutError(f"Request timeout: {method}"))
 
     async def _send_notification(self, method: str, params: Optional[dict] = None) -> None:
         """Send notification to server (no response expected).
@@ -391,31 +562,9 @@ class NativeMCPClient:
         if not self.process or not self.process.stdin:
             return
 
-        # Notification MUST NOT have an 'id' field according to JSONRPC 2.0
-        notification = {
-            'jsonrpc': '2.0',
-            'method': method,
-            'params': params or {},
-        }
-
-        # Explicitly ensure no 'id' field is present (defensive programming)
-        if 'id' in notification:
-            logger.error(
-                f"[{self.server_id}] Notification for '{method}' incorrectly contains 'id' field. "
-                f"Removing it to comply with JSONRPC 2.0."
-            )
-            del notification['id']
-
-        notification_text = json.dumps(notification) + '\n'
-        await asyncio.get_event_loop().run_in_executor(
-            None,
-            self.process.stdin.write,
-            notification_text.encode('utf-8'),
-        )
-        await asyncio.get_event_loop().run_in_executor(
-            None,
-            self.process.stdin.flush,
-        )
+        # Notification MUST NOT have an 'id' field according to JSONRPC 2.0;
+        # the frame template has none
+        await self._write(_NOTIFICATION_FRAME % (_encode(method), _encode(params or {})))
 
     async def _send_response(self, request_id: int, result: Any) -> None:
         """Send response to server request.
@@ -435,22 +584,7 @@ class NativeMCPClient:
             )
             return
 
-        response = {
-            'jsonrpc': '2.0',
-            'id': request_id,
-            'result': result,
-        }
-
-        response_text = json.dumps(response) + '\n'
-        await asyncio.get_event_loop().run_in_executor(
-            None,
-            self.process.stdin.write,
-            response_text.encode('utf-8'),
-        )
-        await asyncio.get_event_loop().run_in_executor(
-            None,
-            self.process.stdin.flush,
-        )
+        await self._write(_RESULT_FRAME % (_encode(request_id), _encode(result)))
 
     async def _send_error_response(self, request_id: int, code: int, message: str) -> None:
         """Send error response to server request.
@@ -471,25 +605,43 @@ class NativeMCPClient:
             )
             return
 
-        response = {
-            'jsonrpc': '2.0',
-            'id': request_id,
-            'error': {
-                'code': code,
-                'message': message,
-            },
-        }
+        error = {'code': code, 'message': message}
+        await self._write(_ERROR_FRAME % (_encode(request_id), _encode(error)))
 
-        response_text = json.dumps(response) + '\n'
-        await asyncio.get_event_loop().run_in_executor(
-            None,
-            self.process.stdin.write,
-            response_text.encode('utf-8'),
-        )
-        await asyncio.get_event_loop().run_in_executor(
-            None,
-            self.process.stdin.flush,
-        )
+    async def _write(self, data: bytes) -> None:
+        """Queue a serialized message for the writer task.
+
+        Args:
+            data: Newline-terminated JSON-RPC message
+
+        Raises:
+            MCPConnectionError: If the writer is no longer running
+        """
+        if self._writer_task is None or self._writer_task.done():
+            raise MCPConnectionError(f"Writer not running for {self.server_id}")
+        await self._out_queue.put(data)
+
+    async def _writer_loop(self) -> None:
+        """Write queued messages to stdin, coalescing bursts into one write."""
+        queue = self._out_queue
+        try:
+            while True:
+                frames = [await queue.get()]
+                while not queue.empty():
+                    frames.append(queue.get_nowait())
+
+                # Hand the frames over as-is; the transport gathers them
+                # into one write
+                self.process.stdin.writelines(frames)
+                await self.process.stdin.drain()
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"[{self.server_id}] Writer loop error: {e}")
+            self._reject_pending(MCPConnectionError(f"Failed to send to {self.server_id}: {e}"))
+        finally:
+            logger.info(f"[{self.server_id}] Writer loop ended")
 
     async def _initialize(self) -> None:
         """Initialize MCP connection."""
@@ -517,37 +669,38 @@ class NativeMCPClient:
         # Send initialized notification
         await self._send_notification('notifications/initialized')
 
-        # Fetch available resources
-        if self.capabilities.get('tools'):
-            try:
-                tools_result = await self._send_request('tools/list')
-                self.tools = tools_result.get('tools', [])
-                logger.info(f"[{self.server_id}] Found {len(self.tools)} tools")
-            except Exception as e:
-                logger.warning(f"[{self.server_id}] Failed to fetch tools: {e}")
+        # Fetch available resources concurrently. A capability is declared
+        # by its presence; an empty object (e.g. "tools": {}) still counts
+        discovery = []
+        if 'tools' in self.capabilities:
+            discovery.append(('tools', 'tools/list', 'tools', 'tools'))
+        if 'prompts' in self.capabilities:
+            discovery.append(('prompts', 'prompts/list', 'prompts', 'prompts'))
+        if 'resources' in self.capabilities:
+            discovery.append(('resources', 'resources/list', 'resources', 'resources'))
+            discovery.append((
+                'resource_templates',
+                'resources/templates/list',
+                'resourceTemplates',
+                'resource templates',
+            ))
+
+        results = await asyncio.gather(
+            *(self._send_request(method) for _, method, _, _ in discovery),
+            return_exceptions=True,
+        )
 
-        if self.capabilities.get('prompts'):
-            try:
-                prompts_result = await self._send_request('prompts/list')
-                self.prompts = prompts_result.get('prompts', [])
-                logger.info(f"[{self.server_id}] Found {len(self.prompts)} prompts")
-            except Exception as e:
-                logger.warning(f"[{self.server_id}] Failed to fetch prompts: {e}")
+        for (attr, method, key, label), result in zip(discovery, results):
+            if isinstance(result, BaseException):
+                if attr == 'resource_templates':
+                    logger.debug(f"[{self.server_id}] Resource templates not supported: {result}")
+                else:
+                    logger.warning(f"[{self.server_id}] Failed to fetch {label}: {result}")
+                continue
 
-        if self.capabilities.get('resources'):
-            try:
-                resources_result = await self._send_request('resources/list')
-                self.resources = resources_result.get('resources', [])
-                logger.info(f"[{self.server_id}] Found {len(self.resources)} resources")
-            except Exception as e:
-                logger.warning(f"[{self.server_id}] Failed to fetch resources: {e}")
-
-            try:
-                templates_result = await self._send_request('resources/templates/list')
-                self.resource_templates = templates_result.get('resourceTemplates', [])
-                logger.info(f"[{self.server_id}] Found {len(self.resource_templates)} resource templates")
-            except Exception as e:
-                logger.debug(f"[{self.server_id}] Resource templates not supported: {e}")
+            items = result.get(key, [])
+            setattr(self, attr, items)
+            logger.info(f"[{self.server_id}] Found {len(items)} {label}")
 
     async def call_tool(self, tool_name: str, arguments: dict) -> dict:
         """Call a tool on the server.
@@ -565,6 +718,36 @@ class NativeMCPClient:
         })
         return result
 
+    async def list_tools(self) -> list[dict]:
+        """Fetch the current tool list from the server.
+
+        Returns:
+            Tool descriptors
+        """
+        result = await self._send_request('tools/list')
+        self.tools = result.get('tools', [])
+        return self.tools
+
+    async def list_prompts(self) -> list[dict]:
+        """Fetch the current prompt list from the server.
+
+        Returns:
+            Prompt descriptors
+        """
+        result = await self._send_request('prompts/list')
+        self.prompts = result.get('prompts', [])
+        return self.prompts
+
+    async def list_resources(self) -> list[dict]:
+        """Fetch the current resource list from the server.
+
+        Returns:
+            Resource descriptors
+        """
+        result = await self._send_request('resources/list')
+        self.resources = result.get('resources', [])
+        return self.resources
+
     async def get_prompt(self, prompt_name: str, arguments: Optional[dict] = None) -> dict:
         """Get a prompt from the server.
 
@@ -595,6 +778,35 @@ class NativeMCPClient:
         })
         return result
 
+    async def ping(self, timeout: Optional[float] = None) -> None:
+        """Check that the server is responsive.
+
+        Args:
+            timeout: Seconds to wait for the reply (default: request timeout)
+
+        Raises:
+            MCPTimeoutError: If the server does not answer in time
+            MCPConnectionError: If the process is not running
+        """
+        if timeout is None:
+            await self._send_request('ping')
+            return
+
+        try:
+            await asyncio.wait_for(self._send_request('ping'), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise MCPTimeoutError("Request timeout: ping") from None
+
+    @property
+    def status_name(self) -> str:
+        """Lower-case string form of the status (e.g. "connected")."""
+        return self.status.name.lower()
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the server subprocess is still running."""
+        return self.process is not None and self.process.returncode is None
+
     def set_roots(self, roots: list[str]) -> None:
         """Set client roots.
 
@@ -602,6 +814,15 @@ class NativeMCPClient:
             roots: List of root paths
         """
         self._roots = roots
+        self._roots_json = _encode({
+            'roots': [
+                {
+                    'uri': root if root.startswith('file://') else f"file://{root}",
+                    'name': root.rsplit('/', 1)[-1] or root,
+                }
+                for root in roots
+            ]
+        })
 
     def set_sampling_handler(self, handler: Callable) -> None:
         """Set sampling handler.
@@ -611,6 +832,17 @@ class NativeMCPClient:
         """
         self._sampling_handler = handler
 
+    def _reject_pending(self, error: Exception) -> None:
+        """Fail all requests still waiting for a response.
+
+        Args:
+            error: Exception to set on each pending future
+        """
+        pending, self._pending_requests = self._pending_requests, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
     async def stop(self) -> None:
         """Stop the MCP client and cleanup resources."""
         logger.info(f"[{self.server_id}] Stopping...")
@@ -630,33 +862,36 @@ class NativeMCPClient:
             except asyncio.CancelledError:
                 pass
 
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+
         # Reject pending requests
-        for future in self._pending_requests.values():
-            if not future.done():
-                future.set_exception(MCPConnectionError("Client stopped"))
-        self._pending_requests.clear()
+        if self._timeout_handle is not None:
+            self._timeout_handle.cancel()
+            self._timeout_handle = None
+        self._deadlines.clear()
+        self._reject_pending(MCPConnectionError("Client stopped"))
 
         # Terminate process
         if self.process:
             try:
-                self.process.terminate()
+                if self.process.returncode is None:
+                    self.process.terminate()
                 try:
-                    await asyncio.wait_for(
-                        asyncio.get_event_loop().run_in_executor(None, self.process.wait),
-                        timeout=5.0,
-                    )
+                    await asyncio.wait_for(self.process.wait(), timeout=5.0)
                 except asyncio.TimeoutError:
                     logger.warning(f"[{self.server_id}] Process did not terminate, killing...")
                     self.process.kill()
-                    await asyncio.get_event_loop().run_in_executor(None, self.process.wait)
+                    await self.process.wait()
             except Exception as e:
                 logger.error(f"[{self.server_id}] Error stopping process: {e}")
 
             self.process = None
 
-        self.status = "stopped"
+        self.status = Status.STOPPED
         logger.info(f"[{self.server_id}] Stopped")
 
-
-# Import os for environment variables
-import os
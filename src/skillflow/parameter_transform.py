@@ -1,7 +1,10 @@
 """Parameter transformation utilities for JSONPath and Jinja2."""
 
+import ast
 import json
 import re
+from functools import lru_cache
+from types import CodeType
 from typing import Any, Optional
 
 try:
@@ -17,25 +20,183 @@ try:
 except ImportError:
     JINJA2_AVAILABLE = False
 
+# Optional orjson for faster parsing of JSON-shaped template output
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 
 class ParameterTransformError(Exception):
     """Error during parameter transformation."""
     pass
 
 
+# Shared Jinja2 environment; compiled templates are cached by source
+if JINJA2_AVAILABLE:
+    _JINJA_ENV = Environment(
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+else:
+    _JINJA_ENV = None
+
+# Any Jinja2 expression or statement delimiter marks a template condition
+_JINJA_RE = re.compile(r"\{[{%]")
+# A condition that is exactly one {{ expression }}
+_JINJA_EXPR_RE = re.compile(r"\{\{((?:(?!\}\}).)*)\}\}", re.DOTALL)
+
+
+@lru_cache(maxsize=512)
+def _compile_template(expression: str) -> "Template":
+    """Compile a Jinja2 template, memoizing the result by source.
+
+    Args:
+        expression: Jinja2 template string
+
+    Returns:
+        Compiled template
+    """
+    return _JINJA_ENV.from_string(expression)
+
+
+@lru_cache(maxsize=512)
+def _condition_source(condition: str) -> str:
+    """Build the template source used to evaluate a Jinja2 condition.
+
+    Args:
+        condition: Jinja2 condition
+
+    Returns:
+        ``{% if expr %}`` wrapper for a single ``{{ expr }}``, otherwise the
+        condition itself
+    """
+    match = _JINJA_EXPR_RE.fullmatch(condition)
+    if match:
+        return f"{{% if {match.group(1).strip()} %}}true{{% else %}}false{{% endif %}}"
+    return condition
+
+
+# Plain dotted paths such as "$" or "$.a.b" need no JSONPath engine
+_SIMPLE_PATH_RE = re.compile(r"\$(?:\.[A-Za-z_][A-Za-z_0-9]*)*")
+
+
+@lru_cache(maxsize=512)
+def _simple_path_keys(expression: str) -> Optional[tuple[str, ...]]:
+    """Split a plain dotted JSONPath into its keys.
+
+    Args:
+        expression: JSONPath expression
+
+    Returns:
+        Keys to walk from the root, or None if the expression needs the
+        full JSONPath engine
+    """
+    if _SIMPLE_PATH_RE.fullmatch(expression) is None:
+        return None
+    return tuple(expression.split(".")[1:])
+
+
+@lru_cache(maxsize=512)
+def _parse_jsonpath(expression: str) -> Any:
+    """Parse a JSONPath expression, memoizing the compiled path.
+
+    Args:
+        expression: JSONPath expression
+
+    Returns:
+        Parsed jsonpath-ng expression
+    """
+    return jsonpath_parse(expression)
+
+
+# AST nodes allowed in Python-like conditions: comparisons, boolean logic,
+# simple arithmetic, literals, lookups on context values and calls to the
+# safe builtins below. Other calls, comprehensions, lambdas and the like
+# are rejected before compiling.
+_CONDITION_NODES = (
+    ast.Expression, ast.Compare, ast.BoolOp, ast.UnaryOp, ast.BinOp,
+    ast.Name, ast.Load, ast.Constant, ast.Attribute, ast.Subscript,
+    ast.Slice, ast.List, ast.Tuple, ast.Call,
+    ast.And, ast.Or, ast.Not, ast.USub, ast.UAdd,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+    ast.In, ast.NotIn, ast.Is, ast.IsNot,
+)
+
+# Builtins conditions may call; everything else is unavailable
+_SAFE_BUILTINS = {
+    fn.__name__: fn for fn in (len, min, max, abs, str, int, float, bool)
+}
+_CONDITION_GLOBALS = {"__builtins__": {}, **_SAFE_BUILTINS}
+
+
+@lru_cache(maxsize=512)
+def _compile_condition(condition: str) -> CodeType:
+    """Parse, validate and compile a Python-like condition.
+
+    Args:
+        condition: Condition expression
+
+    Returns:
+        Code object evaluating the condition against a context namespace
+
+    Raises:
+        ParameterTransformError: If the condition is not valid or uses
+            constructs outside the allowed subset
+    """
+    try:
+        tree = ast.parse(condition, mode="eval")
+    except SyntaxError as e:
+        raise ParameterTransformError(
+            f"Invalid condition '{condition}': {e.msg}"
+        ) from e
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _CONDITION_NODES):
+            raise ParameterTransformError(
+                f"Unsupported expression in condition '{condition}': "
+                f"{type(node).__name__}"
+            )
+        if isinstance(node, ast.Call) and not (
+            isinstance(node.func, ast.Name)
+            and node.func.id in _SAFE_BUILTINS
+            and not node.keywords
+        ):
+            raise ParameterTransformError(
+                f"Unsupported call in condition '{condition}'; only "
+                f"{', '.join(_SAFE_BUILTINS)} may be called"
+            )
+        if isinstance(node, ast.Attribute) and node.attr.startswith("_"):
+            raise ParameterTransformError(
+                f"Private attribute access in condition '{condition}': {node.attr}"
+            )
+
+    return compile(tree, "<condition>", "eval")
+
+
 class ParameterTransformer:
     """Handles parameter transformations using JSONPath or Jinja2."""
 
     def __init__(self):
         """Initialize the parameter transformer."""
-        if JINJA2_AVAILABLE:
-            self.jinja_env = Environment(
-                autoescape=False,
-                trim_blocks=True,
-                lstrip_blocks=True,
-            )
-        else:
-            self.jinja_env = None
+        self.jinja_env = _JINJA_ENV
+
+        # Engine name -> bound transform method
+        self._engines = {
+            "jsonpath": self._transform_jsonpath,
+            "jinja2": self._transform_jinja2,
+        }
+        # Condition kind -> bound evaluator
+        self._condition_evaluators = {
+            "jinja2": self._evaluate_jinja2_condition,
+            "jsonpath": self._evaluate_jsonpath_condition,
+            "python": self._evaluate_python_condition,
+        }
 
     def transform(
         self,
@@ -43,6 +204,7 @@ class ParameterTransformer:
         engine: str,
         expression: Optional[str] = None,
         context: Optional[dict[str, Any]] = None,
+        parse_json: bool = True,
     ) -> Any:
         """Transform a value using the specified engine.
 
@@ -51,6 +213,7 @@ class ParameterTransformer:
             engine: Transformation engine ("jsonpath", "jinja2", or "none")
             expression: The transformation expression
             context: Additional context for the transformation
+            parse_json: Parse JSON-looking Jinja2 output into data
 
         Returns:
             Transformed value
@@ -61,18 +224,17 @@ class ParameterTransformer:
         if engine == "none" or expression is None:
             return value
 
-        if engine == "jsonpath":
-            return self._transform_jsonpath(value, expression, context)
-        elif engine == "jinja2":
-            return self._transform_jinja2(value, expression, context)
-        else:
+        transform = self._engines.get(engine)
+        if transform is None:
             raise ParameterTransformError(f"Unknown transformation engine: {engine}")
+        return transform(value, expression, context, parse_json)
 
     def _transform_jsonpath(
         self,
         value: Any,
         expression: str,
         context: Optional[dict[str, Any]] = None,
+        parse_json: bool = True,
     ) -> Any:
         """Transform value using JSONPath.
 
@@ -80,6 +242,7 @@ class ParameterTransformer:
             value: The value to query
             expression: JSONPath expression
             context: Additional context (not used for JSONPath)
+            parse_json: Not used for JSONPath
 
         Returns:
             Extracted value(s)
@@ -87,6 +250,15 @@ class ParameterTransformer:
         Raises:
             ParameterTransformError: If JSONPath is not available or query fails
         """
+        keys = _simple_path_keys(expression)
+        if keys is not None:
+            # Walk dict keys directly; a missing key means no match
+            for key in keys:
+                if not isinstance(value, dict) or key not in value:
+                    return None
+                value = value[key]
+            return value
+
         if not JSONPATH_AVAILABLE:
             raise ParameterTransformError(
                 "JSONPath transformation requires jsonpath-ng package. "
@@ -94,8 +266,8 @@ class ParameterTransformer:
             )
 
         try:
-            # Parse the JSONPath expression
-            jsonpath_expr = jsonpath_parse(expression)
+            # Parse the JSONPath expression (cached across calls)
+            jsonpath_expr = _parse_jsonpath(expression)
 
             # Execute the query
             matches = jsonpath_expr.find(value)
@@ -118,6 +290,7 @@ class ParameterTransformer:
         value: Any,
         expression: str,
         context: Optional[dict[str, Any]] = None,
+        parse_json: bool = True,
     ) -> Any:
         """Transform value using Jinja2 template.
 
@@ -125,6 +298,8 @@ class ParameterTransformer:
             value: The value to use in template
             expression: Jinja2 template string
             context: Additional context variables
+            parse_json: Parse output that looks like a JSON object or array;
+                pass False when the caller wants the rendered string
 
         Returns:
             Rendered template result
@@ -148,17 +323,18 @@ class ParameterTransformer:
                 **(context or {}),
             }
 
-            # Render the template
-            template = self.jinja_env.from_string(expression)
-            result = template.render(template_context)
+            # Render the template, compiling it on first use
+            result = _compile_template(expression).render(template_context)
 
             # Try to parse as JSON if it looks like JSON
             result = result.strip()
-            if result.startswith(("{", "[")):
-                try:
-                    return json.loads(result)
-                except json.JSONDecodeError:
-                    pass
+            if parse_json:
+                first = result[:1]
+                if first == "{" or first == "[":
+                    try:
+                        return _loads(result)
+                    except ValueError:
+                        pass
 
             return result
 
@@ -194,25 +370,33 @@ class ParameterTransformer:
             ParameterTransformError: If evaluation fails
         """
         condition = condition.strip()
+        if _JINJA_RE.search(condition):
+            kind = "jinja2"
+        elif condition[:1] == "$":
+            kind = "jsonpath"
+        else:
+            kind = "python"
+        return self._condition_evaluators[kind](condition, context)
 
-        # Try Jinja2 if it looks like a template
-        if "{{" in condition or "{%" in condition:
-            result = self._transform_jinja2(context, f"{{% if {condition} %}}true{{% else %}}false{{% endif %}}", context)
-            return result == "true"
+    def _evaluate_jinja2_condition(self, condition: str, context: dict[str, Any]) -> bool:
+        """Evaluate a Jinja2 condition.
 
-        # Try JSONPath if it starts with $
-        if condition.startswith("$"):
-            result = self._transform_jsonpath(context, condition, context)
-            return bool(result)
+        A single ``{{ expr }}`` is tested with ``{% if expr %}``; any other
+        template is rendered and is true when it produces "true".
+        """
+        result = self._transform_jinja2(context, _condition_source(condition), context)
+        return isinstance(result, str) and result.lower() == "true"
 
-        # Try simple comparison evaluation
-        try:
-            # Replace variable names with context lookups
-            # This is a simplified evaluation - in production, consider using a safer evaluator
-            for key in context:
-                condition = condition.replace(key, f'context["{key}"]')
+    def _evaluate_jsonpath_condition(self, condition: str, context: dict[str, Any]) -> bool:
+        """Evaluate a JSONPath condition as the truthiness of its result."""
+        return bool(self._transform_jsonpath(context, condition, context))
 
-            return bool(eval(condition, {"context": context}))
+    def _evaluate_python_condition(self, condition: str, context: dict[str, Any]) -> bool:
+        """Evaluate a restricted Python expression against the context."""
+        # Names resolve directly against the context
+        code = _compile_condition(condition)
+        try:
+            return bool(eval(code, _CONDITION_GLOBALS, context))
         except Exception as e:
             raise ParameterTransformError(
                 f"Failed to evaluate condition '{condition}': {str(e)}"
@@ -228,6 +412,7 @@ def transform_parameter(
     engine: str = "none",
     expression: Optional[str] = None,
     context: Optional[dict[str, Any]] = None,
+    parse_json: bool = True,
 ) -> Any:
     """Transform a parameter value.
 
@@ -236,11 +421,15 @@ def transform_parameter(
         engine: Transformation engine
         expression: Transformation expression
         context: Additional context
+        parse_json: Parse JSON-looking Jinja2 output into data
 
     Returns:
         Transformed value
     """
-    return _transformer.transform(value, engine, expression, context)
+    # Pass-through is the common case; skip the method call entirely
+    if engine == "none" or expression is None:
+        return value
+    return _transformer.transform(value, engine, expression, context, parse_json)
 
 
 def evaluate_condition(condition: str, context: dict[str, Any]) -> bool:
@@ -1,9 +1,12 @@
 """Recording session management module."""
 
-import asyncio
+import re
+import secrets
+import time
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Optional
-from uuid import uuid4
 
 from .schemas import (
     ConcurrencyMode,
@@ -22,6 +25,26 @@ from .schemas import (
 )
 from .storage import SessionNotFoundError, StorageLayer
 
+# Exposed parameter source paths look like "logs[2].args.text"
+_SOURCE_PATH_RE = re.compile(r"logs\[(\d+)\]\.args\.([^.]+)")
+
+
+@lru_cache(maxsize=256)
+def _parse_source_path(source_path: str) -> Optional[tuple[int, str]]:
+    """Parse a parameter source path.
+
+    Args:
+        source_path: Path of the form ``logs[N].args.field``
+
+    Returns:
+        Tuple of (1-based log index, arg name), or None if the path is not
+        an args reference
+    """
+    match = _SOURCE_PATH_RE.match(source_path)
+    if match is None:
+        return None
+    return int(match.group(1)), match.group(2)
+
 
 class RecordingManager:
     """Manages recording sessions and skill draft generation."""
@@ -34,7 +57,6 @@ class RecordingManager:
         """
         self.storage = storage
         self._active_sessions: dict[str, RecordingSession] = {}
-        self._session_locks: dict[str, asyncio.Lock] = {}
 
     async def start_session(
         self,
@@ -50,7 +72,8 @@ class RecordingManager:
         Returns:
             Session ID
         """
-        session_id = f"session_{datetime.utcnow().strftime('%Y-%m-%dT%H-%M-%S')}_{uuid4().hex[:8]}"
+        stamp = time.strftime("%Y-%m-%dT%H-%M-%S", time.gmtime())
+        session_id = f"session_{stamp}_{secrets.token_hex(4)}"
 
         session = RecordingSession(
             id=session_id,
@@ -64,7 +87,6 @@ class RecordingManager:
             session.metadata["name"] = session_name
 
         self._active_sessions[session_id] = session
-        self._session_locks[session_id] = asyncio.Lock()
 
         return session_id
 
@@ -80,19 +102,21 @@ class RecordingManager:
         Raises:
             SessionNotFoundError: If session not found
         """
-        if session_id not in self._active_sessions:
+        # Claiming the session with pop() ends recording for it atomically;
+        # later record_tool_call calls see it as inactive
+        session = self._active_sessions.pop(session_id, None)
+        if session is None:
             raise SessionNotFoundError(f"Active session {session_id} not found")
 
-        async with self._session_locks[session_id]:
-            session = self._active_sessions[session_id]
-            session.ended_at = datetime.utcnow()
+        session.ended_at = datetime.utcnow()
 
-            # Persist to storage
+        # Persist to storage, keeping the session active if that fails
+        try:
             await self.storage.save_session(session)
-
-            # Clean up
-            del self._active_sessions[session_id]
-            del self._session_locks[session_id]
+        except BaseException:
+            session.ended_at = None
+            self._active_sessions[session_id] = session
+            raise
 
         return session
 
@@ -106,6 +130,7 @@ class RecordingManager:
         error: Optional[str] = None,
         duration_ms: float = 0,
         status: ToolCallStatus = ToolCallStatus.SUCCESS,
+        timestamp: Optional[datetime] = None,
     ) -> None:
         """Record a tool call in an active session.
 
@@ -118,27 +143,29 @@ class RecordingManager:
             error: Error message if failed (optional)
             duration_ms: Execution duration in milliseconds
             status: Execution status
+            timestamp: When the call was made (defaults to now, UTC)
         """
-        if session_id not in self._active_sessions:
+        # No await between the lookup and the append, so this cannot
+        # interleave with stop_session on the event loop
+        session = self._active_sessions.get(session_id)
+        if session is None:
             # Session not active, skip recording
             return
 
-        async with self._session_locks[session_id]:
-            session = self._active_sessions[session_id]
-
-            log = ToolCallLog(
-                index=len(session.logs) + 1,
-                timestamp=datetime.utcnow(),
-                server=server,
-                tool=tool,
-                args=args,
-                result_summary=result or {},
-                error=error,
-                duration_ms=duration_ms,
-                status=status,
-            )
-
-            session.logs.append(log)
+        index = session._next_index
+        session._next_index = index + 1
+
+        session.logs.append(ToolCallLog(
+            index=index,
+            timestamp=timestamp or datetime.utcnow(),
+            server=server,
+            tool=tool,
+            args=args,
+            result_summary=result or {},
+            error=error,
+            duration_ms=duration_ms,
+            status=status,
+        ))
 
     async def get_active_session(self, session_id: str) -> Optional[RecordingSession]:
         """Get an active recording session.
@@ -197,32 +224,41 @@ class RecordingManager:
 
         # Select logs
         selected_logs = self._select_logs(session, selection)
+        expose_params = expose_params or []
+
+        # Steps whose args get templated need their own copy of the args;
+        # the rest can share the recorded dict
+        targeted = {
+            parsed[0]
+            for parsed in (_parse_source_path(p.source_path) for p in expose_params)
+            if parsed is not None
+        }
 
-        # Generate graph nodes
-        nodes = []
-        for i, log in enumerate(selected_logs):
-            node = SkillNode(
-                id=f"step_{i + 1}",
+        # Generate graph nodes. Logs were validated when recorded, so
+        # build the models without re-running validation.
+        construct_node = SkillNode.model_construct
+        nodes = [
+            construct_node(
+                id=f"step_{i}",
                 kind=NodeKind.TOOL_CALL,
                 server=log.server,
                 tool=log.tool,
-                args_template=log.args,  # Will be templated later
+                args_template=dict(log.args) if i in targeted else log.args,
                 export_outputs={},  # Will be populated if needed
             )
-            nodes.append(node)
+            for i, log in enumerate(selected_logs, 1)
+        ]
 
         # Generate linear edges (sequential execution)
-        edges = []
-        for i in range(len(nodes) - 1):
-            edge = SkillEdge(
-                from_node=nodes[i].id,
-                to_node=nodes[i + 1].id,
-            )
-            edges.append(edge)
+        construct_edge = SkillEdge.model_construct
+        edges = [
+            construct_edge(from_node=source.id, to_node=target.id)
+            for source, target in zip(nodes, nodes[1:])
+        ]
 
         # Apply parameter templating
-        inputs_schema = self._build_inputs_schema(expose_params or [])
-        self._apply_param_templates(nodes, expose_params or [])
+        inputs_schema = self._build_inputs_schema(expose_params)
+        self._apply_param_templates(nodes, expose_params)
 
         # Build graph with configured concurrency
         # Convert string mode to enum
@@ -281,14 +317,19 @@ class RecordingManager:
             return session.logs
 
         logs = session.logs
+        count = len(logs)
 
-        # Filter by indices
+        # Filter by indices (1-based, in the caller's order)
         if selection.indices is not None:
-            return [logs[i - 1] for i in selection.indices if 1 <= i <= len(logs)]
-
-        # Filter by range
-        start = (selection.start_index or 1) - 1
-        end = selection.end_index or len(logs)
+            positions = [i - 1 for i in selection.indices if 1 <= i <= count]
+            if len(positions) <= 1:
+                return [logs[i] for i in positions]
+            # Gather all positions in one C-level call
+            return list(itemgetter(*positions)(logs))
+
+        # Filter by range, clamped to the available logs
+        start = max(0, (selection.start_index or 1) - 1)
+        end = min(count, selection.end_index or count)
         return logs[start:end]
 
     def _build_inputs_schema(self, expose_params: list[ExposeParamSpec]) -> dict[str, Any]:
@@ -300,20 +341,17 @@ class RecordingManager:
         Returns:
             JSON Schema for inputs
         """
-        if not expose_params:
-            return {
-                "type": "object",
-                "properties": {},
-                "required": [],
-            }
-
         properties = {}
         required = []
 
         for param in expose_params:
-            properties[param.name] = param.schema_
+            schema = param.schema_
+            properties[param.name] = schema
             # Simple heuristic: if schema doesn't allow null, it's required
-            if param.schema_.get("type") != "null" and "null" not in param.schema_.get("type", []):
+            schema_type = schema.get("type")
+            if schema_type != "null" and not (
+                isinstance(schema_type, list) and "null" in schema_type
+            ):
                 required.append(param.name)
 
         return {
@@ -336,35 +374,14 @@ class RecordingManager:
             expose_params: Parameters being exposed
         """
         for param in expose_params:
-            # Parse source path (e.g., "logs[2].args.text")
-            # For simplicity, we'll use a basic implementation
-            # In production, use a proper JSONPath library
-
-            if not param.source_path.startswith("logs["):
+            parsed = _parse_source_path(param.source_path)
+            if parsed is None:
+                # Skip invalid paths
                 continue
 
-            try:
-                # Extract index: logs[N].args.field
-                parts = param.source_path.split("]", 1)
-                index_str = parts[0].replace("logs[", "")
-                log_index = int(index_str)
-
-                if "." not in parts[1]:
-                    continue
-
-                # Extract field path: .args.field -> ["args", "field"]
-                field_path = parts[1].lstrip(".").split(".")
-
-                if log_index <= 0 or log_index > len(nodes):
-                    continue
-
-                # Replace in corresponding node
-                node = nodes[log_index - 1]
-                if field_path[0] == "args" and len(field_path) > 1:
-                    arg_name = field_path[1]
-                    # Replace value with template
-                    node.args_template[arg_name] = f"$inputs.{param.name}"
-
-            except (ValueError, IndexError, KeyError):
-                # Skip invalid paths
+            log_index, arg_name = parsed
+            if log_index <= 0 or log_index > len(nodes):
                 continue
+
+            # Replace value with template in the corresponding node
+            nodes[log_index - 1].args_template[arg_name] = f"$inputs.{param.name}"
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 # ========== Recording Session Models ==========
@@ -19,6 +19,8 @@ class ToolCallStatus(str, Enum):
 
 class ToolCallLog(BaseModel):
     """A single tool call log entry in a recording session."""
+    model_config = ConfigDict(frozen=True)
+
     index: int
     timestamp: datetime
     server: str
@@ -47,6 +49,9 @@ class RecordingSession(BaseModel):
     logs: list[ToolCallLog] = Field(default_factory=list)
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    # Index for the next recorded log while the session is active
+    _next_index: int = PrivateAttr(default=1)
+
 
 # ========== Skill Models ==========
 
@@ -130,6 +135,8 @@ class LoopConfig(BaseModel):
 
 class SkillNode(BaseModel):
     """A single node in the skill execution graph."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     kind: NodeKind
     server: Optional[str] = None  # None for local tools
@@ -154,8 +161,7 @@ class SkillEdge(BaseModel):
     to_node: str = Field(alias="to")
     condition: Optional[str] = None  # JSONPath condition
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class ConcurrencyMode(str, Enum):
@@ -230,6 +236,8 @@ class NodeStatus(str, Enum):
 
 class NodeExecution(BaseModel):
     """Execution record for a single node."""
+    model_config = ConfigDict(frozen=True)
+
     run_id: str
     skill_id: str
     version: int
@@ -2,9 +2,11 @@
 
 import asyncio
 import hashlib
+import json
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from mcp.server import Server
 from mcp.types import Tool, TextContent, ImageContent, AudioContent, EmbeddedResource
@@ -32,6 +34,56 @@ from .upstream_tool_cache import UpstreamToolCache
 from .file_watcher import FileWatcher
 from .config_utils import ConfigValidator, ConfigConverter, ConfigExporter
 
+# Optional faster event loop (not available on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def _convert_content_item(item: Any) -> Any:
+    """Convert one upstream MCP content item to a Content object.
+
+    Supports all MCP content types: text, image, audio, resource.
+
+    Args:
+        item: Content item from an upstream tool result
+
+    Returns:
+        Matching Content object; unknown types are rendered as text
+    """
+    if not isinstance(item, dict):
+        # Not a dict: convert to text
+        return TextContent(type="text", text=str(item))
+
+    content_type = item.get("type", "text")
+
+    if content_type == "text":
+        # TextContent: text messages
+        return TextContent(type="text", text=item.get("text", str(item)))
+    if content_type == "image":
+        # ImageContent: images (screenshots, charts, etc.)
+        return ImageContent(
+            type="image",
+            data=item.get("data", ""),
+            mimeType=item.get("mimeType", "image/png"),
+        )
+    if content_type == "audio":
+        # AudioContent: audio files (recordings, TTS, etc.)
+        return AudioContent(
+            type="audio",
+            data=item.get("data", ""),
+            mimeType=item.get("mimeType", "audio/wav"),
+        )
+    if content_type == "resource":
+        # EmbeddedResource: embedded resources (files, data, etc.)
+        return EmbeddedResource(type="resource", resource=item.get("resource", {}))
+
+    # Unknown type: convert to text for safety
+    # This ensures forward compatibility with future content types
+    return TextContent(type="text", text=json.dumps(item, indent=2, ensure_ascii=False))
+
 
 class SkillFlowServer:
     """Main SkillFlow MCP Server."""
@@ -79,6 +131,43 @@ class SkillFlowServer:
             poll_interval=2.0  # Check every 2 seconds
         )
 
+        # Management tool handlers, dispatched by name from handle_tool_call
+        self._tool_handlers: dict[str, Callable[[dict[str, Any]], Awaitable[list[TextContent]]]] = {
+            "start_recording": self._handle_start_recording,
+            "stop_recording": self._handle_stop_recording,
+            "list_recording_sessions": self._handle_list_recording_sessions,
+            "create_skill_from_session": self._handle_create_skill_from_session,
+            "list_skills": self._handle_list_skills,
+            "get_skill": self._handle_get_skill,
+            "delete_skill": self._handle_delete_skill,
+            "get_run_status": self._handle_get_run_status,
+            "cancel_run": self._handle_cancel_run,
+            "register_upstream_server": self._handle_register_upstream_server,
+            "list_upstream_servers": self._handle_list_upstream_servers,
+            "list_upstream_resources": self._handle_list_upstream_resources,
+            "read_upstream_resource": self._handle_read_upstream_resource,
+            "list_upstream_prompts": self._handle_list_upstream_prompts,
+            "get_upstream_prompt": self._handle_get_upstream_prompt,
+            "debug_upstream_tools": self._handle_debug_upstream_tools,
+            "debug_skill_tools": self._handle_debug_skill_tools,
+            "debug_skill_definition": self._handle_debug_skill_definition,
+            "debug_skill_execution": self._handle_debug_skill_execution,
+            "debug_recording_session": self._handle_debug_recording_session,
+            "get_cache_stats": self._handle_get_cache_stats,
+            "invalidate_cache": self._handle_invalidate_cache,
+            "refresh_upstream_tools": self._handle_refresh_upstream_tools,
+            "debug_registry": self._handle_debug_registry,
+            "get_skill_cache_stats": self._handle_get_skill_cache_stats,
+            "invalidate_skill_cache": self._handle_invalidate_skill_cache,
+            "force_skill_reload": self._handle_force_skill_reload,
+            "trigger_hot_reload": self._handle_trigger_hot_reload,
+            "import_claude_code_config": self._handle_import_claude_code_config,
+            "export_claude_code_config": self._handle_export_claude_code_config,
+            "validate_mcp_config": self._handle_validate_mcp_config,
+            "add_mcp_server": self._handle_add_mcp_server,
+            "remove_mcp_server": self._handle_remove_mcp_server,
+        }
+
         # Register tools
         self._register_tools()
         self._setup_list_tools()
@@ -196,20 +285,16 @@ class SkillFlowServer:
         Returns:
             Tool result
         """
-        # Record if in recording mode
-        if self.active_recording_session:
-            start_time = datetime.utcnow()
-
-        # Track timing for metrics
-        import time
-        tool_start = time.time()
+        # Wall-clock start for the recording log; durations use perf_counter
+        started_at = datetime.utcnow() if self.active_recording_session else None
+        tool_start = time.perf_counter()
 
         try:
             # Execute via MCP client
             result = await self.mcp_clients.call_tool(server_id, tool_name, args)
 
             # Calculate duration
-            duration_ms = (time.time() - tool_start) * 1000
+            duration_ms = (time.perf_counter() - tool_start) * 1000.0
 
             # Record metrics
             self.metrics.tool_call_completed(tool_name, duration_ms)
@@ -225,22 +310,22 @@ class SkillFlowServer:
 
             # Record success
             if self.active_recording_session:
-                duration = (datetime.utcnow() - start_time).total_seconds() * 1000
                 await self.recording_manager.record_tool_call(
                     session_id=self.active_recording_session,
                     server=server_id or "local",
                     tool=tool_name,
                     args=args,
                     result=result,
-                    duration_ms=duration,
+                    duration_ms=duration_ms,
                     status=ToolCallStatus.SUCCESS,
+                    timestamp=started_at,
                 )
 
             return result
 
         except Exception as e:
             # Calculate duration
-            duration_ms = (time.time() - tool_start) * 1000
+            duration_ms = (time.perf_counter() - tool_start) * 1000.0
 
             # Log audit event for failure
             self.audit.log_event(
@@ -255,15 +340,15 @@ class SkillFlowServer:
 
             # Record error
             if self.active_recording_session:
-                duration = (datetime.utcnow() - start_time).total_seconds() * 1000
                 await self.recording_manager.record_tool_call(
                     session_id=self.active_recording_session,
                     server=server_id or "local",
                     tool=tool_name,
                     args=args,
                     error=str(e),
-                    duration_ms=duration,
+                    duration_ms=duration_ms,
                     status=ToolCallStatus.ERROR,
+                    timestamp=started_at,
                 )
             raise
 
@@ -280,8 +365,7 @@ class SkillFlowServer:
                 skill_id = tool_name[7:]  # Remove "skill__" prefix
 
                 # Track execution start
-                import time
-                exec_start = time.time()
+                exec_start = time.perf_counter()
                 self.metrics.execution_started()
 
                 # Log execution start
@@ -298,7 +382,7 @@ class SkillFlowServer:
                     result = await self.engine.run_skill(skill, arguments)
 
                     # Track execution completion
-                    duration_ms = (time.time() - exec_start) * 1000
+                    duration_ms = (time.perf_counter() - exec_start) * 1000
                     self.metrics.execution_completed(duration_ms, success=True)
 
                     # Log completion
@@ -318,7 +402,7 @@ class SkillFlowServer:
                     )]
                 except Exception as e:
                     # Track execution failure
-                    duration_ms = (time.time() - exec_start) * 1000
+                    duration_ms = (time.perf_counter() - exec_start) * 1000
                     self.metrics.execution_completed(duration_ms, success=False)
 
                     # Log failure
@@ -347,57 +431,10 @@ class SkillFlowServer:
                     # Convert upstream MCP result to Content objects
                     # MCP protocol returns: {'content': [...], 'isError': bool}
                     # Support all MCP content types: text, image, audio, resource
-                    import json
                     if isinstance(result, dict):
                         content = result.get("content", [])
                         if isinstance(content, list) and len(content) > 0:
-                            # Convert each content item to appropriate Content type
-                            converted_content = []
-                            for item in content:
-                                if isinstance(item, dict):
-                                    content_type = item.get("type", "text")
-
-                                    if content_type == "text":
-                                        # TextContent: text messages
-                                        converted_content.append(TextContent(
-                                            type="text",
-                                            text=item.get("text", str(item)),
-                                        ))
-                                    elif content_type == "image":
-                                        # ImageContent: images (screenshots, charts, etc.)
-                                        converted_content.append(ImageContent(
-                                            type="image",
-                                            data=item.get("data", ""),
-                                            mimeType=item.get("mimeType", "image/png"),
-                                        ))
-                                    elif content_type == "audio":
-                                        # AudioContent: audio files (recordings, TTS, etc.)
-                                        converted_content.append(AudioContent(
-                                            type="audio",
-                                            data=item.get("data", ""),
-                                            mimeType=item.get("mimeType", "audio/wav"),
-                                        ))
-                                    elif content_type == "resource":
-                                        # EmbeddedResource: embedded resources (files, data, etc.)
-                                        converted_content.append(EmbeddedResource(
-                                            type="resource",
-                                            resource=item.get("resource", {}),
-                                        ))
-                                    else:
-                                        # Unknown type: convert to text for safety
-                                        # This ensures forward compatibility with future content types
-                                        converted_content.append(TextContent(
-                                            type="text",
-                                            text=json.dumps(item, indent=2, ensure_ascii=False),
-                                        ))
-                                else:
-                                    # Not a dict: convert to text
-                                    converted_content.append(TextContent(
-                                        type="text",
-                                        text=str(item),
-                                    ))
-
-                            return converted_content
+                            return [_convert_content_item(item) for item in content]
                         else:
                             # No content or empty: return formatted result
                             return [TextContent(type="text", text=json.dumps(result, indent=2, ensure_ascii=False))]
@@ -407,1054 +444,1040 @@ class SkillFlowServer:
                 except Exception as e:
                     return [TextContent(type="text", text=f"Error calling upstream tool: {str(e)}")]
 
-            # ========== Recording Tools ==========
-            if tool_name == "start_recording":
-                session_name = arguments.get("session_name")
+            # ========== Management Tools ==========
+            handler = self._tool_handlers.get(tool_name)
+            if handler:
+                return await handler(arguments)
 
-                context = RecordingContext(
-                    client_id="default-client",
-                    workspace_id="default",
+            # Unknown tool name
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Unknown tool: {tool_name}",
                 )
+            ]
 
-                session_id = await self.recording_manager.start_session(context, session_name)
-                self.active_recording_session = session_id
-
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Recording started. Session ID: {session_id}",
-                    )
-                ]
-
-            if tool_name == "stop_recording":
-                if not self.active_recording_session:
-                    return [TextContent(type="text", text="No active recording session")]
+    # ========== Recording Tools ==========
+    async def _handle_start_recording(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Handle the start_recording tool."""
+        session_name = arguments.get("session_name")
 
-                session = await self.recording_manager.stop_session(self.active_recording_session)
-                session_id = self.active_recording_session
-                self.active_recording_session = None
+        context = RecordingContext(
+            client_id="default-client",
+            workspace_id="default",
+        )
 
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Recording stopped. Session ID: {session_id}, Total calls: {len(session.logs)}",
-                    )
-                ]
+        session_id = await self.recording_manager.start_session(context, session_name)
+        self.active_recording_session = session_id
 
-            if tool_name == "list_recording_sessions":
-                sessions = await self.storage.list_sessions()
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Found {len(sessions)} recording sessions:\n" + "\n".join(sessions),
-                    )
-                ]
-
-            # ========== Skill Management Tools ==========
-            if tool_name == "create_skill_from_session":
-                session_id = arguments["session_id"]
-                skill_id = arguments["skill_id"]
-                name = arguments["name"]
-                description = arguments["description"]
-                tags = arguments.get("tags") or []
-                expose_params = arguments.get("expose_params") or []
-
-                # Support step selection
-                step_indices = arguments.get("step_indices")
-                start_index = arguments.get("start_index")
-                end_index = arguments.get("end_index")
-
-                # Create StepSelection if any selection parameters provided
-                selection = None
-                if step_indices is not None or start_index is not None or end_index is not None:
-                    from .schemas import StepSelection
-                    selection = StepSelection(
-                        session_id=session_id,
-                        indices=step_indices,
-                        start_index=start_index,
-                        end_index=end_index,
-                    )
+        return [
+            TextContent(
+                type="text",
+                text=f"Recording started. Session ID: {session_id}",
+            )
+        ]
 
-                # Support concurrency mode configuration
-                concurrency_mode = arguments.get("concurrency_mode", "sequential")
-                concurrency_phases = arguments.get("concurrency_phases")  # For phased mode
-                max_parallel = arguments.get("max_parallel")  # For limiting parallelism
-
-                params = []
-                for p in expose_params:
-                    params.append(
-                        ExposeParamSpec(
-                            name=p["name"],
-                            description=p["description"],
-                            schema=p["schema"],
-                            source_path=p["source_path"],
-                        )
-                    )
+    async def _handle_stop_recording(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Handle the stop_recording tool."""
+        if not self.active_recording_session:
+            return [TextContent(type="text", text="No active recording session")]
 
-                draft = await self.recording_manager.to_skill_draft(
-                    session_id=session_id,
-                    skill_id=skill_id,
-                    name=name,
-                    description=description,
-                    selection=selection,
-                    expose_params=params,
-                    tags=tags,
-                    concurrency_mode=concurrency_mode,
-                    concurrency_phases=concurrency_phases,
-                    max_parallel=max_parallel,
-                )
+        session = await self.recording_manager.stop_session(self.active_recording_session)
+        session_id = self.active_recording_session
+        self.active_recording_session = None
 
-                author = SkillAuthor(
-                    workspace_id="default",
-                    client_id="default-client",
-                )
+        return [
+            TextContent(
+                type="text",
+                text=f"Recording stopped. Session ID: {session_id}, Total calls: {len(session.logs)}",
+            )
+        ]
+
+    async def _handle_list_recording_sessions(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Handle the list_recording_sessions tool."""
+        sessions = await self.storage.list_sessions()
+        return [
+            TextContent(
+                type="text",
+                text=f"Found {len(sessions)} recording sessions:\n" + "\n".join(sessions),
+            )
+        ]
+
+    # ========== Skill Management Tools ==========
+    async def _handle_create_skill_from_session(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Handle the create_skill_from_session tool."""
+        session_id = arguments["session_id"]
+        skill_id = arguments["skill_id"]
+        name = arguments["name"]
+        description = arguments["description"]
+        tags = arguments.get("tags") or []
+        expose_params = arguments.get("expose_params") or []
+
+        # Support step selection
+        step_indices = arguments.get("step_indices")
+        start_index = arguments.get("start_index")
+        end_index = arguments.get("end_index")
+
+        # Create StepSelection if any selection parameters provided
+        selection = None
+        if step_indices is not None or start_index is not None or end_index is not None:
+            from .schemas import StepSelection
+            selection = StepSelection(
+                session_id=session_id,
+                indices=step_indices,
+                start_index=start_index,
+                end_index=end_index,
+            )
 
-                skill = await self.skill_manager.create_skill(
-                    skill_id=skill_id,
-                    name=name,
-                    description=description,
-                    author=author,
-                    draft=draft,
+        # Support concurrency mode configuration
+        concurrency_mode = arguments.get("concurrency_mode", "sequential")
+        concurrency_phases = arguments.get("concurrency_phases")  # For phased mode
+        max_parallel = arguments.get("max_parallel")  # For limiting parallelism
+
+        params = []
+        for p in expose_params:
+            params.append(
+                ExposeParamSpec(
+                    name=p["name"],
+                    description=p["description"],
+                    schema=p["schema"],
+                    source_path=p["source_path"],
                 )
+            )
 
-                await self._register_skill_tools()
+        draft = await self.recording_manager.to_skill_draft(
+            session_id=session_id,
+            skill_id=skill_id,
+            name=name,
+            description=description,
+            selection=selection,
+            expose_params=params,
+            tags=tags,
+            concurrency_mode=concurrency_mode,
+            concurrency_phases=concurrency_phases,
+            max_parallel=max_parallel,
+        )
 
-                # Note: MCP servers cannot proactively notify clients of tool list changes
-                # Some clients (like Fount) cache the tool list and need manual refresh
-                return [
-                    TextContent(
-                        type="text",
-                        text=(
-                            f"✅ Skill created: {skill.id} (v{skill.version})\n"
-                            f"Tool name: skill__{skill.id}\n\n"
-                            f"⚠️ Note: If the tool doesn't appear in your client, try:\n"
-                            f"  1. Refresh the client's tool list\n"
-                            f"  2. Or call it directly: skill__{skill.id}\n"
-                            f"  3. Or restart the client if refresh doesn't work"
-                        ),
-                    )
-                ]
+        author = SkillAuthor(
+            workspace_id="default",
+            client_id="default-client",
+        )
 
-            if tool_name == "list_skills":
-                query = arguments.get("query")
-                tags = arguments.get("tags") or []
+        skill = await self.skill_manager.create_skill(
+            skill_id=skill_id,
+            name=name,
+            description=description,
+            author=author,
+            draft=draft,
+        )
 
-                filters = SkillFilter(query=query, tags=tags)
-                skills = await self.skill_manager.list_skills(filters)
+        await self._register_skill_tools()
 
-                if not skills:
-                    return [TextContent(type="text", text="No skills found")]
+        # Note: MCP servers cannot proactively notify clients of tool list changes
+        # Some clients (like Fount) cache the tool list and need manual refresh
+        return [
+            TextContent(
+                type="text",
+                text=(
+                    f"✅ Skill created: {skill.id} (v{skill.version})\n"
+                    f"Tool name: skill__{skill.id}\n\n"
+                    f"⚠️ Note: If the tool doesn't appear in your client, try:\n"
+                    f"  1. Refresh the client's tool list\n"
+                    f"  2. Or call it directly: skill__{skill.id}\n"
+                    f"  3. Or restart the client if refresh doesn't work"
+                ),
+            )
+        ]
 
-                lines = [f"Found {len(skills)} skills:\n"]
-                for skill in skills:
-                    lines.append(f"- {skill.id} (v{skill.version}): {skill.name}")
-                    lines.append(f"  {skill.description}")
-                    if skill.tags:
-                        lines.append(f"  Tags: {', '.join(skill.tags)}")
+    async def _handle_list_skills(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Handle the list_skills tool."""
+        query = arguments.get("query")
+        tags = arguments.get("tags") or []
 
-                return [TextContent(type="text", text="\n".join(lines))]
+        filters = SkillFilter(query=query, tags=tags)
+        skills = await self.skill_manager.list_skills(filters)
 
-            if tool_name == "get_skill":
-                skill_id = arguments["skill_id"]
-                version = arguments.get("version")
+        if not skills:
+            return [TextContent(type="text", text="No skills found")]
 
-                skill = await self.skill_manager.get_skill(skill_id, version)
+        lines = [f"Found {len(skills)} skills:\n"]
+        for skill in skills:
+            lines.append(f"- {skill.id} (v{skill.version}): {skill.name}")
+            lines.append(f"  {skill.description}")
+            if skill.tags:
+                lines.append(f"  Tags: {', '.join(skill.tags)}")
 
-                import json
+        return [TextContent(type="text", text="\n".join(lines))]
 
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(skill.model_dump(mode="json"), indent=2),
-                    )
-                ]
+    async def _handle_get_skill(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Handle the get_skill tool."""
+        skill_id = arguments["skill_id"]
+        version = arguments.get("version")
 
-            if tool_name == "delete_skill":
-                skill_id = arguments["skill_id"]
-                hard = arguments.get("hard", False)
+        skill = await self.skill_manager.get_skill(skill_id, version)
 
-                await self.skill_manager.delete_skill(skill_id, hard)
-                await self._register_skill_tools()
+        import json
 
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Skill {skill_id} deleted",
-                    )
-                ]
+        return [
+            TextContent(
+                type="text",
+                text=json.dumps(skill.model_dump(mode="json"), indent=2),
+            )
+        ]
 
-            # ========== Execution Tools ==========
-            if tool_name == "get_run_status":
-                run_id = arguments["run_id"]
+    async def _handle_delete_skill(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Handle the delete_skill tool."""
+        skill_id = arguments["skill_id"]
+        hard = arguments.get("hard", False)
 
-                status = await self.engine.get_run_status(run_id)
+        await self.skill_manager.delete_skill(skill_id, hard)
+        await self._register_skill_tools()
 
-                if not status:
-                    return [TextContent(type="text", text=f"Run {run_id} not found")]
+        return [
+            TextContent(
+                type="text",
+                text=f"Skill {skill_id} deleted",
+            )
+        ]
 
-                import json
+    # ========== Execution Tools ==========
+    async def _handle_get_run_status(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Handle the get_run_status tool."""
+        run_id = arguments["run_id"]
 
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(status.model_dump(mode="json"), indent=2),
-                    )
-                ]
+        status = await self.engine.get_run_status(run_id)
 
-            if tool_name == "cancel_run":
-                run_id = arguments["run_id"]
+        if not status:
+            return [TextContent(type="text", text=f"Run {run_id} not found")]
 
-                success = await self.engine.cancel_run(run_id)
+        import json
 
-                if success:
-                    return [TextContent(type="text", text=f"Run {run_id} cancelled")]
-                else:
-                    return [
-                        TextContent(
-                            type="text",
-                            text=f"Run {run_id} not found or already completed",
-                        )
-                    ]
+        return [
+            TextContent(
+                type="text",
+                text=json.dumps(status.model_dump(mode="json"), indent=2),
+            )
+        ]
 
-            # ========== Server Registry Tools ==========
-            if tool_name == "register_upstream_server":
-                server_id = arguments["server_id"]
-                name = arguments["name"]
-                transport = arguments["transport"]
-                config = arguments["config"]
+    async def _handle_cancel_run(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Handle the cancel_run tool."""
+        run_id = arguments["run_id"]
 
-                transport_type = TransportType(transport)
+        success = await self.engine.cancel_run(run_id)
 
-                await self.mcp_clients.register_server(
-                    server_id=server_id,
-                    name=name,
-                    transport=transport_type,
-                    config=config,
+        if success:
+            return [TextContent(type="text", text=f"Run {run_id} cancelled")]
+        else:
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Run {run_id} not found or already completed",
                 )
+            ]
 
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Server {server_id} registered",
-                    )
-                ]
+    # ========== Server Registry Tools ==========
+    async def _handle_register_upstream_server(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Handle the register_upstream_server tool."""
+        server_id = arguments["server_id"]
+        name = arguments["name"]
+        transport = arguments["transport"]
+        config = arguments["config"]
+
+        transport_type = TransportType(transport)
+
+        await self.mcp_clients.register_server(
+            server_id=server_id,
+            name=name,
+            transport=transport_type,
+            config=config,
+        )
+        await self._invalidate_upstream_tools(server_id)
 
-            if tool_name == "list_upstream_servers":
-                servers = await self.mcp_clients.list_servers()
+        return [
+            TextContent(
+                type="text",
+                text=f"Server {server_id} registered",
+            )
+        ]
 
-                if not servers:
-                    return [TextContent(type="text", text="No servers registered")]
+    async def _handle_list_upstream_servers(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Handle the list_upstream_servers tool."""
+        servers = await self.mcp_clients.list_servers()
 
-                lines = [f"Registered servers ({len(servers)}):\n"]
-                for server in servers:
-                    status = "enabled" if server.enabled else "disabled"
-                    lines.append(
-                        f"- {server.server_id}: {server.name} ({server.transport.value}) [{status}]",
-                    )
+        if not servers:
+            return [TextContent(type="text", text="No servers registered")]
 
-                return [TextContent(type="text", text="\n".join(lines))]
+        lines = [f"Registered servers ({len(servers)}):\n"]
+        for server in servers:
+            status = "enabled" if server.enabled else "disabled"
+            lines.append(
+                f"- {server.server_id}: {server.name} ({server.transport.value}) [{status}]",
+            )
 
-            # ========== MCP Resources ==========
-            if tool_name == "list_upstream_resources":
-                """List all resources from an upstream MCP server."""
-                import json
-                server_id = arguments["server_id"]
+        return [TextContent(type="text", text="\n".join(lines))]
 
-                try:
-                    resources = await self.mcp_clients.list_resources(server_id)
+    # ========== MCP Resources ==========
+    async def _handle_list_upstream_resources(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """List all resources from an upstream MCP server."""
+        import json
+        server_id = arguments["server_id"]
 
-                    if not resources:
-                        return [TextContent(type="text", text=f"No resources available from {server_id}")]
+        try:
+            resources = await self.mcp_clients.list_resources(server_id)
+
+            if not resources:
+                return [TextContent(type="text", text=f"No resources available from {server_id}")]
+
+            return [TextContent(
+                type="text",
+                text=json.dumps({
+                    "server_id": server_id,
+                    "resources": resources,
+                    "count": len(resources),
+                }, indent=2, ensure_ascii=False)
+            )]
+        except Exception as e:
+            return [TextContent(type="text", text=f"Error listing resources from {server_id}: {str(e)}")]
 
-                    return [TextContent(
-                        type="text",
-                        text=json.dumps({
-                            "server_id": server_id,
-                            "resources": resources,
-                            "count": len(resources),
-                        }, indent=2, ensure_ascii=False)
-                    )]
-                except Exception as e:
-                    return [TextContent(type="text", text=f"Error listing resources from {server_id}: {str(e)}")]
+    async def _handle_read_upstream_resource(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Read a resource from an upstream MCP server."""
+        import json
+        server_id = arguments["server_id"]
+        uri = arguments["uri"]
 
-            if tool_name == "read_upstream_resource":
-                """Read a resource from an upstream MCP server."""
-                import json
-                server_id = arguments["server_id"]
-                uri = arguments["uri"]
+        try:
+            resource_content = await self.mcp_clients.read_resource(server_id, uri)
+
+            return [TextContent(
+                type="text",
+                text=json.dumps({
+                    "server_id": server_id,
+                    "uri": uri,
+                    "content": resource_content,
+                }, indent=2, ensure_ascii=False)
+            )]
+        except Exception as e:
+            return [TextContent(type="text", text=f"Error reading resource {uri} from {server_id}: {str(e)}")]
 
-                try:
-                    resource_content = await self.mcp_clients.read_resource(server_id, uri)
+    # ========== MCP Prompts ==========
+    async def _handle_list_upstream_prompts(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """List all prompts from an upstream MCP server."""
+        import json
+        server_id = arguments["server_id"]
 
-                    return [TextContent(
-                        type="text",
-                        text=json.dumps({
-                            "server_id": server_id,
-                            "uri": uri,
-                            "content": resource_content,
-                        }, indent=2, ensure_ascii=False)
-                    )]
-                except Exception as e:
-                    return [TextContent(type="text", text=f"Error reading resource {uri} from {server_id}: {str(e)}")]
+        try:
+            prompts = await self.mcp_clients.list_prompts(server_id)
+
+            if not prompts:
+                return [TextContent(type="text", text=f"No prompts available from {server_id}")]
+
+            return [TextContent(
+                type="text",
+                text=json.dumps({
+                    "server_id": server_id,
+                    "prompts": prompts,
+                    "count": len(prompts),
+                }, indent=2, ensure_ascii=False)
+            )]
+        except Exception as e:
+            return [TextContent(type="text", text=f"Error listing prompts from {server_id}: {str(e)}")]
 
-            # ========== MCP Prompts ==========
-            if tool_name == "list_upstream_prompts":
-                """List all prompts from an upstream MCP server."""
-                import json
-                server_id = arguments["server_id"]
+    async def _handle_get_upstream_prompt(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Get a prompt from an upstream MCP server."""
+        import json
+        server_id = arguments["server_id"]
+        prompt_name = arguments["prompt_name"]
+        prompt_arguments = arguments.get("arguments", {})
 
-                try:
-                    prompts = await self.mcp_clients.list_prompts(server_id)
+        try:
+            prompt = await self.mcp_clients.get_prompt(server_id, prompt_name, prompt_arguments)
+
+            return [TextContent(
+                type="text",
+                text=json.dumps({
+                    "server_id": server_id,
+                    "prompt_name": prompt_name,
+                    "prompt": prompt,
+                }, indent=2, ensure_ascii=False)
+            )]
+        except Exception as e:
+            return [TextContent(type="text", text=f"Error getting prompt {prompt_name} from {server_id}: {str(e)}")]
 
-                    if not prompts:
-                        return [TextContent(type="text", text=f"No prompts available from {server_id}")]
+    async def _handle_debug_upstream_tools(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Debug tool to check upstream tool proxy status."""
+        import json
+        import traceback
 
-                    return [TextContent(
-                        type="text",
-                        text=json.dumps({
-                            "server_id": server_id,
-                            "prompts": prompts,
-                            "count": len(prompts),
-                        }, indent=2, ensure_ascii=False)
-                    )]
-                except Exception as e:
-                    return [TextContent(type="text", text=f"Error listing prompts from {server_id}: {str(e)}")]
+        debug_info = {
+            "registered_servers": [],
+            "connection_tests": {},
+            "proxy_tools": [],
+            "errors": []
+        }
 
-            if tool_name == "get_upstream_prompt":
-                """Get a prompt from an upstream MCP server."""
-                import json
-                server_id = arguments["server_id"]
-                prompt_name = arguments["prompt_name"]
-                prompt_arguments = arguments.get("arguments", {})
+        try:
+            # Get registered servers
+            servers = list(await self.mcp_clients.iter_servers())
+            for server in servers:
+                debug_info["registered_servers"].append({
+                    "id": server.server_id,
+                    "name": server.name,
+                    "enabled": server.enabled,
+                    "transport": server.transport.value,
+                    "command": server.config.get("command", "N/A")
+                })
 
-                try:
-                    prompt = await self.mcp_clients.get_prompt(server_id, prompt_name, prompt_arguments)
+            # Test connections to all enabled servers in parallel
+            enabled_servers = [server for server in servers if server.enabled]
+            results = await asyncio.gather(
+                *(self._test_upstream_connection(server) for server in enabled_servers)
+            )
+            for server, result in zip(enabled_servers, results):
+                debug_info["connection_tests"][server.server_id] = result
+
+            # Try to get upstream tools
+            upstream_tools = await self._get_upstream_tools(force_refresh=True)
+            for tool in upstream_tools:
+                debug_info["proxy_tools"].append({
+                    "name": tool.name,
+                    "description": tool.description[:60] + "..." if len(tool.description) > 60 else tool.description
+                })
 
-                    return [TextContent(
-                        type="text",
-                        text=json.dumps({
-                            "server_id": server_id,
-                            "prompt_name": prompt_name,
-                            "prompt": prompt,
-                        }, indent=2, ensure_ascii=False)
-                    )]
-                except Exception as e:
-                    return [TextContent(type="text", text=f"Error getting prompt {prompt_name} from {server_id}: {str(e)}")]
-
-            if tool_name == "debug_upstream_tools":
-                """Debug tool to check upstream tool proxy status."""
-                import json
-                import traceback
-
-                debug_info = {
-                    "registered_servers": [],
-                    "connection_tests": {},
-                    "proxy_tools": [],
-                    "errors": []
-                }
+        except Exception as e:
+            debug_info["errors"].append({
+                "error": str(e),
+                "type": type(e).__name__,
+                "traceback": traceback.format_exc()
+            })
+
+        return [TextContent(
+            type="text",
+            text=f"Debug Info:\n{json.dumps(debug_info, indent=2, ensure_ascii=False)}"
+        )]
+
+    async def _handle_debug_skill_tools(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Debug tool to check skill tool registration status."""
+        import json
+
+        debug_info = {
+            "skills": [],
+            "skill_tools": [],
+            "total_skills": 0,
+        }
 
-                try:
-                    # Get registered servers
-                    servers = await self.mcp_clients.list_servers()
-                    for server in servers:
-                        debug_info["registered_servers"].append({
-                            "id": server.server_id,
-                            "name": server.name,
-                            "enabled": server.enabled,
-                            "transport": server.transport.value,
-                            "command": server.config.get("command", "N/A")
-                        })
-
-                        # Test connection to each server
-                        if server.enabled:
-                            try:
-                                print(f"[Debug] Testing connection to {server.server_id}...")
-
-                                try:
-                                    tools = await asyncio.wait_for(
-                                        self.mcp_clients.list_tools(server.server_id),
-                                        timeout=30.0
-                                    )
-
-                                    debug_info["connection_tests"][server.server_id] = {
-                                        "status": "success",
-                                        "tools_count": len(tools),
-                                        "sample_tools": [t["name"] for t in tools[:3]]
-                                    }
-
-                                except asyncio.TimeoutError:
-                                    # Clean up partial connection to avoid resource leak
-                                    print(f"[Debug] Timeout on {server.server_id}, cleaning up...")
-                                    await self.mcp_clients.disconnect_server(server.server_id)
-
-                                    debug_info["connection_tests"][server.server_id] = {
-                                        "status": "timeout",
-                                        "error": "Connection timed out after 30 seconds (cleaned up)"
-                                    }
-
-                            except Exception as e:
-                                # CRITICAL: Clean up connection on ANY error to prevent process leak
-                                print(f"[Debug] Error on {server.server_id}, cleaning up...")
-                                try:
-                                    await self.mcp_clients.disconnect_server(server.server_id)
-                                except:
-                                    pass  # Ignore cleanup errors
-
-                                debug_info["connection_tests"][server.server_id] = {
-                                    "status": "error",
-                                    "error": str(e),
-                                    "error_type": type(e).__name__,
-                                    "traceback": traceback.format_exc()
-                                }
-
-                    # Try to get upstream tools
-                    upstream_tools = await self._get_upstream_tools()
-                    for tool in upstream_tools:
-                        debug_info["proxy_tools"].append({
-                            "name": tool.name,
-                            "description": tool.description[:60] + "..." if len(tool.description) > 60 else tool.description
-                        })
+        try:
+            # Get all skills
+            skills = await self.skill_manager.list_skills()
+            debug_info["total_skills"] = len(skills)
 
+            for skill_meta in skills:
+                try:
+                    skill = await self.skill_manager.get_skill(skill_meta.id)
+                    debug_info["skills"].append({
+                        "id": skill.id,
+                        "name": skill.name,
+                        "version": skill.version,
+                        "description": skill.description,
+                        "tool_name": f"skill__{skill.id}",
+                    })
                 except Exception as e:
-                    debug_info["errors"].append({
+                    debug_info["skills"].append({
+                        "id": skill_meta.id,
                         "error": str(e),
-                        "type": type(e).__name__,
-                        "traceback": traceback.format_exc()
                     })
 
-                return [TextContent(
-                    type="text",
-                    text=f"Debug Info:\n{json.dumps(debug_info, indent=2, ensure_ascii=False)}"
-                )]
+            # Get skill tools as they would appear in list_tools
+            skill_tools_data = await self.skill_manager.list_as_mcp_tools()
+            debug_info["skill_tools"] = [
+                {
+                    "name": t["name"],
+                    "description": t.get("description", "")[:60] + "...",
+                }
+                for t in skill_tools_data
+            ]
 
-            if tool_name == "debug_skill_tools":
-                """Debug tool to check skill tool registration status."""
-                import json
+        except Exception as e:
+            debug_info["error"] = str(e)
+            import traceback
+            debug_info["traceback"] = traceback.format_exc()
+
+        return [TextContent(
+            type="text",
+            text=f"Skill Tools Debug Info:\n{json.dumps(debug_info, indent=2, ensure_ascii=False)}"
+        )]
+
+    async def _handle_debug_skill_definition(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Debug tool to inspect skill definition and compare with source recording."""
+        import json
+
+        skill_id = arguments["skill_id"]
 
-                debug_info = {
-                    "skills": [],
-                    "skill_tools": [],
-                    "total_skills": 0,
+        debug_info = {
+            "skill_id": skill_id,
+            "found": False,
+            "skill": {},
+            "nodes": [],
+            "source_session": {},
+        }
+
+        try:
+            # Load skill
+            skill = await self.skill_manager.get_skill(skill_id)
+
+            if skill:
+                debug_info["found"] = True
+
+                # Check metadata for source_session_id
+                source_session_id = skill.metadata.get("source_session_id")
+
+                debug_info["skill"] = {
+                    "id": skill.id,
+                    "name": skill.name,
+                    "version": skill.version,
+                    "description": skill.description,
+                    "tags": skill.tags,
+                    "metadata": skill.metadata,
+                    "source_session_id": source_session_id,
                 }
 
-                try:
-                    # Get all skills
-                    skills = await self.skill_manager.list_skills()
-                    debug_info["total_skills"] = len(skills)
-
-                    for skill_meta in skills:
-                        try:
-                            skill = await self.skill_manager.get_skill(skill_meta.id)
-                            debug_info["skills"].append({
-                                "id": skill.id,
-                                "name": skill.name,
-                                "version": skill.version,
-                                "description": skill.description,
-                                "tool_name": f"skill__{skill.id}",
-                            })
-                        except Exception as e:
-                            debug_info["skills"].append({
-                                "id": skill_meta.id,
-                                "error": str(e),
-                            })
-
-                    # Get skill tools as they would appear in list_tools
-                    skill_tools_data = await self.skill_manager.list_as_mcp_tools()
-                    debug_info["skill_tools"] = [
-                        {
-                            "name": t["name"],
-                            "description": t.get("description", "")[:60] + "...",
+                # Inspect each node in the graph
+                if skill.graph:
+                    for node in skill.graph.nodes:
+                        node_detail = {
+                            "id": node.id,
+                            "kind": node.kind,
+                            "server": node.server,
+                            "tool": node.tool,
+                            "args_template": node.args_template,
+                            "args_json": json.dumps(node.args_template, ensure_ascii=False),
+                            "args_repr": repr(node.args_template),
                         }
-                        for t in skill_tools_data
-                    ]
 
-                except Exception as e:
-                    debug_info["error"] = str(e)
-                    import traceback
-                    debug_info["traceback"] = traceback.format_exc()
+                        # For text arguments, show detailed character analysis
+                        for key, value in node.args_template.items():
+                            if isinstance(value, str) and len(value) > 0 and not value.startswith("$") and not value.startswith("@"):
+                                node_detail[f"arg_{key}_length"] = len(value)
+                                node_detail[f"arg_{key}_chars"] = [c for c in value]
+                                node_detail[f"arg_{key}_bytes"] = value.encode('utf-8').hex()
 
-                return [TextContent(
-                    type="text",
-                    text=f"Skill Tools Debug Info:\n{json.dumps(debug_info, indent=2, ensure_ascii=False)}"
-                )]
+                        debug_info["nodes"].append(node_detail)
 
-            if tool_name == "debug_skill_definition":
-                """Debug tool to inspect skill definition and compare with source recording."""
-                import json
+        except Exception as e:
+            debug_info["error"] = str(e)
+            import traceback
+            debug_info["traceback"] = traceback.format_exc()
 
-                skill_id = arguments["skill_id"]
+        return [TextContent(
+            type="text",
+            text=f"Skill Definition Debug Info:\n{json.dumps(debug_info, indent=2, ensure_ascii=False)}"
+        )]
 
-                debug_info = {
-                    "skill_id": skill_id,
-                    "found": False,
-                    "skill": {},
-                    "nodes": [],
-                    "source_session": {},
-                }
+    async def _handle_debug_skill_execution(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Debug tool to trace skill execution and diagnose parameter corruption."""
+        import json
 
-                try:
-                    # Load skill
-                    skill = await self.skill_manager.get_skill(skill_id)
+        run_id = arguments["run_id"]
 
-                    if skill:
-                        debug_info["found"] = True
+        debug_info = {
+            "run_id": run_id,
+            "found": False,
+            "executions": [],
+        }
 
-                        # Check metadata for source_session_id
-                        source_session_id = skill.metadata.get("source_session_id")
+        try:
+            # Load execution log
+            executions = await self.storage.load_run_log(run_id)
+
+            if executions:
+                debug_info["found"] = True
+                debug_info["total_executions"] = len(executions)
+
+                # Inspect each node execution
+                for execution in executions:
+                    exec_detail = {
+                        "node_id": execution.node_id,
+                        "server": execution.server,
+                        "tool": execution.tool,
+                        "status": execution.status,
+                        "started_at": execution.started_at.isoformat() if execution.started_at else None,
+                        "ended_at": execution.ended_at.isoformat() if execution.ended_at else None,
+                        "args_resolved": execution.args_resolved,
+                        "args_resolved_json": json.dumps(execution.args_resolved, ensure_ascii=False),
+                        "args_resolved_repr": repr(execution.args_resolved),
+                        "output": execution.output,
+                        "error": execution.error,
+                    }
+
+                    # For text arguments in resolved args, show detailed character analysis
+                    for key, value in execution.args_resolved.items():
+                        if isinstance(value, str) and len(value) > 0:
+                            exec_detail[f"resolved_{key}_length"] = len(value)
+                            exec_detail[f"resolved_{key}_chars"] = [c for c in value]
+                            exec_detail[f"resolved_{key}_bytes"] = value.encode('utf-8').hex()
+
+                    debug_info["executions"].append(exec_detail)
+            else:
+                debug_info["message"] = "No execution log found for this run_id"
 
-                        debug_info["skill"] = {
-                            "id": skill.id,
-                            "name": skill.name,
-                            "version": skill.version,
-                            "description": skill.description,
-                            "tags": skill.tags,
-                            "metadata": skill.metadata,
-                            "source_session_id": source_session_id,
-                        }
+        except Exception as e:
+            debug_info["error"] = str(e)
+            import traceback
+            debug_info["traceback"] = traceback.format_exc()
 
-                        # Inspect each node in the graph
-                        if skill.graph:
-                            for node in skill.graph.nodes:
-                                node_detail = {
-                                    "id": node.id,
-                                    "kind": node.kind,
-                                    "server": node.server,
-                                    "tool": node.tool,
-                                    "args_template": node.args_template,
-                                    "args_json": json.dumps(node.args_template, ensure_ascii=False),
-                                    "args_repr": repr(node.args_template),
-                                }
-
-                                # For text arguments, show detailed character analysis
-                                for key, value in node.args_template.items():
-                                    if isinstance(value, str) and len(value) > 0 and not value.startswith("$") and not value.startswith("@"):
-                                        node_detail[f"arg_{key}_length"] = len(value)
-                                        node_detail[f"arg_{key}_chars"] = [c for c in value]
-                                        node_detail[f"arg_{key}_bytes"] = value.encode('utf-8').hex()
-
-                                debug_info["nodes"].append(node_detail)
+        return [TextContent(
+            type="text",
+            text=f"Skill Execution Debug Info:\n{json.dumps(debug_info, indent=2, ensure_ascii=False)}"
+        )]
 
-                except Exception as e:
-                    debug_info["error"] = str(e)
-                    import traceback
-                    debug_info["traceback"] = traceback.format_exc()
+    async def _handle_debug_recording_session(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Debug tool to inspect recording session details and diagnose text scrambling issues."""
+        import json
 
-                return [TextContent(
-                    type="text",
-                    text=f"Skill Definition Debug Info:\n{json.dumps(debug_info, indent=2, ensure_ascii=False)}"
-                )]
+        session_id = arguments["session_id"]
 
-            if tool_name == "debug_skill_execution":
-                """Debug tool to trace skill execution and diagnose parameter corruption."""
-                import json
+        debug_info = {
+            "session_id": session_id,
+            "found": False,
+            "logs": [],
+            "summary": {},
+        }
 
-                run_id = arguments["run_id"]
+        try:
+            # Try to load from active sessions first
+            session = await self.recording_manager.get_active_session(session_id)
+
+            # If not active, try to load from storage
+            if not session:
+                session = await self.storage.load_session(session_id)
 
-                debug_info = {
-                    "run_id": run_id,
-                    "found": False,
-                    "executions": [],
+            if session:
+                debug_info["found"] = True
+                debug_info["summary"] = {
+                    "started_at": session.started_at.isoformat() if session.started_at else None,
+                    "ended_at": session.ended_at.isoformat() if session.ended_at else None,
+                    "client_id": session.client_id,
+                    "workspace_id": session.workspace_id,
+                    "total_logs": len(session.logs),
+                    "metadata": session.metadata,
                 }
 
-                try:
-                    # Load execution log
-                    executions = await self.storage.load_run_log(run_id)
-
-                    if executions:
-                        debug_info["found"] = True
-                        debug_info["total_executions"] = len(executions)
-
-                        # Inspect each node execution
-                        for execution in executions:
-                            exec_detail = {
-                                "node_id": execution.node_id,
-                                "server": execution.server,
-                                "tool": execution.tool,
-                                "status": execution.status,
-                                "started_at": execution.started_at.isoformat() if execution.started_at else None,
-                                "ended_at": execution.ended_at.isoformat() if execution.ended_at else None,
-                                "args_resolved": execution.args_resolved,
-                                "args_resolved_json": json.dumps(execution.args_resolved, ensure_ascii=False),
-                                "args_resolved_repr": repr(execution.args_resolved),
-                                "output": execution.output,
-                                "error": execution.error,
-                            }
-
-                            # For text arguments in resolved args, show detailed character analysis
-                            for key, value in execution.args_resolved.items():
-                                if isinstance(value, str) and len(value) > 0:
-                                    exec_detail[f"resolved_{key}_length"] = len(value)
-                                    exec_detail[f"resolved_{key}_chars"] = [c for c in value]
-                                    exec_detail[f"resolved_{key}_bytes"] = value.encode('utf-8').hex()
-
-                            debug_info["executions"].append(exec_detail)
-                    else:
-                        debug_info["message"] = "No execution log found for this run_id"
+                # Show each log with detailed argument inspection
+                for log in session.logs:
+                    log_detail = {
+                        "index": log.index,
+                        "timestamp": log.timestamp.isoformat(),
+                        "server": log.server,
+                        "tool": log.tool,
+                        "args": log.args,  # Show exact recorded args
+                        "args_json": json.dumps(log.args, ensure_ascii=False),  # Show JSON representation
+                        "args_repr": repr(log.args),  # Show Python repr
+                        "status": log.status,
+                        "duration_ms": log.duration_ms,
+                        "error": log.error,
+                    }
+
+                    # For text arguments, show detailed character analysis
+                    for key, value in log.args.items():
+                        if isinstance(value, str) and len(value) > 0:
+                            log_detail[f"arg_{key}_length"] = len(value)
+                            log_detail[f"arg_{key}_chars"] = [c for c in value]
+                            log_detail[f"arg_{key}_bytes"] = value.encode('utf-8').hex()
+
+                    debug_info["logs"].append(log_detail)
+            else:
+                debug_info["error"] = "Session not found"
 
-                except Exception as e:
-                    debug_info["error"] = str(e)
-                    import traceback
-                    debug_info["traceback"] = traceback.format_exc()
+        except Exception as e:
+            debug_info["error"] = str(e)
+            import traceback
+            debug_info["traceback"] = traceback.format_exc()
 
-                return [TextContent(
-                    type="text",
-                    text=f"Skill Execution Debug Info:\n{json.dumps(debug_info, indent=2, ensure_ascii=False)}"
-                )]
+        return [TextContent(
+            type="text",
+            text=f"Recording Session Debug Info:\n{json.dumps(debug_info, indent=2, ensure_ascii=False)}"
+        )]
 
-            if tool_name == "debug_recording_session":
-                """Debug tool to inspect recording session details and diagnose text scrambling issues."""
-                import json
+    # ========== Cache Management Tools ==========
+    async def _handle_get_cache_stats(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Get upstream tool cache statistics."""
+        import json
 
-                session_id = arguments["session_id"]
+        stats = await self._upstream_tool_cache.get_stats()
 
-                debug_info = {
-                    "session_id": session_id,
-                    "found": False,
-                    "logs": [],
-                    "summary": {},
-                }
+        return [TextContent(
+            type="text",
+            text=f"Upstream Tool Cache Statistics:\n{json.dumps(stats, indent=2, ensure_ascii=False)}"
+        )]
 
-                try:
-                    # Try to load from active sessions first
-                    session = await self.recording_manager.get_active_session(session_id)
-
-                    # If not active, try to load from storage
-                    if not session:
-                        session = await self.storage.load_session(session_id)
-
-                    if session:
-                        debug_info["found"] = True
-                        debug_info["summary"] = {
-                            "started_at": session.started_at.isoformat() if session.started_at else None,
-                            "ended_at": session.ended_at.isoformat() if session.ended_at else None,
-                            "client_id": session.client_id,
-                            "workspace_id": session.workspace_id,
-                            "total_logs": len(session.logs),
-                            "metadata": session.metadata,
-                        }
+    async def _handle_invalidate_cache(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Invalidate upstream tool cache."""
+        import json
 
-                        # Show each log with detailed argument inspection
-                        for log in session.logs:
-                            log_detail = {
-                                "index": log.index,
-                                "timestamp": log.timestamp.isoformat(),
-                                "server": log.server,
-                                "tool": log.tool,
-                                "args": log.args,  # Show exact recorded args
-                                "args_json": json.dumps(log.args, ensure_ascii=False),  # Show JSON representation
-                                "args_repr": repr(log.args),  # Show Python repr
-                                "status": log.status,
-                                "duration_ms": log.duration_ms,
-                                "error": log.error,
-                            }
-
-                            # For text arguments, show detailed character analysis
-                            for key, value in log.args.items():
-                                if isinstance(value, str) and len(value) > 0:
-                                    log_detail[f"arg_{key}_length"] = len(value)
-                                    log_detail[f"arg_{key}_chars"] = [c for c in value]
-                                    log_detail[f"arg_{key}_bytes"] = value.encode('utf-8').hex()
-
-                            debug_info["logs"].append(log_detail)
-                    else:
-                        debug_info["error"] = "Session not found"
+        server_id = arguments.get("server_id")
 
-                except Exception as e:
-                    debug_info["error"] = str(e)
-                    import traceback
-                    debug_info["traceback"] = traceback.format_exc()
+        await self._invalidate_upstream_tools(server_id)
 
-                return [TextContent(
-                    type="text",
-                    text=f"Recording Session Debug Info:\n{json.dumps(debug_info, indent=2, ensure_ascii=False)}"
-                )]
+        if server_id:
+            message = f"Cache invalidated for server: {server_id}"
+        else:
+            message = "Cache invalidated for all servers"
 
-            # ========== Cache Management Tools ==========
-            if tool_name == "get_cache_stats":
-                """Get upstream tool cache statistics."""
-                import json
+        return [TextContent(type="text", text=message)]
 
-                stats = await self._upstream_tool_cache.get_stats()
+    async def _handle_refresh_upstream_tools(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Force refresh of upstream tools."""
+        import json
 
-                return [TextContent(
-                    type="text",
-                    text=f"Upstream Tool Cache Statistics:\n{json.dumps(stats, indent=2, ensure_ascii=False)}"
-                )]
+        server_id = arguments.get("server_id")
 
-            if tool_name == "invalidate_cache":
-                """Invalidate upstream tool cache."""
-                import json
+        # Invalidate cache
+        await self._invalidate_upstream_tools(server_id)
 
-                server_id = arguments.get("server_id")
+        # Re-fetch tools
+        if server_id:
+            # Fetch from specific server
+            servers = await self.mcp_clients.iter_servers()
+            server_config = next((s for s in servers if s.server_id == server_id), None)
 
-                await self._upstream_tool_cache.invalidate(server_id)
+            if not server_config:
+                return [TextContent(type="text", text=f"Server not found: {server_id}")]
 
-                if server_id:
-                    message = f"Cache invalidated for server: {server_id}"
-                else:
-                    message = "Cache invalidated for all servers"
+            tools, error = await self._fetch_server_tools(server_config)
 
-                return [TextContent(type="text", text=message)]
+            if error:
+                return [TextContent(type="text", text=f"Error refreshing tools: {error}")]
 
-            if tool_name == "refresh_upstream_tools":
-                """Force refresh of upstream tools."""
-                import json
+            return [TextContent(
+                type="text",
+                text=f"Refreshed {len(tools)} tools from {server_config.name}"
+            )]
+        else:
+            # Fetch from all servers
+            upstream_tools = await self._get_upstream_tools(force_refresh=True)
 
-                server_id = arguments.get("server_id")
+            return [TextContent(
+                type="text",
+                text=f"Refreshed {len(upstream_tools)} tools from all upstream servers"
+            )]
 
-                # Invalidate cache
-                await self._upstream_tool_cache.invalidate(server_id)
+    async def _handle_debug_registry(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Debug registry loading - shows file path, content, and loaded state."""
+        import json
 
-                # Re-fetch tools
-                if server_id:
-                    # Fetch from specific server
-                    servers = await self.mcp_clients.list_servers()
-                    server_config = next((s for s in servers if s.server_id == server_id), None)
+        registry_path = self.storage._get_registry_path()
+        debug_info = {
+            "registry_file_path": str(registry_path),
+            "file_exists": registry_path.exists(),
+        }
 
-                    if not server_config:
-                        return [TextContent(type="text", text=f"Server not found: {server_id}")]
+        if registry_path.exists():
+            try:
+                # Read raw file content
+                with open(registry_path, "r", encoding="utf-8") as f:
+                    content = f.read()
+                    data = json.loads(content)
+                    debug_info["file_content_servers_count"] = len(data.get("servers", {}))
+                    debug_info["file_content_server_ids"] = list(data.get("servers", {}).keys())
 
-                    tools, error = await self._fetch_server_tools(server_config)
+            except Exception as e:
+                debug_info["file_read_error"] = str(e)
 
-                    if error:
-                        return [TextContent(type="text", text=f"Error refreshing tools: {error}")]
+        # Check loaded registry state
+        try:
+            loaded_registry = await self.storage.load_registry()
+            debug_info["loaded_registry_servers_count"] = len(loaded_registry.servers)
+            debug_info["loaded_registry_server_ids"] = list(loaded_registry.servers.keys())
+        except Exception as e:
+            debug_info["load_error"] = str(e)
+            import traceback
+            debug_info["load_traceback"] = traceback.format_exc()
 
-                    return [TextContent(
-                        type="text",
-                        text=f"Refreshed {len(tools)} tools from {server_config.name}"
-                    )]
-                else:
-                    # Fetch from all servers
-                    upstream_tools = await self._get_upstream_tools()
+        # Check MCPClientManager state
+        try:
+            servers = await self.mcp_clients.list_servers()
+            debug_info["mcp_manager_servers_count"] = len(servers)
+            debug_info["mcp_manager_server_ids"] = [s.server_id for s in servers]
+        except Exception as e:
+            debug_info["mcp_manager_error"] = str(e)
 
-                    return [TextContent(
-                        type="text",
-                        text=f"Refreshed {len(upstream_tools)} tools from all upstream servers"
-                    )]
+        return [TextContent(
+            type="text",
+            text=f"Registry Debug Info:\n{json.dumps(debug_info, indent=2, ensure_ascii=False)}"
+        )]
 
-            if tool_name == "debug_registry":
-                """Debug registry loading - shows file path, content, and loaded state."""
-                import json
+    # ========== Skill Cache Management Tools ==========
+    async def _handle_get_skill_cache_stats(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Get skill cache statistics."""
+        import json
 
-                registry_path = self.storage._get_registry_path()
-                debug_info = {
-                    "registry_file_path": str(registry_path),
-                    "file_exists": registry_path.exists(),
-                }
+        stats = await self.storage.get_cache_stats()
 
-                if registry_path.exists():
-                    try:
-                        # Read raw file content
-                        with open(registry_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-                            data = json.loads(content)
-                            debug_info["file_content_servers_count"] = len(data.get("servers", {}))
-                            debug_info["file_content_server_ids"] = list(data.get("servers", {}).keys())
+        if stats is None:
+            return [TextContent(type="text", text="Skill caching is disabled")]
 
-                    except Exception as e:
-                        debug_info["file_read_error"] = str(e)
+        return [TextContent(
+            type="text",
+            text=f"Skill Cache Statistics:\n{json.dumps(stats, indent=2, ensure_ascii=False)}"
+        )]
 
-                # Check loaded registry state
-                try:
-                    loaded_registry = await self.storage.load_registry()
-                    debug_info["loaded_registry_servers_count"] = len(loaded_registry.servers)
-                    debug_info["loaded_registry_server_ids"] = list(loaded_registry.servers.keys())
-                except Exception as e:
-                    debug_info["load_error"] = str(e)
-                    import traceback
-                    debug_info["load_traceback"] = traceback.format_exc()
+    async def _handle_invalidate_skill_cache(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Invalidate skill cache."""
+        skill_id = arguments.get("skill_id")
 
-                # Check MCPClientManager state
-                try:
-                    servers = await self.mcp_clients.list_servers()
-                    debug_info["mcp_manager_servers_count"] = len(servers)
-                    debug_info["mcp_manager_server_ids"] = [s.server_id for s in servers]
-                except Exception as e:
-                    debug_info["mcp_manager_error"] = str(e)
+        await self.storage.invalidate_skill_cache(skill_id)
 
-                return [TextContent(
-                    type="text",
-                    text=f"Registry Debug Info:\n{json.dumps(debug_info, indent=2, ensure_ascii=False)}"
-                )]
+        if skill_id:
+            message = f"Skill cache invalidated for: {skill_id}"
+        else:
+            message = "All skill caches invalidated"
 
-            # ========== Skill Cache Management Tools ==========
-            if tool_name == "get_skill_cache_stats":
-                """Get skill cache statistics."""
-                import json
+        return [TextContent(type="text", text=message)]
 
-                stats = await self.storage.get_cache_stats()
+    async def _handle_force_skill_reload(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Force reload of skills from disk."""
+        # Clear all caches
+        await self.storage.invalidate_skill_cache()
 
-                if stats is None:
-                    return [TextContent(type="text", text="Skill caching is disabled")]
+        # Rebuild skill index
+        await self.storage._rebuild_skill_index()
 
-                return [TextContent(
-                    type="text",
-                    text=f"Skill Cache Statistics:\n{json.dumps(stats, indent=2, ensure_ascii=False)}"
-                )]
+        # Get skill count
+        skills = await self.storage.list_skills()
 
-            if tool_name == "invalidate_skill_cache":
-                """Invalidate skill cache."""
-                skill_id = arguments.get("skill_id")
+        return [TextContent(
+            type="text",
+            text=f"Skills reloaded from disk. Total: {len(skills)} skills"
+        )]
 
-                await self.storage.invalidate_skill_cache(skill_id)
+    async def _handle_trigger_hot_reload(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Manually trigger hot-reload check."""
+        await self._file_watcher.trigger_manual_scan()
 
-                if skill_id:
-                    message = f"Skill cache invalidated for: {skill_id}"
-                else:
-                    message = "All skill caches invalidated"
+        return [TextContent(
+            type="text",
+            text="Hot-reload check triggered. Any changes will be detected and caches invalidated."
+        )]
 
-                return [TextContent(type="text", text=message)]
+    # ========== Configuration Management Tools ==========
+    async def _handle_import_claude_code_config(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Import Claude Code configuration."""
+        import json
 
-            if tool_name == "force_skill_reload":
-                """Force reload of skills from disk."""
-                # Clear all caches
-                await self.storage.invalidate_skill_cache()
+        config_json = arguments["config_json"]
+        merge = arguments.get("merge", True)
+        overwrite = arguments.get("overwrite", False)
 
-                # Rebuild skill index
-                await self.storage._rebuild_skill_index()
+        try:
+            # Parse JSON
+            config_dict = json.loads(config_json)
+
+            # Convert to ServerRegistry
+            new_registry = ConfigConverter.from_claude_code(config_dict)
+
+            if merge:
+                # Merge with existing registry
+                await self.mcp_clients.flush_registry()
+                current_registry = await self.storage.load_registry()
+                merged_registry = ConfigConverter.merge_registries(
+                    current_registry,
+                    new_registry,
+                    overwrite=overwrite
+                )
+                await self.storage.save_registry(merged_registry)
 
-                # Get skill count
-                skills = await self.storage.list_skills()
+                # Reload registry and invalidate caches
+                await self.mcp_clients.reload_registry()
+                await self._invalidate_upstream_tools()  # Clear all upstream caches
+                print(f"[Skillflow] Registry reloaded after importing {len(new_registry.servers)} servers")
 
                 return [TextContent(
                     type="text",
-                    text=f"Skills reloaded from disk. Total: {len(skills)} skills"
+                    text=f"✅ Imported {len(new_registry.servers)} servers and merged with existing config.\n"
+                         f"Total servers: {len(merged_registry.servers)}\n"
+                         f"Overwrite mode: {overwrite}\n\n"
+                         f"⚠️ Note: New tools will appear after you refresh your MCP client.\n"
+                         f"You can also call 'refresh_upstream_tools' to fetch tools immediately."
                 )]
+            else:
+                # Replace entire registry
+                await self.storage.save_registry(new_registry)
 
-            if tool_name == "trigger_hot_reload":
-                """Manually trigger hot-reload check."""
-                await self._file_watcher.trigger_manual_scan()
+                # Reload registry and invalidate caches
+                await self.mcp_clients.reload_registry()
+                await self._invalidate_upstream_tools()  # Clear all upstream caches
+                print(f"[Skillflow] Registry replaced with {len(new_registry.servers)} servers")
 
                 return [TextContent(
                     type="text",
-                    text="Hot-reload check triggered. Any changes will be detected and caches invalidated."
+                    text=f"✅ Replaced configuration with {len(new_registry.servers)} servers from Claude Code config.\n\n"
+                         f"⚠️ Note: New tools will appear after you refresh your MCP client.\n"
+                         f"You can also call 'refresh_upstream_tools' to fetch tools immediately."
                 )]
 
-            # ========== Configuration Management Tools ==========
-            if tool_name == "import_claude_code_config":
-                """Import Claude Code configuration."""
-                import json
-
-                config_json = arguments["config_json"]
-                merge = arguments.get("merge", True)
-                overwrite = arguments.get("overwrite", False)
+        except json.JSONDecodeError as e:
+            return [TextContent(type="text", text=f"❌ Invalid JSON: {e}")]
+        except ValueError as e:
+            return [TextContent(type="text", text=f"❌ Invalid configuration: {e}")]
 
-                try:
-                    # Parse JSON
-                    config_dict = json.loads(config_json)
-
-                    # Convert to ServerRegistry
-                    new_registry = ConfigConverter.from_claude_code(config_dict)
-
-                    if merge:
-                        # Merge with existing registry
-                        current_registry = await self.storage.load_registry()
-                        merged_registry = ConfigConverter.merge_registries(
-                            current_registry,
-                            new_registry,
-                            overwrite=overwrite
-                        )
-                        await self.storage.save_registry(merged_registry)
-
-                        # Reload registry and invalidate caches
-                        await self.mcp_clients.reload_registry()
-                        await self._upstream_tool_cache.invalidate()  # Clear all upstream caches
-                        print(f"[Skillflow] Registry reloaded after importing {len(new_registry.servers)} servers")
-
-                        return [TextContent(
-                            type="text",
-                            text=f"✅ Imported {len(new_registry.servers)} servers and merged with existing config.\n"
-                                 f"Total servers: {len(merged_registry.servers)}\n"
-                                 f"Overwrite mode: {overwrite}\n\n"
-                                 f"⚠️ Note: New tools will appear after you refresh your MCP client.\n"
-                                 f"You can also call 'refresh_upstream_tools' to fetch tools immediately."
-                        )]
-                    else:
-                        # Replace entire registry
-                        await self.storage.save_registry(new_registry)
+    async def _handle_export_claude_code_config(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Export configuration in Claude Code format."""
+        import json
 
-                        # Reload registry and invalidate caches
-                        await self.mcp_clients.reload_registry()
-                        await self._upstream_tool_cache.invalidate()  # Clear all upstream caches
-                        print(f"[Skillflow] Registry replaced with {len(new_registry.servers)} servers")
+        registry = await self.storage.load_registry()
+        config_json = ConfigExporter.to_json_string(registry, indent=2)
 
-                        return [TextContent(
-                            type="text",
-                            text=f"✅ Replaced configuration with {len(new_registry.servers)} servers from Claude Code config.\n\n"
-                                 f"⚠️ Note: New tools will appear after you refresh your MCP client.\n"
-                                 f"You can also call 'refresh_upstream_tools' to fetch tools immediately."
-                        )]
+        return [TextContent(
+            type="text",
+            text=f"Current MCP Configuration (Claude Code compatible):\n\n```json\n{config_json}\n```\n\n"
+                 f"Total servers: {len(registry.servers)}"
+        )]
 
-                except json.JSONDecodeError as e:
-                    return [TextContent(type="text", text=f"❌ Invalid JSON: {e}")]
-                except ValueError as e:
-                    return [TextContent(type="text", text=f"❌ Invalid configuration: {e}")]
+    async def _handle_validate_mcp_config(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Validate MCP configuration."""
+        import json
 
-            if tool_name == "export_claude_code_config":
-                """Export configuration in Claude Code format."""
-                import json
+        config_json = arguments.get("config_json")
 
-                registry = await self.storage.load_registry()
-                config_json = ConfigExporter.to_json_string(registry, indent=2)
+        if config_json:
+            # Validate provided JSON
+            try:
+                config_dict = json.loads(config_json)
+                is_valid, errors = ConfigValidator.validate_registry(config_dict)
 
+                if is_valid:
+                    return [TextContent(
+                        type="text",
+                        text="✅ Configuration is valid and compatible with Claude Code!"
+                    )]
+                else:
+                    error_list = "\n".join(f"  • {err}" for err in errors)
+                    return [TextContent(
+                        type="text",
+                        text=f"❌ Configuration validation failed:\n\n{error_list}"
+                    )]
+            except json.JSONDecodeError as e:
+                return [TextContent(type="text", text=f"❌ Invalid JSON: {e}")]
+        else:
+            # Validate current config
+            registry = await self.storage.load_registry()
+            config_dict = ConfigConverter.to_claude_code(registry)
+            is_valid, errors = ConfigValidator.validate_registry(config_dict)
+
+            if is_valid:
                 return [TextContent(
                     type="text",
-                    text=f"Current MCP Configuration (Claude Code compatible):\n\n```json\n{config_json}\n```\n\n"
+                    text=f"✅ Current configuration is valid!\n"
                          f"Total servers: {len(registry.servers)}"
                 )]
+            else:
+                error_list = "\n".join(f"  • {err}" for err in errors)
+                return [TextContent(
+                    type="text",
+                    text=f"❌ Current configuration has errors:\n\n{error_list}"
+                )]
 
-            if tool_name == "validate_mcp_config":
-                """Validate MCP configuration."""
-                import json
-
-                config_json = arguments.get("config_json")
-
-                if config_json:
-                    # Validate provided JSON
-                    try:
-                        config_dict = json.loads(config_json)
-                        is_valid, errors = ConfigValidator.validate_registry(config_dict)
-
-                        if is_valid:
-                            return [TextContent(
-                                type="text",
-                                text="✅ Configuration is valid and compatible with Claude Code!"
-                            )]
-                        else:
-                            error_list = "\n".join(f"  • {err}" for err in errors)
-                            return [TextContent(
-                                type="text",
-                                text=f"❌ Configuration validation failed:\n\n{error_list}"
-                            )]
-                    except json.JSONDecodeError as e:
-                        return [TextContent(type="text", text=f"❌ Invalid JSON: {e}")]
-                else:
-                    # Validate current config
-                    registry = await self.storage.load_registry()
-                    config_dict = ConfigConverter.to_claude_code(registry)
-                    is_valid, errors = ConfigValidator.validate_registry(config_dict)
-
-                    if is_valid:
-                        return [TextContent(
-                            type="text",
-                            text=f"✅ Current configuration is valid!\n"
-                                 f"Total servers: {len(registry.servers)}"
-                        )]
-                    else:
-                        error_list = "\n".join(f"  • {err}" for err in errors)
-                        return [TextContent(
-                            type="text",
-                            text=f"❌ Current configuration has errors:\n\n{error_list}"
-                        )]
-
-            if tool_name == "add_mcp_server":
-                """Add or update an MCP server."""
-                server_id = arguments["server_id"]
-                name = arguments["name"]
-                transport = arguments["transport"]
-                command = arguments.get("command")
-                args = arguments.get("args", [])
-                env = arguments.get("env")
-                enabled = arguments.get("enabled", True)
-                metadata = arguments.get("metadata", {})
-
-                # Build config
-                config = {}
-                if transport == "stdio":
-                    if not command:
-                        return [TextContent(
-                            type="text",
-                            text="❌ STDIO transport requires 'command' parameter"
-                        )]
-                    config["command"] = command
-                    config["args"] = args
-                    config["env"] = env
-
-                # Create ServerConfig
-                server_config = ServerConfig(
-                    server_id=server_id,
-                    name=name,
-                    transport=transport,
-                    config=config,
-                    enabled=enabled,
-                    metadata=metadata
-                )
-
-                # Load current registry
-                registry = await self.storage.load_registry()
+    async def _handle_add_mcp_server(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Add or update an MCP server."""
+        server_id = arguments["server_id"]
+        name = arguments["name"]
+        transport = arguments["transport"]
+        command = arguments.get("command")
+        args = arguments.get("args", [])
+        env = arguments.get("env")
+        enabled = arguments.get("enabled", True)
+        metadata = arguments.get("metadata", {})
+
+        # Build config
+        config = {}
+        if transport == "stdio":
+            if not command:
+                return [TextContent(
+                    type="text",
+                    text="❌ STDIO transport requires 'command' parameter"
+                )]
+            config["command"] = command
+            config["args"] = args
+            config["env"] = env
+
+        # Create ServerConfig
+        server_config = ServerConfig(
+            server_id=server_id,
+            name=name,
+            transport=transport,
+            config=config,
+            enabled=enabled,
+            metadata=metadata
+        )
 
-                # Check if server exists
-                exists = server_id in registry.servers
-                action = "Updated" if exists else "Added"
+        # Load current registry
+        await self.mcp_clients.flush_registry()
+        registry = await self.storage.load_registry()
 
-                # Add/update server
-                registry.servers[server_id] = server_config
+        # Check if server exists
+        exists = server_id in registry.servers
+        action = "Updated" if exists else "Added"
 
-                # Save registry
-                await self.storage.save_registry(registry)
+        # Add/update server
+        registry.servers[server_id] = server_config
 
-                # Reload registry in MCP client manager
-                await self.mcp_clients.reload_registry()
-                print(f"[Skillflow] Registry reloaded after adding server '{server_id}'")
+        # Save registry
+        await self.storage.save_registry(registry)
 
-                # Invalidate upstream tool cache for this server
-                await self._upstream_tool_cache.invalidate(server_id)
+        # Reload registry in MCP client manager
+        await self.mcp_clients.reload_registry()
+        print(f"[Skillflow] Registry reloaded after adding server '{server_id}'")
 
-                return [TextContent(
-                    type="text",
-                    text=f"✅ {action} MCP server '{server_id}' ({name})\n"
-                         f"Transport: {transport}\n"
-                         f"Enabled: {enabled}\n"
-                         f"Total servers: {len(registry.servers)}\n\n"
-                         f"⚠️ Note: New tools will appear after you call list_tools() again or refresh your MCP client.\n"
-                         f"You can also call 'refresh_upstream_tools' to fetch tools immediately."
-                )]
+        # Invalidate upstream tool cache for this server
+        await self._invalidate_upstream_tools(server_id)
 
-            if tool_name == "remove_mcp_server":
-                """Remove an MCP server."""
-                server_id = arguments["server_id"]
+        return [TextContent(
+            type="text",
+            text=f"✅ {action} MCP server '{server_id}' ({name})\n"
+                 f"Transport: {transport}\n"
+                 f"Enabled: {enabled}\n"
+                 f"Total servers: {len(registry.servers)}\n\n"
+                 f"⚠️ Note: New tools will appear after you call list_tools() again or refresh your MCP client.\n"
+                 f"You can also call 'refresh_upstream_tools' to fetch tools immediately."
+        )]
 
-                # Load current registry
-                registry = await self.storage.load_registry()
+    async def _handle_remove_mcp_server(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Remove an MCP server."""
+        server_id = arguments["server_id"]
 
-                # Check if server exists
-                if server_id not in registry.servers:
-                    return [TextContent(
-                        type="text",
-                        text=f"❌ Server '{server_id}' not found"
-                    )]
+        # Load current registry
+        await self.mcp_clients.flush_registry()
+        registry = await self.storage.load_registry()
 
-                # Remove server
-                server_name = registry.servers[server_id].name
-                del registry.servers[server_id]
+        # Check if server exists
+        if server_id not in registry.servers:
+            return [TextContent(
+                type="text",
+                text=f"❌ Server '{server_id}' not found"
+            )]
 
-                # Save registry
-                await self.storage.save_registry(registry)
+        # Remove server
+        server_name = registry.servers[server_id].name
+        del registry.servers[server_id]
 
-                # Reload registry in MCP client manager
-                await self.mcp_clients.reload_registry()
-                print(f"[Skillflow] Registry reloaded after removing server '{server_id}'")
+        # Save registry
+        await self.storage.save_registry(registry)
 
-                # Invalidate upstream tool cache for this server
-                await self._upstream_tool_cache.invalidate(server_id)
+        # Reload registry in MCP client manager
+        await self.mcp_clients.reload_registry()
+        print(f"[Skillflow] Registry reloaded after removing server '{server_id}'")
 
-                # Disconnect if currently connected
-                await self.mcp_clients.disconnect_server(server_id)
+        # Invalidate upstream tool cache for this server
+        await self._invalidate_upstream_tools(server_id)
 
-                return [TextContent(
-                    type="text",
-                    text=f"✅ Removed MCP server '{server_id}' ({server_name})\n"
-                         f"Remaining servers: {len(registry.servers)}\n\n"
-                         f"⚠️ Note: Tools from this server will be removed after you refresh your MCP client."
-                )]
+        # Disconnect if currently connected
+        await self.mcp_clients.disconnect_server(server_id)
 
-            # Unknown tool name
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Unknown tool: {tool_name}",
-                )
-            ]
+        return [TextContent(
+            type="text",
+            text=f"✅ Removed MCP server '{server_id}' ({server_name})\n"
+                 f"Remaining servers: {len(registry.servers)}\n\n"
+                 f"⚠️ Note: Tools from this server will be removed after you refresh your MCP client."
+        )]
 
     async def _register_skill_tools(self):
         """Register skill tools (now handled dynamically in handle_tool_call).
@@ -1560,7 +1583,71 @@ class SkillFlowServer:
             print(f"[Skillflow] {error_msg}")
             return [], error_msg
 
-    async def _get_upstream_tools(self) -> list[Tool]:
+    async def _invalidate_upstream_tools(self, server_id: Optional[str] = None):
+        """Drop cached upstream tools so the next list_tools refetches them.
+
+        Args:
+            server_id: Server whose cached tools to drop (None for all servers)
+        """
+        # Expire the client manager's lists too, or a refetch here would
+        # just be answered from its cache
+        self.mcp_clients.expire_lists(server_id)
+        await self._upstream_tool_cache.invalidate(server_id)
+
+    async def _test_upstream_connection(self, server_config) -> dict[str, Any]:
+        """Test the connection to one upstream server for debug_upstream_tools.
+
+        Args:
+            server_config: Server configuration
+
+        Returns:
+            Connection test result; the connection is cleaned up on failure
+        """
+        server_id = server_config.server_id
+
+        try:
+            print(f"[Debug] Testing connection to {server_id}...")
+
+            try:
+                tools = await asyncio.wait_for(
+                    self.mcp_clients.list_tools(server_id),
+                    timeout=30.0
+                )
+
+                return {
+                    "status": "success",
+                    "tools_count": len(tools),
+                    "sample_tools": [t["name"] for t in tools[:3]]
+                }
+
+            except asyncio.TimeoutError:
+                # Clean up partial connection to avoid resource leak
+                print(f"[Debug] Timeout on {server_id}, cleaning up...")
+                await self.mcp_clients.disconnect_server(server_id)
+
+                return {
+                    "status": "timeout",
+                    "error": "Connection timed out after 30 seconds (cleaned up)"
+                }
+
+        except Exception as e:
+            import traceback
+
+            # CRITICAL: Clean up connection on ANY error to prevent process leak
+            print(f"[Debug] Error on {server_id}, cleaning up...")
+            try:
+                await self.mcp_clients.disconnect_server(server_id)
+            except:
+                pass  # Ignore cleanup errors
+
+            return {
+                "status": "error",
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "traceback": traceback.format_exc()
+            }
+
+    async def _get_upstream_tools(self, force_refresh: bool = False) -> list[Tool]:
         """Get all tools from upstream servers and create proxy tools.
 
         Optimized with:
@@ -1568,18 +1655,22 @@ class SkillFlowServer:
         - Tool caching (5 minute TTL)
         - Timeout isolation (one slow server doesn't block others)
 
+        Args:
+            force_refresh: Drop cached tools and refetch from every server
+
         Returns:
             List of proxy tools with prefixed names
         """
-        import time
-        start_time = time.time()
+        if force_refresh:
+            await self._invalidate_upstream_tools()
+
+        start_time = time.perf_counter()
 
         upstream_tools = []
         errors = []
 
         try:
-            servers = await self.mcp_clients.list_servers()
-            enabled_servers = [s for s in servers if s.enabled]
+            enabled_servers = list(await self.mcp_clients.iter_servers(enabled_only=True))
 
             if not enabled_servers:
                 print("[Skillflow] No enabled upstream servers")
@@ -1617,7 +1708,7 @@ class SkillFlowServer:
             print(f"[Skillflow] {error_msg}")
             errors.append(error_msg)
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
         print(f"[Skillflow] Fetched {len(upstream_tools)} proxy tools in {elapsed_ms:.0f}ms")
 
         if errors:
@@ -1656,448 +1747,449 @@ class SkillFlowServer:
 
     def _setup_list_tools(self):
         """Setup the list_tools handler."""
-        @self.server.list_tools()
-        async def list_tools() -> list[Tool]:
-            """List all available tools including skills and upstream server tools."""
-            # Get base tools (recording, management, etc.)
-            base_tools = [
-                Tool(
-                    name="start_recording",
-                    description="Start recording tool calls into a session",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "session_name": {
-                                "type": "string",
-                                "description": "Optional name for the session",
-                            },
+        # Base tools (recording, management, etc.) are static, so build them
+        # once rather than on every list_tools request
+        base_tools = [
+            Tool(
+                name="start_recording",
+                description="Start recording tool calls into a session",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "session_name": {
+                            "type": "string",
+                            "description": "Optional name for the session",
                         },
                     },
-                ),
-                Tool(
-                    name="stop_recording",
-                    description="Stop the active recording session",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                Tool(
-                    name="list_recording_sessions",
-                    description="List all recording sessions",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                Tool(
-                    name="create_skill_from_session",
-                    description="Create a skill from a recording session with configurable concurrency and step selection",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "session_id": {"type": "string"},
-                            "skill_id": {"type": "string"},
-                            "name": {"type": "string"},
-                            "description": {"type": "string"},
-                            "tags": {"type": "array", "items": {"type": "string"}},
-                            "expose_params": {
-                                "type": "array",
-                                "items": {"type": "object"},
-                            },
-                            "step_indices": {
-                                "type": "array",
-                                "items": {"type": "integer"},
-                                "description": "Specific step indices to include (1-indexed). If omitted, includes all steps. Example: [1, 3, 5]",
-                            },
-                            "start_index": {
-                                "type": "integer",
-                                "description": "Start index for step range (1-indexed, inclusive). Used with end_index for range selection.",
-                            },
-                            "end_index": {
-                                "type": "integer",
-                                "description": "End index for step range (1-indexed, inclusive). Used with start_index for range selection.",
-                            },
-                            "concurrency_mode": {
-                                "type": "string",
-                                "enum": ["sequential", "phased", "full_parallel"],
-                                "description": "Execution mode: sequential (default, one-by-one), phased (groups run in parallel), or full_parallel (maximum parallelism)",
-                                "default": "sequential",
-                            },
-                            "concurrency_phases": {
-                                "type": "object",
-                                "description": "For phased mode: mapping of phase_id to list of node_ids. Example: {'phase1': ['step_1', 'step_2'], 'phase2': ['step_3']}",
-                            },
-                            "max_parallel": {
-                                "type": "integer",
-                                "description": "Maximum number of parallel tasks (optional, applies to parallel modes)",
-                            },
+                },
+            ),
+            Tool(
+                name="stop_recording",
+                description="Stop the active recording session",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            Tool(
+                name="list_recording_sessions",
+                description="List all recording sessions",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            Tool(
+                name="create_skill_from_session",
+                description="Create a skill from a recording session with configurable concurrency and step selection",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "session_id": {"type": "string"},
+                        "skill_id": {"type": "string"},
+                        "name": {"type": "string"},
+                        "description": {"type": "string"},
+                        "tags": {"type": "array", "items": {"type": "string"}},
+                        "expose_params": {
+                            "type": "array",
+                            "items": {"type": "object"},
                         },
-                        "required": ["session_id", "skill_id", "name", "description"],
-                    },
-                ),
-                Tool(
-                    name="list_skills",
-                    description="List all skills",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string"},
-                            "tags": {"type": "array", "items": {"type": "string"}},
+                        "step_indices": {
+                            "type": "array",
+                            "items": {"type": "integer"},
+                            "description": "Specific step indices to include (1-indexed). If omitted, includes all steps. Example: [1, 3, 5]",
                         },
-                    },
-                ),
-                Tool(
-                    name="get_skill",
-                    description="Get detailed skill information",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "skill_id": {"type": "string"},
-                            "version": {"type": "integer"},
+                        "start_index": {
+                            "type": "integer",
+                            "description": "Start index for step range (1-indexed, inclusive). Used with end_index for range selection.",
                         },
-                        "required": ["skill_id"],
-                    },
-                ),
-                Tool(
-                    name="delete_skill",
-                    description="Delete a skill",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "skill_id": {"type": "string"},
-                            "hard": {"type": "boolean"},
+                        "end_index": {
+                            "type": "integer",
+                            "description": "End index for step range (1-indexed, inclusive). Used with start_index for range selection.",
                         },
-                        "required": ["skill_id"],
-                    },
-                ),
-                Tool(
-                    name="get_run_status",
-                    description="Get status of a skill run",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "run_id": {"type": "string"},
+                        "concurrency_mode": {
+                            "type": "string",
+                            "enum": ["sequential", "phased", "full_parallel"],
+                            "description": "Execution mode: sequential (default, one-by-one), phased (groups run in parallel), or full_parallel (maximum parallelism)",
+                            "default": "sequential",
                         },
-                        "required": ["run_id"],
-                    },
-                ),
-                Tool(
-                    name="cancel_run",
-                    description="Cancel an active skill run",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "run_id": {"type": "string"},
+                        "concurrency_phases": {
+                            "type": "object",
+                            "description": "For phased mode: mapping of phase_id to list of node_ids. Example: {'phase1': ['step_1', 'step_2'], 'phase2': ['step_3']}",
                         },
-                        "required": ["run_id"],
-                    },
-                ),
-                Tool(
-                    name="register_upstream_server",
-                    description="Register an upstream MCP server",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "server_id": {"type": "string"},
-                            "name": {"type": "string"},
-                            "transport": {"type": "string"},
-                            "config": {"type": "object"},
+                        "max_parallel": {
+                            "type": "integer",
+                            "description": "Maximum number of parallel tasks (optional, applies to parallel modes)",
                         },
-                        "required": ["server_id", "name", "transport", "config"],
                     },
-                ),
-                Tool(
-                    name="list_upstream_servers",
-                    description="List all registered upstream servers",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                Tool(
-                    name="list_upstream_resources",
-                    description="List all resources from an upstream MCP server",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "server_id": {
-                                "type": "string",
-                                "description": "ID of the upstream server",
-                            },
+                    "required": ["session_id", "skill_id", "name", "description"],
+                },
+            ),
+            Tool(
+                name="list_skills",
+                description="List all skills",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {"type": "string"},
+                        "tags": {"type": "array", "items": {"type": "string"}},
+                    },
+                },
+            ),
+            Tool(
+                name="get_skill",
+                description="Get detailed skill information",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "skill_id": {"type": "string"},
+                        "version": {"type": "integer"},
+                    },
+                    "required": ["skill_id"],
+                },
+            ),
+            Tool(
+                name="delete_skill",
+                description="Delete a skill",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "skill_id": {"type": "string"},
+                        "hard": {"type": "boolean"},
+                    },
+                    "required": ["skill_id"],
+                },
+            ),
+            Tool(
+                name="get_run_status",
+                description="Get status of a skill run",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "run_id": {"type": "string"},
+                    },
+                    "required": ["run_id"],
+                },
+            ),
+            Tool(
+                name="cancel_run",
+                description="Cancel an active skill run",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "run_id": {"type": "string"},
+                    },
+                    "required": ["run_id"],
+                },
+            ),
+            Tool(
+                name="register_upstream_server",
+                description="Register an upstream MCP server",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "server_id": {"type": "string"},
+                        "name": {"type": "string"},
+                        "transport": {"type": "string"},
+                        "config": {"type": "object"},
+                    },
+                    "required": ["server_id", "name", "transport", "config"],
+                },
+            ),
+            Tool(
+                name="list_upstream_servers",
+                description="List all registered upstream servers",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            Tool(
+                name="list_upstream_resources",
+                description="List all resources from an upstream MCP server",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "server_id": {
+                            "type": "string",
+                            "description": "ID of the upstream server",
                         },
-                        "required": ["server_id"],
                     },
-                ),
-                Tool(
-                    name="read_upstream_resource",
-                    description="Read a resource from an upstream MCP server",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "server_id": {
-                                "type": "string",
-                                "description": "ID of the upstream server",
-                            },
-                            "uri": {
-                                "type": "string",
-                                "description": "URI of the resource to read",
-                            },
+                    "required": ["server_id"],
+                },
+            ),
+            Tool(
+                name="read_upstream_resource",
+                description="Read a resource from an upstream MCP server",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "server_id": {
+                            "type": "string",
+                            "description": "ID of the upstream server",
+                        },
+                        "uri": {
+                            "type": "string",
+                            "description": "URI of the resource to read",
                         },
-                        "required": ["server_id", "uri"],
                     },
-                ),
-                Tool(
-                    name="list_upstream_prompts",
-                    description="List all prompts from an upstream MCP server",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "server_id": {
-                                "type": "string",
-                                "description": "ID of the upstream server",
-                            },
+                    "required": ["server_id", "uri"],
+                },
+            ),
+            Tool(
+                name="list_upstream_prompts",
+                description="List all prompts from an upstream MCP server",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "server_id": {
+                            "type": "string",
+                            "description": "ID of the upstream server",
                         },
-                        "required": ["server_id"],
                     },
-                ),
-                Tool(
-                    name="get_upstream_prompt",
-                    description="Get a prompt from an upstream MCP server",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "server_id": {
-                                "type": "string",
-                                "description": "ID of the upstream server",
-                            },
-                            "prompt_name": {
-                                "type": "string",
-                                "description": "Name of the prompt to get",
-                            },
-                            "arguments": {
-                                "type": "object",
-                                "description": "Arguments to pass to the prompt (optional)",
-                            },
+                    "required": ["server_id"],
+                },
+            ),
+            Tool(
+                name="get_upstream_prompt",
+                description="Get a prompt from an upstream MCP server",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "server_id": {
+                            "type": "string",
+                            "description": "ID of the upstream server",
+                        },
+                        "prompt_name": {
+                            "type": "string",
+                            "description": "Name of the prompt to get",
+                        },
+                        "arguments": {
+                            "type": "object",
+                            "description": "Arguments to pass to the prompt (optional)",
                         },
-                        "required": ["server_id", "prompt_name"],
                     },
-                ),
-                Tool(
-                    name="debug_upstream_tools",
-                    description="Debug tool to check if upstream tools are being proxied correctly",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                Tool(
-                    name="debug_skill_tools",
-                    description="Debug tool to check skill tool registration status",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                Tool(
-                    name="debug_skill_definition",
-                    description="Debug tool to inspect skill definition and compare with source recording",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "skill_id": {
-                                "type": "string",
-                                "description": "ID of the skill to inspect",
-                            },
+                    "required": ["server_id", "prompt_name"],
+                },
+            ),
+            Tool(
+                name="debug_upstream_tools",
+                description="Debug tool to check if upstream tools are being proxied correctly",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            Tool(
+                name="debug_skill_tools",
+                description="Debug tool to check skill tool registration status",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            Tool(
+                name="debug_skill_definition",
+                description="Debug tool to inspect skill definition and compare with source recording",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "skill_id": {
+                            "type": "string",
+                            "description": "ID of the skill to inspect",
                         },
-                        "required": ["skill_id"],
                     },
-                ),
-                Tool(
-                    name="debug_skill_execution",
-                    description="Debug tool to trace skill execution and diagnose parameter corruption during replay",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "run_id": {
-                                "type": "string",
-                                "description": "ID of the skill execution run to inspect",
-                            },
+                    "required": ["skill_id"],
+                },
+            ),
+            Tool(
+                name="debug_skill_execution",
+                description="Debug tool to trace skill execution and diagnose parameter corruption during replay",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "run_id": {
+                            "type": "string",
+                            "description": "ID of the skill execution run to inspect",
                         },
-                        "required": ["run_id"],
                     },
-                ),
-                Tool(
-                    name="debug_recording_session",
-                    description="Debug tool to inspect recording session details and diagnose text scrambling issues",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "session_id": {
-                                "type": "string",
-                                "description": "ID of the recording session to inspect",
-                            },
+                    "required": ["run_id"],
+                },
+            ),
+            Tool(
+                name="debug_recording_session",
+                description="Debug tool to inspect recording session details and diagnose text scrambling issues",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "session_id": {
+                            "type": "string",
+                            "description": "ID of the recording session to inspect",
                         },
-                        "required": ["session_id"],
                     },
-                ),
-                # Cache management tools
-                Tool(
-                    name="get_cache_stats",
-                    description="Get upstream tool cache statistics (hit rate, cached servers, etc.)",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                Tool(
-                    name="invalidate_cache",
-                    description="Invalidate upstream tool cache for a specific server or all servers",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "server_id": {
-                                "type": "string",
-                                "description": "Server ID to invalidate (omit to clear all)",
-                            },
+                    "required": ["session_id"],
+                },
+            ),
+            # Cache management tools
+            Tool(
+                name="get_cache_stats",
+                description="Get upstream tool cache statistics (hit rate, cached servers, etc.)",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            Tool(
+                name="invalidate_cache",
+                description="Invalidate upstream tool cache for a specific server or all servers",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "server_id": {
+                            "type": "string",
+                            "description": "Server ID to invalidate (omit to clear all)",
                         },
                     },
-                ),
-                Tool(
-                    name="refresh_upstream_tools",
-                    description="Force refresh of upstream tools by invalidating cache and re-fetching",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "server_id": {
-                                "type": "string",
-                                "description": "Server ID to refresh (omit to refresh all)",
-                            },
+                },
+            ),
+            Tool(
+                name="refresh_upstream_tools",
+                description="Force refresh of upstream tools by invalidating cache and re-fetching",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "server_id": {
+                            "type": "string",
+                            "description": "Server ID to refresh (omit to refresh all)",
                         },
                     },
-                ),
-                Tool(
-                    name="debug_registry",
-                    description="Debug registry loading - shows file path, content, and loaded state (for troubleshooting)",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                # Skill cache management tools
-                Tool(
-                    name="get_skill_cache_stats",
-                    description="Get skill cache statistics (hit rate, cached skills, tool list cache)",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                Tool(
-                    name="invalidate_skill_cache",
-                    description="Invalidate skill cache for a specific skill or all skills",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "skill_id": {
-                                "type": "string",
-                                "description": "Skill ID to invalidate (omit to clear all)",
-                            },
+                },
+            ),
+            Tool(
+                name="debug_registry",
+                description="Debug registry loading - shows file path, content, and loaded state (for troubleshooting)",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            # Skill cache management tools
+            Tool(
+                name="get_skill_cache_stats",
+                description="Get skill cache statistics (hit rate, cached skills, tool list cache)",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            Tool(
+                name="invalidate_skill_cache",
+                description="Invalidate skill cache for a specific skill or all skills",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "skill_id": {
+                            "type": "string",
+                            "description": "Skill ID to invalidate (omit to clear all)",
                         },
                     },
-                ),
-                Tool(
-                    name="force_skill_reload",
-                    description="Force reload of skills from disk and clear all caches",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                Tool(
-                    name="trigger_hot_reload",
-                    description="Manually trigger hot-reload check (useful for immediate reload without waiting for poll interval)",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                # Configuration management tools
-                Tool(
-                    name="import_claude_code_config",
-                    description="Import MCP server configuration from Claude Code format (JSON string or file path)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "config_json": {
-                                "type": "string",
-                                "description": "JSON string containing Claude Code configuration",
-                            },
-                            "merge": {
-                                "type": "boolean",
-                                "description": "If true, merge with existing config; if false, replace existing servers (default: true)",
-                                "default": True,
-                            },
-                            "overwrite": {
-                                "type": "boolean",
-                                "description": "If true, overwrite existing servers during merge (default: false)",
-                                "default": False,
-                            },
+                },
+            ),
+            Tool(
+                name="force_skill_reload",
+                description="Force reload of skills from disk and clear all caches",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            Tool(
+                name="trigger_hot_reload",
+                description="Manually trigger hot-reload check (useful for immediate reload without waiting for poll interval)",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            # Configuration management tools
+            Tool(
+                name="import_claude_code_config",
+                description="Import MCP server configuration from Claude Code format (JSON string or file path)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "config_json": {
+                            "type": "string",
+                            "description": "JSON string containing Claude Code configuration",
+                        },
+                        "merge": {
+                            "type": "boolean",
+                            "description": "If true, merge with existing config; if false, replace existing servers (default: true)",
+                            "default": True,
+                        },
+                        "overwrite": {
+                            "type": "boolean",
+                            "description": "If true, overwrite existing servers during merge (default: false)",
+                            "default": False,
                         },
-                        "required": ["config_json"],
                     },
-                ),
-                Tool(
-                    name="export_claude_code_config",
-                    description="Export current MCP server configuration in Claude Code compatible format",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                Tool(
-                    name="validate_mcp_config",
-                    description="Validate MCP server configuration (JSON string or current config)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "config_json": {
-                                "type": "string",
-                                "description": "JSON string to validate (omit to validate current config)",
-                            },
+                    "required": ["config_json"],
+                },
+            ),
+            Tool(
+                name="export_claude_code_config",
+                description="Export current MCP server configuration in Claude Code compatible format",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            Tool(
+                name="validate_mcp_config",
+                description="Validate MCP server configuration (JSON string or current config)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "config_json": {
+                            "type": "string",
+                            "description": "JSON string to validate (omit to validate current config)",
                         },
                     },
-                ),
-                Tool(
-                    name="add_mcp_server",
-                    description="Add or update a single MCP server in configuration",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "server_id": {
-                                "type": "string",
-                                "description": "Unique server ID",
-                            },
-                            "name": {
-                                "type": "string",
-                                "description": "Human-readable server name",
-                            },
-                            "transport": {
-                                "type": "string",
-                                "enum": ["stdio", "http_sse", "websocket"],
-                                "description": "Transport type",
-                            },
-                            "command": {
-                                "type": "string",
-                                "description": "Command to run (for stdio transport)",
-                            },
-                            "args": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Command arguments",
-                                "default": [],
-                            },
-                            "env": {
-                                "type": "object",
-                                "description": "Environment variables",
-                            },
-                            "enabled": {
-                                "type": "boolean",
-                                "description": "Whether server is enabled",
-                                "default": True,
-                            },
-                            "metadata": {
-                                "type": "object",
-                                "description": "Additional metadata (description, tools, etc.)",
-                                "default": {},
-                            },
+                },
+            ),
+            Tool(
+                name="add_mcp_server",
+                description="Add or update a single MCP server in configuration",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "server_id": {
+                            "type": "string",
+                            "description": "Unique server ID",
+                        },
+                        "name": {
+                            "type": "string",
+                            "description": "Human-readable server name",
+                        },
+                        "transport": {
+                            "type": "string",
+                            "enum": ["stdio", "http_sse", "websocket"],
+                            "description": "Transport type",
+                        },
+                        "command": {
+                            "type": "string",
+                            "description": "Command to run (for stdio transport)",
+                        },
+                        "args": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Command arguments",
+                            "default": [],
+                        },
+                        "env": {
+                            "type": "object",
+                            "description": "Environment variables",
+                        },
+                        "enabled": {
+                            "type": "boolean",
+                            "description": "Whether server is enabled",
+                            "default": True,
+                        },
+                        "metadata": {
+                            "type": "object",
+                            "description": "Additional metadata (description, tools, etc.)",
+                            "default": {},
                         },
-                        "required": ["server_id", "name", "transport"],
                     },
-                ),
-                Tool(
-                    name="remove_mcp_server",
-                    description="Remove an MCP server from configuration",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "server_id": {
-                                "type": "string",
-                                "description": "Server ID to remove",
-                            },
+                    "required": ["server_id", "name", "transport"],
+                },
+            ),
+            Tool(
+                name="remove_mcp_server",
+                description="Remove an MCP server from configuration",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "server_id": {
+                            "type": "string",
+                            "description": "Server ID to remove",
                         },
-                        "required": ["server_id"],
                     },
-                ),
-            ]
+                    "required": ["server_id"],
+                },
+            ),
+        ]
 
+        @self.server.list_tools()
+        async def list_tools() -> list[Tool]:
+            """List all available tools including skills and upstream server tools."""
             # Add skill tools
             skill_tools_data = await self.skill_manager.list_as_mcp_tools()
             skill_tools = [
@@ -2478,6 +2570,11 @@ Example:
 
 def main():
     """Main entry point."""
+    # Every upstream RPC is a handful of small awaits, so loop overhead adds
+    # up; use uvloop when installed (pip install skillflow-mcp[fast])
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     server = SkillFlowServer()
     server.run()
 
@@ -10,7 +10,7 @@ from typing import Any, Optional
 
 import aiofiles
 from filelock import FileLock
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from .schemas import (
     RecordingSession,
@@ -23,6 +23,9 @@ from .skill_cache import SkillCache
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole run log in one pydantic-core call
+_RUN_LOG_ADAPTER = TypeAdapter(list[NodeExecution])
+
 
 class StorageError(Exception):
     """Base exception for storage errors."""
@@ -55,6 +58,7 @@ class StorageLayer:
         self.sessions_dir = self.data_dir / "sessions"
         self.runs_dir = self.data_dir / "runs"
         self.registry_dir = self.data_dir / "registry"
+        self.tool_cache_dir = self.data_dir / "tool_cache"
 
         # In-memory index for fast lookups (metadata only)
         self._skill_index: dict[str, SkillMeta] = {}
@@ -65,7 +69,7 @@ class StorageLayer:
         self._skill_cache = SkillCache(ttl_seconds=cache_ttl) if enable_cache else None
 
         # Ensure directories exist
-        for dir_path in [self.skills_dir, self.sessions_dir, self.runs_dir, self.registry_dir]:
+        for dir_path in [self.skills_dir, self.sessions_dir, self.runs_dir, self.registry_dir, self.tool_cache_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
 
     async def initialize(self):
@@ -265,7 +269,9 @@ class StorageLayer:
             session: The recording session to save
         """
         session_path = self._get_session_path(session.id)
-        await self._atomic_write_json(session_path, session.model_dump(mode="json"))
+        # Serialize in one pass through pydantic-core rather than building
+        # a dict tree for json.dumps
+        await self._atomic_write_text(session_path, session.model_dump_json(indent=2))
 
     async def load_session(self, session_id: str) -> RecordingSession:
         """Load a recording session.
@@ -285,8 +291,7 @@ class StorageLayer:
 
         async with aiofiles.open(session_path, "r", encoding="utf-8") as f:
             content = await f.read()
-            data = json.loads(content)
-            return RecordingSession(**data)
+            return RecordingSession.model_validate_json(content)
 
     async def list_sessions(self) -> list[str]:
         """List all recording session IDs.
@@ -324,7 +329,7 @@ class StorageLayer:
 
         with lock:
             async with aiofiles.open(log_path, "a", encoding="utf-8") as f:
-                line = json.dumps(execution.model_dump(mode="json")) + "\n"
+                line = execution.model_dump_json() + "\n"
                 await f.write(line)
 
     async def load_run_log(self, run_id: str) -> list[NodeExecution]:
@@ -343,14 +348,13 @@ class StorageLayer:
 
             log_path = date_dir / f"{run_id}.jsonl"
             if log_path.exists():
-                executions = []
                 async with aiofiles.open(log_path, "r", encoding="utf-8") as f:
-                    async for line in f:
-                        line = line.strip()
-                        if line:
-                            data = json.loads(line)
-                            executions.append(NodeExecution(**data))
-                return executions
+                    content = await f.read()
+
+                # Join the JSONL records into one array and validate the
+                # batch at once instead of record by record
+                records = [line for line in content.splitlines() if line.strip()]
+                return _RUN_LOG_ADAPTER.validate_json("[" + ",".join(records) + "]")
 
         return []
 
@@ -410,6 +414,52 @@ class StorageLayer:
             logger.error(f"Failed to load registry: {e}", exc_info=True)
             return ServerRegistry()
 
+    # ========== Upstream Tool Cache Storage ==========
+
+    def _get_tool_cache_path(self, server_id: str) -> Path:
+        """Get file path for a server's cached tool list."""
+        return self.tool_cache_dir / f"{server_id}.json"
+
+    async def save_tool_cache(self, server_id: str, tools: list[dict[str, Any]], digest: str) -> None:
+        """Persist the last known tool list of an upstream server.
+
+        Args:
+            server_id: ID of the server
+            tools: Tool descriptors
+            digest: Content hash of the tool list
+        """
+        path = self._get_tool_cache_path(server_id)
+        await self._atomic_write_json(path, {"hash": digest, "tools": tools})
+
+    async def load_tool_cache(self, server_id: str) -> Optional[tuple[list[dict[str, Any]], str]]:
+        """Load the last known tool list of an upstream server.
+
+        Args:
+            server_id: ID of the server
+
+        Returns:
+            Tuple of (tools, hash), or None if nothing is cached
+        """
+        path = self._get_tool_cache_path(server_id)
+        if not path.exists():
+            return None
+
+        try:
+            async with aiofiles.open(path, "r", encoding="utf-8") as f:
+                data = json.loads(await f.read())
+            return data["tools"], data["hash"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable tool cache for {server_id}: {e}")
+            return None
+
+    async def delete_tool_cache(self, server_id: str) -> None:
+        """Delete the cached tool list of an upstream server.
+
+        Args:
+            server_id: ID of the server
+        """
+        self._get_tool_cache_path(server_id).unlink(missing_ok=True)
+
     # ========== Helper Methods ==========
 
     async def _atomic_write_json(self, path: Path, data: Any) -> None:
@@ -419,11 +469,19 @@ class StorageLayer:
             path: Target file path
             data: Data to write (will be JSON serialized)
         """
+        await self._atomic_write_text(path, json.dumps(data, indent=2, ensure_ascii=False))
+
+    async def _atomic_write_text(self, path: Path, content: str) -> None:
+        """Atomically write already-serialized text to a file.
+
+        Args:
+            path: Target file path
+            content: Text to write
+        """
         tmp_path = path.with_suffix(".tmp")
 
         # Write to temp file
         async with aiofiles.open(tmp_path, "w", encoding="utf-8") as f:
-            content = json.dumps(data, indent=2, ensure_ascii=False)
             await f.write(content)
 
         # Atomic rename
@@ -0,0 +1,95 @@
+"""Minimal stdio MCP server used by the client tests.
+
+Speaks line-delimited JSON-RPC on stdin/stdout and exposes a single
+``echo`` tool. Set ``MOCK_MCP_DELAY`` to add latency to every response,
+``MOCK_MCP_NO_PING`` to reject ``ping`` as an unknown method, and
+``MOCK_MCP_TOOLS_FILE`` to a file of extra tool names (one per line) that
+is re-read on every ``tools/list``.
+"""
+
+import json
+import os
+import sys
+import time
+
+DELAY = float(os.environ.get("MOCK_MCP_DELAY", "0"))
+NO_PING = bool(os.environ.get("MOCK_MCP_NO_PING"))
+TOOLS_FILE = os.environ.get("MOCK_MCP_TOOLS_FILE")
+
+TOOLS = [
+    {
+        "name": "echo",
+        "description": "Echo the given text",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"text": {"type": "string"}},
+        },
+    }
+]
+
+
+def extra_tools():
+    """Return the tools listed in MOCK_MCP_TOOLS_FILE, if set."""
+    if not TOOLS_FILE or not os.path.exists(TOOLS_FILE):
+        return []
+    with open(TOOLS_FILE) as f:
+        names = [line.strip() for line in f if line.strip()]
+    return [{"name": name, "description": name, "inputSchema": {"type": "object"}}
+            for name in names]
+
+
+def handle(method, params):
+    """Return the result for a request method."""
+    if method == "initialize":
+        return {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {
+                "tools": {"listChanged": False},
+                "prompts": {},
+                "resources": {"listChanged": False},
+            },
+            "serverInfo": {"name": "mock", "version": "0.1.0"},
+        }
+    if method == "tools/list":
+        return {"tools": TOOLS + extra_tools()}
+    if method == "tools/call":
+        text = params.get("arguments", {}).get("text", "")
+        return {"content": [{"type": "text", "text": text}], "isError": False}
+    if method == "prompts/list":
+        return {"prompts": []}
+    if method == "resources/list":
+        return {"resources": []}
+    if method == "resources/templates/list":
+        return {"resourceTemplates": []}
+    if method == "ping" and not NO_PING:
+        return {}
+    raise ValueError(f"Unknown method: {method}")
+
+
+def main():
+    """Serve requests until stdin closes."""
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        message = json.loads(line)
+        if "id" not in message or "method" not in message:
+            continue  # Notification or response
+
+        if DELAY:
+            time.sleep(DELAY)
+
+        try:
+            response = {"jsonrpc": "2.0", "id": message["id"],
+                        "result": handle(message["method"], message.get("params", {}))}
+        except Exception as e:
+            response = {"jsonrpc": "2.0", "id": message["id"],
+                        "error": {"code": -32601, "message": str(e)}}
+
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Tests for skill file watching."""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from src.skillflow.file_watcher import (
+    WATCHDOG_AVAILABLE,
+    FileWatcher,
+    WatchdogFileWatcher,
+    _CoalescingCallback,
+    _is_skill_file,
+)
+
+
+def test_is_skill_file():
+    """Test matching of skill meta and version file names."""
+    assert _is_skill_file("meta.json")
+    assert _is_skill_file("v0001.json")
+    assert not _is_skill_file("var.json")
+    assert not _is_skill_file("notes.txt")
+    assert not _is_skill_file("")
+
+
+@pytest.mark.asyncio
+async def test_polling_watcher_detects_changes():
+    """Test that the polling watcher reports created and modified skills."""
+    created = []
+    changed = []
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        watcher = FileWatcher(
+            Path(tmpdir),
+            on_skill_changed=changed.append,
+            on_skill_created=created.append,
+        )
+
+        skill_dir = Path(tmpdir) / "demo"
+        skill_dir.mkdir()
+        (skill_dir / "meta.json").write_text("{}")
+        await watcher._check_for_changes()
+        assert created == ["demo"]
+
+        (skill_dir / "v0002.json").write_text("{}")
+        await watcher._check_for_changes()
+        await watcher._changed_dispatcher.drain()
+        assert changed == ["demo"]
+
+
+@pytest.mark.asyncio
+async def test_coalescing_callback_runs_once_per_burst():
+    """Test that overlapping changes to one skill collapse into one rerun."""
+    calls = []
+
+    def slow_callback(skill_id):
+        calls.append(skill_id)
+        time.sleep(0.05)
+
+    dispatcher = _CoalescingCallback(slow_callback, "test")
+    dispatcher.dispatch("demo")
+    await asyncio.sleep(0.01)
+
+    # Changes arriving while the first run is in flight are queued
+    for _ in range(4):
+        dispatcher.dispatch("demo")
+    await dispatcher.drain()
+
+    # One run for the first change, one coalesced rerun for the rest
+    assert calls == ["demo", "demo"]
+
+
+@pytest.mark.asyncio
+async def test_coalescing_callback_dispatch_does_not_block():
+    """Test that a burst dispatched before the first run starts runs once."""
+    calls = []
+    dispatcher = _CoalescingCallback(calls.append, "test")
+
+    for _ in range(5):
+        assert dispatcher.dispatch("demo") is None
+    assert calls == []
+
+    await dispatcher.drain()
+    assert calls == ["demo"]
+
+
+@pytest.mark.skipif(not WATCHDOG_AVAILABLE, reason="watchdog not installed")
+@pytest.mark.asyncio
+async def test_watchdog_processing_waits_for_running_pass():
+    """Test that a debounce firing mid-pass doesn't start a second pass."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        watcher = WatchdogFileWatcher(Path(tmpdir))
+        watcher._loop = asyncio.get_running_loop()
+        watcher._debounce_delay = 0.01
+        running = asyncio.create_task(asyncio.sleep(0.05))
+        watcher._event_task = running
+
+        watcher._start_processing()
+        assert watcher._event_task is running
+        assert watcher._debounce_handle is not None
+
+        await running
+        await asyncio.sleep(0.03)
+        assert watcher._event_task is not running
+        await watcher._event_task
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,25 @@
+"""Tests for the HTTP+SSE transport client."""
+
+import socket
+
+import pytest
+
+from src.skillflow.http_sse_client import _socket_factory
+
+
+def test_socket_factory_applies_options():
+    """Test that transport sockets disable Nagle and enable keepalive."""
+    addr_info = (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("127.0.0.1", 0))
+
+    sock = _socket_factory(addr_info)
+    try:
+        assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE) == 30
+    finally:
+        sock.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
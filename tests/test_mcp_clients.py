@@ -0,0 +1,433 @@
+"""Tests for upstream MCP client management."""
+
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.skillflow.mcp_clients import ConnectionPool, MCPClientManager, _max_concurrent_spawns
+from src.skillflow.native_mcp_client import _MAX_IN_FLIGHT, NativeMCPClient, Status
+from src.skillflow.schemas import TransportType
+from src.skillflow.server import SkillFlowServer
+from src.skillflow.storage import StorageLayer
+from src.skillflow.upstream_tool_cache import UpstreamToolCache
+
+MOCK_SERVER = str(Path(__file__).parent / "mock_mcp_server.py")
+
+
+@pytest.fixture
+async def manager():
+    """Create a client manager with a temporary registry."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = StorageLayer(tmpdir)
+        await storage.initialize()
+        manager = MCPClientManager(storage)
+        await manager.initialize()
+        yield manager
+        await manager.close_all()
+
+
+async def register_mock(manager, server_id, env=None):
+    """Register a mock stdio server."""
+    await manager.register_server(
+        server_id=server_id,
+        name=server_id,
+        transport=TransportType.STDIO,
+        config={"command": sys.executable, "args": [MOCK_SERVER], "env": env},
+    )
+
+
+@pytest.mark.asyncio
+async def test_connect_all(manager):
+    """Test connecting to every enabled server concurrently."""
+    await register_mock(manager, "alpha")
+    await register_mock(manager, "beta")
+
+    results = await manager.connect_all()
+
+    assert results == {"alpha": True, "beta": True}
+
+
+@pytest.mark.asyncio
+async def test_call_tool(manager):
+    """Test calling a tool on a lazily connected server."""
+    await register_mock(manager, "alpha")
+
+    tools = await manager.list_tools("alpha")
+    result = await manager.call_tool("alpha", "echo", {"text": "hi"})
+
+    assert [tool["name"] for tool in tools] == ["echo"]
+    assert result["content"][0]["text"] == "hi"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_connect_spawns_once(manager):
+    """Test that racing connects to one server share a single client."""
+    await register_mock(manager, "alpha")
+
+    clients = await asyncio.gather(*(manager.connect_server("alpha") for _ in range(5)))
+
+    assert all(client is clients[0] for client in clients)
+
+
+@pytest.mark.asyncio
+async def test_initialize_warms_up_enabled_servers(manager):
+    """Test that initialize connects enabled servers in the background."""
+    await register_mock(manager, "alpha")
+
+    await manager.initialize()
+    await asyncio.gather(*manager._warmup_tasks.values())
+
+    assert manager._clients["alpha"].status is Status.CONNECTED
+
+
+@pytest.mark.asyncio
+async def test_list_tools_cache(manager):
+    """Test that list results are cached and refreshed after the TTL."""
+    await register_mock(manager, "alpha")
+
+    first = await manager.list_tools("alpha")
+    assert await manager.list_tools("alpha") is first
+
+    manager._list_ttl = 0
+    refreshed = await manager.list_tools("alpha")
+    assert refreshed is not first
+    assert refreshed == first
+
+    await manager.disconnect_server("alpha")
+    assert ("alpha", "tools") not in manager._list_cache
+
+
+@pytest.mark.asyncio
+async def test_empty_capability_list_is_refreshed(manager, monkeypatch):
+    """Test that a capability declared as {} still gets its list refetched."""
+    await register_mock(manager, "alpha")
+    await manager.list_prompts("alpha")
+    refreshed = []
+    original_list_prompts = NativeMCPClient.list_prompts
+
+    async def counting_list_prompts(self):
+        refreshed.append(self.server_id)
+        return await original_list_prompts(self)
+
+    monkeypatch.setattr(NativeMCPClient, "list_prompts", counting_list_prompts)
+    manager._list_ttl = 0.0
+
+    await manager.list_prompts("alpha")
+
+    assert manager._clients["alpha"].capabilities["prompts"] == {}
+    assert refreshed == ["alpha"]
+
+
+@pytest.mark.asyncio
+async def test_list_tools_served_from_persisted_cache(manager):
+    """Test that a fresh manager answers list_tools from storage."""
+    await register_mock(manager, "alpha")
+    tools = await manager.list_tools("alpha")
+    await manager.flush_registry()
+
+    cold = MCPClientManager(manager.storage)
+    await cold.reload_registry()
+    try:
+        assert await cold.list_tools("alpha") == tools
+        assert "alpha" not in cold._clients
+
+        # The background refresh connects and keeps the list current
+        await cold._refresh_tasks["alpha"]
+        assert cold._clients["alpha"].status is Status.CONNECTED
+    finally:
+        await cold.close_all()
+
+
+@pytest.mark.asyncio
+async def test_idle_client_reused_after_ping(manager):
+    """Test that an idle but live client passes the health check."""
+    await register_mock(manager, "alpha")
+    client = await manager.connect_server("alpha")
+
+    client.last_response_at = 0.0
+    assert await manager._is_healthy(client)
+    assert await manager._ready_client("alpha") is client
+
+
+@pytest.mark.asyncio
+async def test_saturated_client_passes_health_check(manager):
+    """Test that a ping refused for back-pressure does not mark the client down."""
+    await register_mock(manager, "alpha")
+    client = await manager.connect_server("alpha")
+    placeholders = {-i - 1: client._loop.create_future() for i in range(_MAX_IN_FLIGHT)}
+    client._pending_requests.update(placeholders)
+    client.last_response_at = 0.0
+
+    try:
+        assert await manager._is_healthy(client)
+        assert await manager._ready_client("alpha") is client
+    finally:
+        for key in placeholders:
+            client._pending_requests.pop(key)
+
+
+@pytest.mark.asyncio
+async def test_client_rejecting_ping_is_not_respawned(manager):
+    """Test that an error reply to ping still counts as a live server."""
+    await register_mock(manager, "alpha", env={"MOCK_MCP_NO_PING": "1"})
+    client = await manager.connect_server("alpha")
+    client.last_response_at = 0.0
+
+    assert await manager._is_healthy(client)
+    result = await manager.call_tool("alpha", "echo", {"text": "still here"})
+    assert manager._clients["alpha"] is client
+    assert result["content"][0]["text"] == "still here"
+
+
+@pytest.mark.asyncio
+async def test_dead_client_is_respawned(manager):
+    """Test that a crashed server is replaced on the next call."""
+    await register_mock(manager, "alpha")
+    client = await manager.connect_server("alpha")
+
+    client.process.kill()
+    await client.process.wait()
+    assert not await manager._is_healthy(client)
+
+    result = await manager.call_tool("alpha", "echo", {"text": "again"})
+    assert manager._clients["alpha"] is not client
+    assert result["content"][0]["text"] == "again"
+    assert "alpha" not in manager._reconnect_attempts
+
+
+@pytest.mark.asyncio
+async def test_client_with_dead_writer_is_respawned(manager):
+    """Test that a live process whose writer died is replaced after a failed ping."""
+    await register_mock(manager, "alpha")
+    client = await manager.connect_server("alpha")
+
+    client._writer_task.cancel()
+    await asyncio.gather(client._writer_task, return_exceptions=True)
+    client.last_response_at = 0.0
+    assert client.is_alive
+
+    result = await manager.call_tool("alpha", "echo", {"text": "again"})
+
+    assert result["content"][0]["text"] == "again"
+    assert manager._clients.ready("alpha") is not client
+    assert manager._clients.connected_count() == 1
+    assert not client.is_alive
+
+
+@pytest.mark.asyncio
+async def test_registry_saves_are_coalesced(manager, monkeypatch):
+    """Test that a burst of registrations writes the registry once."""
+    saves = []
+    original = manager.storage.save_registry
+
+    async def counting_save(registry):
+        saves.append(len(registry.servers))
+        await original(registry)
+
+    monkeypatch.setattr(manager.storage, "save_registry", counting_save)
+
+    for i in range(5):
+        await register_mock(manager, f"server{i}")
+    assert saves == []
+
+    await manager.flush_registry()
+    assert saves == [5]
+
+    registry = await manager.storage.load_registry()
+    assert sorted(registry.servers) == [f"server{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_registry_loaded_once_without_initialize(manager, monkeypatch):
+    """Test that concurrent callers share a single lazy registry load."""
+    await register_mock(manager, "alpha")
+    await manager.flush_registry()
+
+    loads = []
+    original = manager.storage.load_registry
+
+    async def counting_load():
+        loads.append(1)
+        return await original()
+
+    monkeypatch.setattr(manager.storage, "load_registry", counting_load)
+
+    fresh = MCPClientManager(manager.storage)
+    results = await asyncio.gather(*(fresh.list_servers() for _ in range(5)))
+
+    assert len(loads) == 1
+    assert all([s.server_id for s in servers] == ["alpha"] for servers in results)
+
+
+@pytest.mark.asyncio
+async def test_disconnect_waits_for_inflight_call(manager):
+    """Test that disconnecting lets an in-flight call finish first."""
+    await register_mock(manager, "alpha", env={"MOCK_MCP_DELAY": "0.2"})
+    await manager.connect_server("alpha")
+
+    call = asyncio.create_task(manager.call_tool("alpha", "echo", {"text": "slow"}))
+    await asyncio.sleep(0.05)
+    assert manager._inflight["alpha"] == 1
+
+    await manager.disconnect_server("alpha")
+
+    result = await call
+    assert result["content"][0]["text"] == "slow"
+    assert "alpha" not in manager._inflight
+
+
+@pytest.mark.asyncio
+async def test_cancelled_handshake_stops_subprocess(manager, monkeypatch):
+    """Test that cancelling a connection mid-handshake reaps the process."""
+    await register_mock(manager, "alpha", env={"MOCK_MCP_DELAY": "0.5"})
+
+    started = []
+    original_start = NativeMCPClient.start
+
+    async def recording_start(self):
+        started.append(self)
+        await original_start(self)
+
+    monkeypatch.setattr(NativeMCPClient, "start", recording_start)
+
+    task = asyncio.create_task(manager.connect_server("alpha"))
+    await asyncio.sleep(0.1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert len(started) == 1
+    assert started[0].process is None
+    assert started[0].status is Status.STOPPED
+    assert "alpha" not in manager._clients
+
+
+@pytest.mark.asyncio
+async def test_close_all_kills_servers_that_do_not_stop(manager, monkeypatch):
+    """Test that close_all stops servers in parallel under a timeout."""
+    await register_mock(manager, "alpha")
+    await register_mock(manager, "beta")
+    await manager.connect_all()
+    processes = [manager._clients[sid].process for sid in ("alpha", "beta")]
+
+    async def hung_stop(self):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(NativeMCPClient, "stop", hung_stop)
+
+    await manager.close_all(timeout=0.2)
+
+    assert len(manager._clients) == 0
+    for process in processes:
+        assert await asyncio.wait_for(process.wait(), timeout=5) is not None
+
+
+@pytest.mark.asyncio
+async def test_connect_emits_status_events(manager):
+    """Test that connect_server reports handshake progress."""
+    await register_mock(manager, "alpha")
+    events = []
+
+    async def on_event(event):
+        events.append((event["stage"], event["done"]))
+
+    await manager.connect_server("alpha", on_event=on_event)
+    await manager.connect_server("alpha", on_event=on_event)
+
+    assert events == [("connecting", False), ("connected", True)]
+
+
+@pytest.mark.asyncio
+async def test_spawn_limit_bounds_concurrent_handshakes(manager, monkeypatch):
+    """Test that stdio spawns beyond the limit wait their turn."""
+    await register_mock(manager, "alpha")
+    await register_mock(manager, "beta")
+    manager._spawn_sem = asyncio.Semaphore(1)
+
+    active = peak = 0
+    original_start = NativeMCPClient.start
+
+    async def counting_start(self):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            await original_start(self)
+        finally:
+            active -= 1
+
+    monkeypatch.setattr(NativeMCPClient, "start", counting_start)
+
+    results = await manager.connect_all()
+
+    assert all(results.values())
+    assert peak == 1
+
+
+def test_max_concurrent_spawns_env(monkeypatch):
+    """Test reading the spawn limit from the environment."""
+    monkeypatch.setenv("SKILLFLOW_MAX_CONCURRENT_SPAWNS", "3")
+    assert _max_concurrent_spawns() == 3
+
+    monkeypatch.setenv("SKILLFLOW_MAX_CONCURRENT_SPAWNS", "zero")
+    assert 1 <= _max_concurrent_spawns() <= 8
+
+
+def test_connection_pool_slots():
+    """Test pool readiness tracking and slot reuse."""
+    pool = ConnectionPool()
+    a, b, c = object(), object(), object()
+
+    pool.add("a", a)
+    pool.add("b", b)
+    assert pool.ready("a") is a
+    assert pool.connected_count() == 2
+
+    pool.mark_down("a")
+    assert pool.ready("a") is None
+    assert pool.get("a") is a
+    assert pool.connected_count() == 1
+
+    assert pool.remove("a") is a
+    assert "a" not in pool
+    pool.add("c", c)
+    assert pool._slot["c"] == 0
+    assert pool["c"] is c
+    assert sorted(pool) == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_upstream_tool_changes_show_after_invalidation(manager, tmp_path):
+    """Test that invalidation reaches every tool cache layer."""
+    # Only the attributes the upstream tool listing touches
+    server = SkillFlowServer.__new__(SkillFlowServer)
+    server.mcp_clients = manager
+    server._upstream_tool_cache = UpstreamToolCache()
+    server._hash_to_server_id = {}
+
+    tools_file = tmp_path / "tools.txt"
+    await register_mock(manager, "alpha", env={"MOCK_MCP_TOOLS_FILE": str(tools_file)})
+    assert len(await server._get_upstream_tools()) == 1
+
+    # A tool added upstream of a connected server
+    tools_file.write_text("shout\n")
+    assert len(await server._get_upstream_tools()) == 1
+    await server._invalidate_upstream_tools("alpha")
+    assert len(await server._get_upstream_tools()) == 2
+
+    # A newly connected server
+    await register_mock(manager, "beta")
+    await server._invalidate_upstream_tools("beta")
+    assert len(await server._get_upstream_tools()) == 3
+
+    # A disconnected server
+    await manager.unregister_server("alpha")
+    await server._invalidate_upstream_tools("alpha")
+    assert len(await server._get_upstream_tools()) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
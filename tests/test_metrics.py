@@ -0,0 +1,268 @@
+"""Tests for the metrics collector."""
+
+import asyncio
+import random
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.skillflow import metrics
+from src.skillflow.metrics import MetricPoint, MetricsCollector, MetricsTimer, MetricType
+from src.skillflow.storage import StorageLayer
+
+
+@pytest.fixture
+def collector():
+    """Create a metrics collector backed by a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield MetricsCollector(StorageLayer(tmpdir))
+
+
+@pytest.mark.parametrize("backend", ["numpy", "python"])
+def test_summarize_matches_builtins(monkeypatch, backend):
+    """Test min/max/avg on each buffer backend."""
+    if backend == "numpy" and not metrics.NUMPY_AVAILABLE:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(metrics, "NUMPY_AVAILABLE", backend == "numpy")
+
+    rng = random.Random(1)
+    for n in (1, 2, 500):
+        values = [rng.uniform(-50, 50) for _ in range(n)]
+        buf = metrics._float_buffer(n)
+        buf[:] = metrics.array("d", values) if backend == "python" else values
+
+        minimum, maximum, avg = metrics._summarize(buf)
+        assert minimum == min(values)
+        assert maximum == max(values)
+        assert avg == pytest.approx(sum(values) / n)
+
+
+def test_p2_quantile_tracks_distribution():
+    """Test that the streaming estimate converges on the true quantile."""
+    rng = random.Random(1)
+    values = [rng.expovariate(1 / 50) for _ in range(20000)]
+    ordered = sorted(values)
+
+    for p in (0.5, 0.95, 0.99):
+        estimator = metrics._P2Quantile(p)
+        for value in values:
+            estimator.add(value)
+        exact = ordered[int(len(ordered) * p)]
+        assert estimator.value == pytest.approx(exact, rel=0.05)
+
+    small = metrics._P2Quantile(0.5)
+    assert small.value is None
+    for value in (3.0, 1.0, 2.0):
+        small.add(value)
+    assert small.value == 2.0
+
+
+def test_collect_once_records_percentile_gauges(collector):
+    """Test that a collection round publishes execution percentiles."""
+    for duration in range(1, 101):
+        collector.execution_started()
+        collector.execution_completed(float(duration), success=duration % 10 != 0)
+
+    collector._collect_once()
+    gauges = collector.get_current_metrics()["gauges"]
+
+    assert gauges[MetricType.P50_EXECUTION_TIME] == pytest.approx(51.0, rel=0.05)
+    assert gauges[MetricType.P95_EXECUTION_TIME] == pytest.approx(96.0, rel=0.05)
+    assert gauges[MetricType.P99_EXECUTION_TIME] == pytest.approx(100.0, rel=0.05)
+    assert gauges[MetricType.THROUGHPUT_PER_MINUTE] == 100
+    assert gauges[MetricType.ERROR_RATE_PERCENT] == 10.0
+
+
+def test_throughput_counts_last_minute(collector, monkeypatch):
+    """Test that throughput only counts executions from the last minute."""
+    now = [1000.0]
+    monkeypatch.setattr(metrics.time, "monotonic", lambda: now[0])
+
+    for _ in range(3):
+        collector.execution_started()
+    now[0] += 45.0
+    collector.execution_started()
+
+    collector._collect_once()
+    assert collector._gauges[MetricType.THROUGHPUT_PER_MINUTE] == 4
+
+    now[0] += 30.0
+    collector._collect_once()
+    assert collector._gauges[MetricType.THROUGHPUT_PER_MINUTE] == 1
+    assert len(collector._exec_timestamps) == 1
+
+
+def test_metric_history_and_summary(collector):
+    """Test reading recorded samples back as MetricPoints and summaries."""
+    for i in range(5):
+        collector.record_timing(MetricType.TOOL_CALL_TIME, float(i), tags={"tool": "t"})
+
+    history = collector.get_metric_history(MetricType.TOOL_CALL_TIME, limit=3)
+    assert [p.value for p in history] == [4.0, 3.0, 2.0]
+    assert all(isinstance(p, MetricPoint) for p in history)
+    assert history[0].tags == {"tool": "t"}
+    assert history[0].as_datetime.tzinfo is not None
+    assert history[0].model_dump()["timestamp"] == history[0].as_datetime.isoformat()
+
+    future = datetime.now(timezone.utc) + timedelta(minutes=1)
+    assert collector.get_metric_history(MetricType.TOOL_CALL_TIME, start_time=future) == []
+
+    summary = collector.get_metric_summary(MetricType.TOOL_CALL_TIME)
+    assert summary["count"] == 5
+    assert (summary["min"], summary["max"], summary["avg"], summary["latest"]) == (0.0, 4.0, 2.0, 4.0)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_series_ring_wraps_and_filters(monkeypatch, use_numpy):
+    """Test that a series keeps the newest samples in time order."""
+    if use_numpy and not metrics.NUMPY_AVAILABLE:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(metrics, "NUMPY_AVAILABLE", use_numpy)
+
+    series = metrics._Series(capacity=40)
+    for i in range(100):
+        series.append(float(i), float(i * 10), (("n", str(i)),))
+
+    ts, values, tags = series.window()
+    assert list(ts) == [float(i) for i in range(60, 100)]
+    assert list(values) == [float(i * 10) for i in range(60, 100)]
+    assert tags[0] == (("n", "60"),)
+
+    ts, values, tags = series.window(start_ts=70.0, end_ts=72.0)
+    assert list(ts) == [70.0, 71.0, 72.0]
+    assert list(values) == [700.0, 710.0, 720.0]
+    assert [t[0][1] for t in tags] == ["70", "71", "72"]
+
+    # Ranges spanning the wrap-around point, with and without a limit
+    series.append(100.0, 1000.0, ())
+    ts, _, _ = series.window(start_ts=95.5)
+    assert list(ts) == [96.0, 97.0, 98.0, 99.0, 100.0]
+    ts, _, tags = series.window(limit=3)
+    assert list(ts) == [98.0, 99.0, 100.0]
+    assert len(tags) == 3
+    ts, _, _ = series.window(start_ts=200.0)
+    assert list(ts) == []
+
+
+def test_prometheus_export_tracks_changes(collector):
+    """Test that the Prometheus export reflects updates since the last scrape."""
+    collector.record_counter(MetricType.TOOL_CALLS)
+    collector.record_gauge(MetricType.ACTIVE_CONNECTIONS, 2)
+
+    text = collector.export_metrics_prometheus()
+    assert text == (
+        "# TYPE tool_calls_total counter\ntool_calls_total 1.0\n"
+        "# TYPE active_connections gauge\nactive_connections 2\n"
+    )
+    assert collector.export_metrics_prometheus() is text
+
+    collector.record_counter(MetricType.TOOL_CALLS, 2)
+    assert "tool_calls_total 3.0\n" in collector.export_metrics_prometheus()
+
+
+def test_prometheus_export_is_sorted(collector):
+    """Test that the Prometheus export lists metrics in name order."""
+    for name in ("zeta_total", "alpha_total", "mid_total"):
+        collector.record_counter(name)
+    collector.record_gauge("z_gauge", 1)
+    collector.record_gauge("a_gauge", 1)
+
+    names = [
+        line.split()[2]
+        for line in collector.export_metrics_prometheus().splitlines()
+        if line.startswith("# TYPE")
+    ]
+    assert names == ["alpha_total", "mid_total", "zeta_total", "a_gauge", "z_gauge"]
+
+
+def test_recorded_samples_applied_on_read(collector):
+    """Test that queued samples are applied in one batch before reads."""
+    collector.record_counter(MetricType.SKILL_EXECUTIONS)
+    collector.record_counter(MetricType.SKILL_EXECUTIONS)
+    collector.record_timing(MetricType.SKILL_EXECUTION_TIME, 12.0)
+    assert len(collector._pending) == 3
+
+    current = collector.get_current_metrics()
+    assert not collector._pending
+    assert current["counters"][MetricType.SKILL_EXECUTIONS] == 2.0
+    assert collector._p50.value == 12.0
+
+
+def test_tags_are_interned(collector):
+    """Test that equal tag dicts share one stored tuple."""
+    collector.record_counter(MetricType.TOOL_CALLS, tags={"tool": "a", "server": "s"})
+    collector.record_counter(MetricType.TOOL_CALLS, tags={"server": "s", "tool": "a"})
+    collector.get_current_metrics()
+
+    _, _, tags = collector._metrics[MetricType.TOOL_CALLS].window()
+    assert tags[0] is tags[1]
+    assert tags[0] == (("server", "s"), ("tool", "a"))
+
+
+def test_execution_concurrency_tracking(collector):
+    """Test active and peak execution counts."""
+    for _ in range(3):
+        collector.execution_started()
+    collector.execution_completed(5.0)
+    collector.execution_started()
+    for _ in range(5):
+        collector.execution_completed(5.0)
+
+    current = collector.get_current_metrics()
+    assert current["active_executions"] == 0
+    assert current["max_concurrent_executions"] == 3
+
+
+def test_metrics_timer_records_duration(collector):
+    """Test that the timer records a non-negative duration without tags."""
+    with MetricsTimer(collector, MetricType.TOOL_CALL_TIME) as timer:
+        pass
+    assert timer.tags is None
+
+    history = collector.get_metric_history(MetricType.TOOL_CALL_TIME)
+    assert len(history) == 1
+    assert history[0].value >= 0.0
+    assert history[0].tags == {}
+
+
+def test_untagged_execution_counters_skip_history(collector):
+    """Test that execution counters keep totals but no per-call history."""
+    collector.execution_started()
+    collector.execution_completed(3.0)
+    collector.record_counter(MetricType.SKILL_FAILURES, tags={"skill": "s"})
+
+    counters = collector.get_current_metrics()["counters"]
+    assert counters[MetricType.SKILL_EXECUTIONS] == 1.0
+    assert counters[MetricType.SKILL_SUCCESSES] == 1.0
+    assert collector.get_metric_history(MetricType.SKILL_EXECUTIONS) == []
+    assert collector.get_metric_history(MetricType.SKILL_SUCCESSES) == []
+    assert len(collector.get_metric_history(MetricType.SKILL_FAILURES)) == 1
+
+
+async def test_samples_in_one_tick_share_timestamp(collector):
+    """Test that a burst is drained on the next loop iteration as one batch."""
+    for i in range(3):
+        collector.record_gauge(MetricType.ACTIVE_CONNECTIONS, i)
+    assert len(collector._pending) == 3
+
+    await asyncio.sleep(0)
+    assert not collector._pending
+    ts, values, _ = collector._metrics[MetricType.ACTIVE_CONNECTIONS].window()
+    assert list(values) == [0.0, 1.0, 2.0]
+    assert len(set(ts)) == 1
+
+
+def test_points_sharing_timestamp_reuse_iso_string(collector):
+    """Test that a drained batch formats its shared timestamp once."""
+    for i in range(3):
+        collector.record_gauge(MetricType.ACTIVE_CONNECTIONS, i)
+    history = collector.get_metric_history(MetricType.ACTIVE_CONNECTIONS)
+
+    dumped = [p.model_dump()["timestamp"] for p in history]
+    assert dumped[0] == history[0].as_datetime.isoformat()
+    assert dumped[0] is dumped[1] is dumped[2]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
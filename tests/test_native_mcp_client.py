@@ -0,0 +1,307 @@
+"""Tests for the native stdio MCP client."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.skillflow.native_mcp_client import (
+    _ERROR_FRAME,
+    _MAX_IN_FLIGHT,
+    _MAX_QUEUED_FRAMES,
+    _NOTIFICATION_FRAME,
+    _REQUEST_FRAME,
+    _RESULT_FRAME,
+    MCPBackpressureError,
+    MCPClientError,
+    MCPTimeoutError,
+    NativeMCPClient,
+    _encode,
+    _loads,
+)
+
+MOCK_SERVER = str(Path(__file__).parent / "mock_mcp_server.py")
+
+
+@pytest.fixture
+async def client():
+    """Start a native client against the mock server."""
+    client = NativeMCPClient("mock", sys.executable, [MOCK_SERVER], timeout=10.0)
+    await client.start()
+    yield client
+    await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_coalesced(client):
+    """Test that a burst of requests reaches stdin in fewer writes."""
+    stdin = client.process.stdin
+    writes = []
+    original_writelines = stdin.writelines
+
+    def counting_writelines(frames):
+        writes.append(b"".join(frames))
+        original_writelines(frames)
+
+    stdin.writelines = counting_writelines
+
+    results = await asyncio.gather(
+        *(client.call_tool("echo", {"text": str(i)}) for i in range(10))
+    )
+
+    assert [r["content"][0]["text"] for r in results] == [str(i) for i in range(10)]
+    assert len(writes) < 10
+    assert b"".join(writes).count(b"\n") == 10
+
+
+def test_frames_are_valid_json_lines():
+    """Test that envelope templates produce one JSON-RPC message per line."""
+    params = {"text": "h\u00e9\nllo"}
+    frames = [
+        _REQUEST_FRAME % (7, _encode("tools/call"), _encode(params)),
+        _NOTIFICATION_FRAME % (_encode("notifications/initialized"), _encode({})),
+        _RESULT_FRAME % (_encode("abc"), _encode({"roots": []})),
+        _ERROR_FRAME % (_encode(3), _encode({"code": -32603, "message": "boom"})),
+    ]
+
+    for frame in frames:
+        assert frame.endswith(b"\n") and frame.count(b"\n") == 1
+    assert [_loads(frame) for frame in frames] == [
+        {"jsonrpc": "2.0", "id": 7, "method": "tools/call", "params": params},
+        {"jsonrpc": "2.0", "method": "notifications/initialized", "params": {}},
+        {"jsonrpc": "2.0", "id": "abc", "result": {"roots": []}},
+        {"jsonrpc": "2.0", "id": 3, "error": {"code": -32603, "message": "boom"}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_large_response_spanning_reads(client):
+    """Test that a message larger than one read is reassembled."""
+    text = "x" * 300_000
+    result = await client.call_tool("echo", {"text": text})
+    assert result["content"][0]["text"] == text
+
+    result = await client.call_tool("echo", {"text": "after"})
+    assert result["content"][0]["text"] == "after"
+
+
+
+@pytest.mark.asyncio
+async def test_request_times_out(client, monkeypatch):
+    """Test that an unanswered request fails with MCPTimeoutError."""
+    async def drop_message(self, message):
+        pass
+
+    monkeypatch.setattr(NativeMCPClient, "_handle_message", drop_message)
+    client.timeout = 0.2
+
+    with pytest.raises(MCPTimeoutError, match="tools/list"):
+        await client.list_tools()
+    assert not client._pending_requests
+
+
+@pytest.mark.asyncio
+async def test_handshake_discovers_declared_capabilities(monkeypatch):
+    """Test that discovery requests go out together, empty capabilities included."""
+    client = NativeMCPClient("mock", sys.executable, [MOCK_SERVER], timeout=10.0)
+    sent = []
+    original_send = client._send_request
+
+    async def recording_send(self, method, params=None):
+        sent.append(method)
+        return await original_send(method, params)
+
+    monkeypatch.setattr(NativeMCPClient, "_send_request", recording_send)
+    await client.start()
+    try:
+        assert sent[0] == "initialize"
+        assert sorted(sent[1:]) == sorted(
+            ["tools/list", "prompts/list", "resources/list", "resources/templates/list"]
+        )
+        assert [tool["name"] for tool in client.tools] == ["echo"]
+    finally:
+        await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_stderr_is_logged_per_line(caplog):
+    """Test that each stderr line becomes its own warning."""
+    script = (
+        "import sys, time; sys.stderr.write('first\\nsecond\\n'); sys.stderr.flush(); "
+        "time.sleep(0.2); input()"
+    )
+    client = NativeMCPClient("noisy", sys.executable, ["-c", script], timeout=1.0)
+    with caplog.at_level("WARNING", logger="src.skillflow.native_mcp_client"):
+        with pytest.raises(MCPClientError):
+            await client.start()
+
+    lines = [r.getMessage() for r in caplog.records if "stderr:" in r.getMessage()]
+    assert lines == ["[noisy] stderr: first", "[noisy] stderr: second"]
+
+
+@pytest.mark.asyncio
+async def test_roots_list_response(client):
+    """Test answering a server's roots/list request."""
+    client._out_queue = asyncio.Queue()  # Detach from the writer task
+    client.set_roots(["/home/user/project", "file:///tmp/data"])
+
+    await client._handle_message({"jsonrpc": "2.0", "id": "r1", "method": "roots/list"})
+
+    assert _loads(client._out_queue.get_nowait()) == {
+        "jsonrpc": "2.0",
+        "id": "r1",
+        "result": {"roots": [
+            {"uri": "file:///home/user/project", "name": "project"},
+            {"uri": "file:///tmp/data", "name": "data"},
+        ]},
+    }
+
+
+@pytest.mark.asyncio
+async def test_custom_env_extends_inherited_env(monkeypatch, caplog):
+    """Test that custom variables are added on top of the parent environment."""
+    monkeypatch.setenv("SKILLFLOW_TEST_INHERITED", "parent")
+    script = (
+        "import os, sys, time; sys.stderr.write(os.environ['SKILLFLOW_TEST_INHERITED'] + "
+        "'-' + os.environ['SKILLFLOW_TEST_CUSTOM'] + '\\n'); sys.stderr.flush(); time.sleep(0.2)"
+    )
+    client = NativeMCPClient(
+        "env", sys.executable, ["-c", script], env={"SKILLFLOW_TEST_CUSTOM": "child"}
+    )
+    with caplog.at_level("WARNING", logger="src.skillflow.native_mcp_client"):
+        with pytest.raises(MCPClientError):
+            await client.start()
+
+    assert "[env] stderr: parent-child" in [r.getMessage() for r in caplog.records]
+
+
+@pytest.mark.asyncio
+async def test_server_request_reusing_pending_id_is_not_a_response(client, monkeypatch):
+    """Test that a server request is dispatched even if its id matches ours."""
+    handled = []
+
+    async def capture_request(self, method, params, request_id):
+        handled.append((method, params, request_id))
+
+    monkeypatch.setattr(NativeMCPClient, "_handle_server_request", capture_request)
+    future = client._loop.create_future()
+    client._pending_requests[42] = future
+
+    await client._handle_message({"jsonrpc": "2.0", "id": 42, "method": "roots/list"})
+
+    assert handled == [("roots/list", {}, 42)]
+    assert not future.done()
+    client._pending_requests.pop(42)
+
+
+@pytest.mark.asyncio
+async def test_long_stderr_line_does_not_stop_logging(caplog):
+    """Test that stderr lines past the old 64 KiB reader limit are logged."""
+    script = (
+        "import sys, time; sys.stderr.write('e' * 100000 + '\\ndone\\n'); sys.stderr.flush(); "
+        "time.sleep(0.2)"
+    )
+    client = NativeMCPClient("long", sys.executable, ["-c", script], timeout=1.0)
+    with caplog.at_level("WARNING", logger="src.skillflow.native_mcp_client"):
+        with pytest.raises(MCPClientError):
+            await client.start()
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert "[long] stderr: " + "e" * 100000 in messages
+    assert "[long] stderr: done" in messages
+
+
+@pytest.mark.asyncio
+async def test_shared_timer_expires_only_overdue_requests(client, monkeypatch):
+    """Test that one timer expires overdue requests and spares answered ones."""
+    dropped = []
+    original_handle = client._handle_message
+
+    async def drop_list_replies(self, message):
+        if "tools" in message.get("result", {}):
+            dropped.append(message["id"])
+            return
+        await original_handle(message)
+
+    monkeypatch.setattr(NativeMCPClient, "_handle_message", drop_list_replies)
+    client.timeout = 0.3
+
+    results = await asyncio.gather(
+        client.list_tools(),
+        client.call_tool("echo", {"text": "ok"}),
+        client.list_tools(),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], MCPTimeoutError)
+    assert results[1]["content"][0]["text"] == "ok"
+    assert isinstance(results[2], MCPTimeoutError)
+    assert len(dropped) == 2
+    assert not client._pending_requests
+    assert client._timeout_handle is None and not client._deadlines
+
+
+@pytest.mark.asyncio
+async def test_filtered_notifications_are_not_formatted(client, caplog):
+    """Test that suppressed notification logs never render their params."""
+    class Unrenderable:
+        def __repr__(self):
+            raise AssertionError("params were formatted")
+
+    with caplog.at_level("WARNING", logger="src.skillflow.native_mcp_client"):
+        await client._handle_notification("notifications/progress", {"data": Unrenderable()})
+        await client._handle_notification("notifications/message", {"data": Unrenderable()})
+
+    with caplog.at_level("INFO", logger="src.skillflow.native_mcp_client"):
+        await client._handle_notification(
+            "notifications/message", {"level": "warning", "logger": "db", "data": "slow"}
+        )
+    assert "[mock] WARNING [db] slow" in [r.getMessage() for r in caplog.records]
+
+
+def test_client_has_no_instance_dict():
+    """Test that client state lives in slots."""
+    client = NativeMCPClient("mock", sys.executable, [MOCK_SERVER])
+    assert not hasattr(client, "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_sampling_and_unknown_server_requests(client):
+    """Test dispatching sampling requests and rejecting unknown methods."""
+    client._out_queue = asyncio.Queue()  # Detach from the writer task
+
+    async def sampler(params):
+        return f"echo: {params['prompt']}"
+
+    await client._handle_message(
+        {"jsonrpc": "2.0", "id": 1, "method": "sampling/createMessage", "params": {"prompt": "hi"}}
+    )
+    client.set_sampling_handler(sampler)
+    await client._handle_message(
+        {"jsonrpc": "2.0", "id": 2, "method": "sampling/createMessage", "params": {"prompt": "hi"}}
+    )
+    await client._handle_message({"jsonrpc": "2.0", "id": 3, "method": "elicit/unknown"})
+
+    replies = [_loads(client._out_queue.get_nowait()) for _ in range(3)]
+    assert replies[0]["error"]["code"] == -32603
+    assert replies[1]["result"] == {
+        "role": "assistant", "content": {"type": "text", "text": "echo: hi"}
+    }
+    assert "Unknown server request method" in replies[2]["error"]["message"]
+
+
+@pytest.mark.asyncio
+async def test_in_flight_requests_are_capped(client):
+    """Test that new requests fail fast once the in-flight cap is reached."""
+    assert client._out_queue.maxsize == _MAX_QUEUED_FRAMES
+    placeholders = {-i - 1: client._loop.create_future() for i in range(_MAX_IN_FLIGHT)}
+    client._pending_requests.update(placeholders)
+
+    with pytest.raises(MCPBackpressureError, match="Too many in-flight requests"):
+        await client.call_tool("echo", {"text": "x"})
+
+    for key in placeholders:
+        client._pending_requests.pop(key)
+    result = await client.call_tool("echo", {"text": "x"})
+    assert result["content"][0]["text"] == "x"
@@ -0,0 +1,165 @@
+"""Tests for parameter transformation and condition evaluation."""
+
+import jsonpath_ng
+import pytest
+
+from src.skillflow.parameter_transform import (
+    ParameterTransformer,
+    ParameterTransformError,
+    _compile_template,
+    _condition_source,
+    _parse_jsonpath,
+    _simple_path_keys,
+    transform_parameter,
+)
+
+
+@pytest.fixture
+def transformer():
+    """Create a fresh transformer."""
+    return ParameterTransformer()
+
+
+def test_jinja2_templates_are_compiled_once(transformer, monkeypatch):
+    """Test that repeated renders of one expression reuse the template."""
+    _compile_template.cache_clear()
+    compiled = []
+    original_from_string = transformer.jinja_env.from_string
+
+    def counting_from_string(source):
+        compiled.append(source)
+        return original_from_string(source)
+
+    monkeypatch.setattr(transformer.jinja_env, "from_string", counting_from_string)
+
+    for n in range(3):
+        assert transformer.transform(n, "jinja2", "{{ value * 2 }}") == str(n * 2)
+
+    assert compiled == ["{{ value * 2 }}"]
+    assert _compile_template.cache_info().maxsize == 512
+
+
+def test_jinja2_json_output_is_parsed(transformer):
+    """Test that JSON-looking output is returned as data."""
+    result = transformer.transform({"a": 1}, "jinja2", '{"b": {{ value.a }}}')
+    assert result == {"b": 1}
+
+
+def test_jinja2_syntax_error(transformer):
+    """Test that template errors surface as ParameterTransformError."""
+    with pytest.raises(ParameterTransformError):
+        transformer.transform(1, "jinja2", "{{ value ")
+
+
+def test_jsonpath_expressions_are_parsed_once(transformer):
+    """Test that repeated JSONPath queries reuse the parsed expression."""
+    _parse_jsonpath.cache_clear()
+    data = {"items": [{"id": 1}, {"id": 2}]}
+
+    for _ in range(3):
+        assert transformer.transform(data, "jsonpath", "$.items[*].id") == [1, 2]
+    assert transformer.evaluate_condition("$.items[0].id", data) is True
+
+    info = _parse_jsonpath.cache_info()
+    assert info.misses == 2
+    assert info.hits == 2
+
+
+def test_python_conditions_resolve_names_from_context(transformer):
+    """Test Python-like conditions against the evaluation context."""
+    context = {
+        "inputs": {"count": 3, "mode": "fast"},
+        "outputs": {"step": {"status": "ok"}},
+        "status_code": 200,
+        "status": "done",
+    }
+
+    assert transformer.evaluate_condition("inputs['count'] > 2", context) is True
+    assert transformer.evaluate_condition(
+        "outputs['step']['status'] == 'ok' and inputs['mode'] in ('fast', 'eager')", context
+    ) is True
+    # Overlapping names used to be mangled by substring replacement
+    assert transformer.evaluate_condition("status_code == 200 and status == 'done'", context)
+    assert transformer.evaluate_condition("not inputs['count'] - 3", context) is True
+    assert transformer.evaluate_condition("len(inputs) > 1 and max(1, inputs['count']) == 3", context)
+    assert transformer.evaluate_condition("int(str(status_code)[:1]) == 2", context)
+
+
+@pytest.mark.parametrize(
+    "condition",
+    [
+        "__import__('os').system('true')",
+        "getattr(inputs, 'keys')",
+        "inputs.keys()",
+        "len(inputs, key=1)",
+        "inputs.__class__",
+        "[x for x in inputs]",
+        "missing_name == 1",
+        "inputs[",
+    ],
+)
+def test_unsafe_or_invalid_conditions_are_rejected(transformer, condition):
+    """Test that conditions outside the allowed subset raise errors."""
+    with pytest.raises(ParameterTransformError):
+        transformer.evaluate_condition(condition, {"inputs": {}})
+
+
+def test_transform_parameter_engine_dispatch():
+    """Test pass-through, engine dispatch and unknown engines."""
+    value = {"a": [1, 2]}
+    assert transform_parameter(value) is value
+    assert transform_parameter(value, "jsonpath") is value
+    assert transform_parameter(value, "jsonpath", "$.a[1]") == 2
+    with pytest.raises(ParameterTransformError, match="Unknown transformation engine"):
+        transform_parameter(value, "xpath", "/a")
+
+
+def test_condition_kinds(transformer):
+    """Test Jinja2, JSONPath and Python conditions are told apart."""
+    context = {"inputs": {"count": 3, "tags": []}}
+
+    assert transformer.evaluate_condition("{{ inputs.count > 2 }}", context) is True
+    assert transformer.evaluate_condition("{{ inputs.count > 5 }}", context) is False
+    assert transformer.evaluate_condition(
+        "{% if inputs.tags %}true{% else %}false{% endif %}", context
+    ) is False
+    assert transformer.evaluate_condition("{{ inputs.count }} == 3", context) is False
+    assert transformer.evaluate_condition("$.inputs.count", context) is True
+    assert transformer.evaluate_condition("inputs['count'] == 3", context) is True
+    assert _condition_source("{{ inputs.count > 2 }}") == (
+        "{% if inputs.count > 2 %}true{% else %}false{% endif %}"
+    )
+
+
+def test_jinja2_parse_json_can_be_disabled(transformer):
+    """Test that callers wanting a string get the rendered text."""
+    expression = "[{{ value }}, {{ value + 1 }}]"
+    assert transform_parameter(1, "jinja2", expression) == [1, 2]
+    assert transform_parameter(1, "jinja2", expression, parse_json=False) == "[1, 2]"
+    assert transformer.transform(1, "jinja2", "[not json") == "[not json"
+
+
+def test_transformers_share_one_jinja2_environment(transformer):
+    """Test that the Jinja2 environment is created once per process."""
+    assert transformer.jinja_env is ParameterTransformer().jinja_env
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["$", "$.a", "$.a.b", "$.a.items", "$.a.missing", "$.a.b.c", "$.n", "$.list"],
+)
+def test_simple_paths_match_jsonpath_engine(transformer, expression):
+    """Test that the dotted-path fast path agrees with jsonpath-ng."""
+    data = {"a": {"b": 1, "items": [1, 2]}, "n": None, "list": [{"x": 1}]}
+
+    expected = jsonpath_ng.parse(expression).find(data)
+    expected = expected[0].value if len(expected) == 1 else None
+
+    assert _simple_path_keys(expression) is not None
+    assert transformer.transform(data, "jsonpath", expression) == expected
+
+
+def test_bracket_paths_use_jsonpath_engine(transformer):
+    """Test that non-trivial paths fall back to the full engine."""
+    assert _simple_path_keys("$.list[0].x") is None
+    assert transformer.transform({"list": [{"x": 1}]}, "jsonpath", "$.list[0].x") == 1
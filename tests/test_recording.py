@@ -0,0 +1,187 @@
+"""Tests for recording sessions and skill draft generation."""
+
+import re
+import tempfile
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from src.skillflow.recording import RecordingManager
+from src.skillflow.schemas import (
+    ExposeParamSpec,
+    RecordingContext,
+    SkillDraft,
+    StepSelection,
+)
+from src.skillflow.storage import SessionNotFoundError, StorageLayer
+
+
+@pytest.fixture
+async def manager():
+    """Create a recording manager over temporary storage."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = StorageLayer(tmpdir)
+        await storage.initialize()
+        yield RecordingManager(storage)
+
+
+async def _record_session(manager, count):
+    """Record and stop a session with ``count`` echo calls."""
+    session_id = await manager.start_session(RecordingContext(client_id="test"))
+    for i in range(count):
+        await manager.record_tool_call(session_id, "srv", "echo", {"text": f"t{i}"})
+    return await manager.stop_session(session_id)
+
+
+@pytest.mark.asyncio
+async def test_select_logs(manager):
+    """Test index and range selection of session logs."""
+    session = await _record_session(manager, 50)
+
+    def select(**kwargs):
+        selection = StepSelection(session_id=session.id, **kwargs)
+        return [log.index for log in manager._select_logs(session, selection)]
+
+    assert select(indices=[3, 1, 3, 99, 0]) == [3, 1, 3]
+    assert select(indices=[7]) == [7]
+    assert select(indices=[]) == []
+    assert select(indices=list(range(50, 0, -1))) == list(range(50, 0, -1))
+    assert select(start_index=48) == [48, 49, 50]
+    assert select(start_index=-5, end_index=2) == [1, 2]
+    assert select(end_index=500) == list(range(1, 51))
+
+
+@pytest.mark.asyncio
+async def test_expose_params_template_node_args(manager):
+    """Test that exposed parameters replace the referenced node args."""
+    session = await _record_session(manager, 3)
+    params = [
+        ExposeParamSpec(name="first", description="", schema={"type": "string"},
+                        source_path="logs[1].args.text"),
+        ExposeParamSpec(name="third", description="", schema={"type": "string"},
+                        source_path="logs[3].args.text.nested"),
+        ExposeParamSpec(name="missing", description="", schema={"type": "string"},
+                        source_path="logs[9].args.text"),
+        ExposeParamSpec(name="bad", description="", schema={"type": "string"},
+                        source_path="$.logs[2].text"),
+    ]
+
+    draft = await manager.to_skill_draft(
+        session.id, "skill", "Skill", "desc", expose_params=params
+    )
+
+    args = [node.args_template for node in draft.graph.nodes]
+    assert args == [{"text": "$inputs.first"}, {"text": "t1"}, {"text": "$inputs.third"}]
+
+
+@pytest.mark.asyncio
+async def test_draft_graph_is_linear_and_round_trips(manager):
+    """Test the generated graph shape and that it survives validation."""
+    session = await _record_session(manager, 3)
+
+    draft = await manager.to_skill_draft(session.id, "skill", "Skill", "desc")
+
+    graph = draft.graph
+    assert [node.id for node in graph.nodes] == ["step_1", "step_2", "step_3"]
+    assert [(e.from_node, e.to_node) for e in graph.edges] == [
+        ("step_1", "step_2"), ("step_2", "step_3")
+    ]
+    assert SkillDraft.model_validate_json(draft.model_dump_json(by_alias=True)) == draft
+
+
+@pytest.mark.asyncio
+async def test_recorded_logs_are_immutable(manager):
+    """Test that recorded log entries cannot be reassigned."""
+    session = await _record_session(manager, 1)
+
+    with pytest.raises(ValidationError):
+        session.logs[0].tool = "other"
+
+
+@pytest.mark.asyncio
+async def test_record_tool_call_indices_and_timestamps(manager):
+    """Test sequential log indices and caller-provided timestamps."""
+    session_id = await manager.start_session(RecordingContext(client_id="test"))
+    when = datetime(2024, 1, 2, 3, 4, 5)
+    await manager.record_tool_call(session_id, "srv", "a", {}, timestamp=when)
+    await manager.record_tool_call(session_id, "srv", "b", {})
+    session = await manager.stop_session(session_id)
+
+    assert [log.index for log in session.logs] == [1, 2]
+    assert session.logs[0].timestamp == when
+    assert session.logs[1].timestamp >= session.started_at
+
+
+@pytest.mark.asyncio
+async def test_stop_session_ends_recording_before_save(manager, monkeypatch):
+    """Test that calls recorded while saving are dropped, and failed saves roll back."""
+    session_id = await manager.start_session(RecordingContext(client_id="test"))
+    await manager.record_tool_call(session_id, "srv", "a", {})
+    original_save = manager.storage.save_session
+
+    async def failing_save(session):
+        await manager.record_tool_call(session_id, "srv", "late", {})
+        raise OSError("disk full")
+
+    monkeypatch.setattr(manager.storage, "save_session", failing_save)
+    with pytest.raises(OSError):
+        await manager.stop_session(session_id)
+    assert await manager.list_active_sessions() == [session_id]
+
+    monkeypatch.setattr(manager.storage, "save_session", original_save)
+    session = await manager.stop_session(session_id)
+    assert [log.tool for log in session.logs] == ["a"]
+    assert session.ended_at is not None
+    with pytest.raises(SessionNotFoundError):
+        await manager.stop_session(session_id)
+
+
+def test_build_inputs_schema_required_params(manager):
+    """Test that only params whose schema allows null are optional."""
+    def spec(name, schema):
+        return ExposeParamSpec(name=name, description="", schema=schema, source_path="")
+
+    schema = manager._build_inputs_schema([
+        spec("text", {"type": "string"}),
+        spec("maybe", {"type": ["string", "null"]}),
+        spec("none", {"type": "null"}),
+        spec("any", {}),
+    ])
+
+    assert list(schema["properties"]) == ["text", "maybe", "none", "any"]
+    assert schema["required"] == ["text", "any"]
+    assert manager._build_inputs_schema([]) == {
+        "type": "object", "properties": {}, "required": []
+    }
+
+
+@pytest.mark.asyncio
+async def test_draft_templating_leaves_session_logs_untouched(manager, monkeypatch):
+    """Test that templated args are copied and untargeted args are shared."""
+    session = await _record_session(manager, 2)
+
+    async def load_same_session(session_id):
+        return session
+
+    monkeypatch.setattr(manager.storage, "load_session", load_same_session)
+    params = [
+        ExposeParamSpec(name="text", description="", schema={"type": "string"},
+                        source_path="logs[2].args.text"),
+    ]
+
+    draft = await manager.to_skill_draft(session.id, "s", "S", "d", expose_params=params)
+
+    assert [log.args for log in session.logs] == [{"text": "t0"}, {"text": "t1"}]
+    assert draft.graph.nodes[0].args_template is session.logs[0].args
+    assert draft.graph.nodes[1].args_template == {"text": "$inputs.text"}
+
+
+@pytest.mark.asyncio
+async def test_session_ids_are_unique_and_timestamped(manager):
+    """Test the session id format and uniqueness."""
+    ids = {await manager.start_session(RecordingContext(client_id="test")) for _ in range(20)}
+
+    assert len(ids) == 20
+    for session_id in ids:
+        assert re.fullmatch(r"session_\d{4}-\d{2}-\d{2}T\d{2}-\d{2}-\d{2}_[0-9a-f]{8}", session_id)
@@ -15,6 +15,10 @@ from src.skillflow.schemas import (
     NodeKind,
     Concurrency,
     RecordingSession,
+    NodeExecution,
+    NodeStatus,
+    ToolCallLog,
+    ToolCallStatus,
 )
 from src.skillflow.storage import StorageLayer
 
@@ -107,3 +111,55 @@ async def test_save_and_load_session(storage):
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+@pytest.mark.asyncio
+async def test_session_round_trip_preserves_logs(storage):
+    """Test that saved session JSON loads back into an equal session."""
+    session = RecordingSession(
+        id="session_logs",
+        started_at=datetime(2024, 1, 1, 12, 0, 0),
+        client_id="client",
+        logs=[
+            ToolCallLog(
+                index=1,
+                timestamp=datetime(2024, 1, 1, 12, 0, 1),
+                server="srv",
+                tool="echo",
+                args={"text": "héllo"},
+                duration_ms=1.5,
+                status=ToolCallStatus.SUCCESS,
+            )
+        ],
+    )
+
+    await storage.save_session(session)
+
+    assert await storage.load_session("session_logs") == session
+    content = storage._get_session_path("session_logs").read_text(encoding="utf-8")
+    assert "héllo" in content
+
+
+@pytest.mark.asyncio
+async def test_run_log_round_trip(storage):
+    """Test appending node executions and loading the run log back."""
+    executions = [
+        NodeExecution(
+            run_id="run_1",
+            skill_id="skill",
+            version=1,
+            node_id=f"step_{i}",
+            status=NodeStatus.SUCCESS,
+            started_at=datetime(2024, 1, 1, 12, 0, i),
+            tool="echo",
+            args_resolved={"text": str(i)},
+            output={"ok": True},
+        )
+        for i in range(3)
+    ]
+
+    for execution in executions:
+        await storage.append_run_log("run_1", execution)
+
+    assert await storage.load_run_log("run_1") == executions
+    assert await storage.load_run_log("missing") == []